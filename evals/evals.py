@@ -1,7 +1,7 @@
 """
 Lightweight evaluation framework for comparing strategy outputs against ground truth using async execution and pluggable scoring functions. This module provides the core infrastructure for running LLM strategies with different configurations, collecting their outputs, and scoring them via custom evaluation functions in parallel.
 
-The framework orchestrates a three-stage pipeline: `run()` executes a single strategy with a given input and config, producing a `RunResult` that captures identity, configuration, and output metadata; `generate_runs()` creates the full combinatorial matrix of inputs×configs and executes them concurrently; and `evaluate()` applies a scoring function to each run result, returning normalized `EvalResult` objects. Strategy functions and evaluation functions are protocol-based, allowing any async callable that matches the expected signatures to be plugged in.
+The framework orchestrates a three-stage pipeline: `run()` executes a single strategy with a given input and config, producing a `RunResult` that captures identity, configuration, and output metadata; `generate_runs()` creates the full combinatorial matrix of inputs x configs and executes them concurrently; and `evaluate()` applies a scoring function to each run result, returning normalized `EvalResult` objects. Strategy functions and evaluation functions are protocol-based, allowing any async callable that matches the expected signatures to be plugged in.
 
 Usage:
 ```python
@@ -15,7 +15,7 @@ scores = await evaluate(results, eval_function=semantic_similarity_scorer)
 
 from __future__ import annotations
 from typing import Any, Protocol
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pydantic import BaseModel, Field, ValidationError
 from conduit.core.workflow.context import context
 import asyncio
@@ -122,8 +122,47 @@ async def run_eval(
     )
 
 
+async def iter_runs(
+    inputs: list[RunInput],
+    configs: list[dict],
+    strategy: Callable,
+    concurrency: int = CONCURRENCY_LIMIT,
+) -> AsyncIterator[tuple[int, RunResult]]:
+    """
+    Run the inputs x configs matrix, yielding (index, RunResult) as each run completes.
+    index is the run's position in generate_runs() order (input-major).
+
+    Only `concurrency` runs exist at any time; the rest are started as earlier
+    ones finish, so memory does not grow with the size of the matrix.
+    A failing run raises and cancels the runs still in flight.
+    """
+    pairs = enumerate((input, config) for input in inputs for config in configs)
+    in_flight: dict[asyncio.Task, int] = {}
+
+    async def harvest() -> list[tuple[int, RunResult]]:
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        return [(in_flight.pop(task), task.result()) for task in done]
+
+    try:
+        for index, (input, config) in pairs:
+            if len(in_flight) >= concurrency:
+                for result in await harvest():
+                    yield result
+            in_flight[asyncio.create_task(run_eval(input, config, strategy))] = index
+        while in_flight:
+            for result in await harvest():
+                yield result
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
 async def generate_runs(
-    inputs: list[RunInput], configs: list[dict], strategy: Callable
+    inputs: list[RunInput],
+    configs: list[dict],
+    strategy: Callable,
+    on_result: Callable[[RunResult], Awaitable[None]] | None = None,
 ) -> list[RunResult]:
     """
     Generate multiple evaluation runs based on the provided inputs, configurations, and strategy.
@@ -132,25 +171,19 @@ async def generate_runs(
         inputs (list[Any]): A list of input data for the evaluations.
         configs (list[dict]): A list of configuration settings for the evaluations.
         strategy (Callable): The strategy function to execute each evaluation.
+        on_result (Callable): Optional async callback awaited with each RunResult as
+            soon as it completes (e.g. to persist it while the matrix is still running).
 
     Returns:
         list[Any]: A list of results from each evaluation run.
 
     NOTE: config schema is tightly coupled with the strategy, so we assume that the strategy can handle the provided configs.
     """
-    coroutines = []
-    for input in inputs:
-        for config in configs:
-            coroutines.append(run_eval(input, config, strategy))
-
-    # Run all evaluations concurrently and gather results
-    sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
-
-    async def bounded(coro):
-        async with sem:
-            return await coro
-
-    run_results = await asyncio.gather(*[bounded(c) for c in coroutines])
+    run_results: list[RunResult | None] = [None] * (len(inputs) * len(configs))
+    async for index, run_result in iter_runs(inputs, configs, strategy):
+        if on_result is not None:
+            await on_result(run_result)
+        run_results[index] = run_result
 
     return run_results
 
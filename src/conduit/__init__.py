@@ -1,3 +1,12 @@
 from conduit.utils.logs import logging_config
 
 _ = logging_config
+
+
+def __getattr__(name: str):
+    # Resolved lazily (PEP 562): `import conduit` stays cheap
+    if name in ("__version__", "settings"):
+        from conduit import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
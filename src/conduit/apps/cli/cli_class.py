@@ -6,31 +6,38 @@ import logging
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-from conduit.config import settings
-from conduit.apps.cli.query.query_function import (
-    CLIQueryFunctionProtocol,
-    default_query_function,
-)
-
-# CHANGE: Import the concrete class directly for proper typing and access
-from conduit.storage.repository.postgres_repository import (
-    AsyncPostgresSessionRepository,
-)
-from conduit.apps.cli.commands.commands import CommandCollection
+import conduit.config as config
+from conduit.apps.cli.utils.lazy_group import LazyGroup
 from conduit.apps.cli.utils.printer import Printer
 
 if TYPE_CHECKING:
+    from conduit.apps.cli.commands.commands import CommandCollection
+    from conduit.apps.cli.query.query_function import (
+        CLIQueryFunctionInputs,
+        CLIQueryFunctionProtocol,
+    )
     from conduit.domain.conversation.conversation import Conversation
+    from conduit.storage.repository.postgres_repository import (
+        AsyncPostgresSessionRepository,
+    )
 
 
 logger = logging.getLogger(__name__)
 
+
+def default_query_function(inputs: CLIQueryFunctionInputs) -> Conversation:
+    """
+    Defers importing the query stack (Conduit, clients, ...) until a query runs.
+    """
+    from conduit.apps.cli.query import query_function
+
+    return query_function.default_query_function(inputs)
+
+
 # Defaults
 DEFAULT_PROJECT_NAME = "conduit_cli"
 DEFAULT_DESCRIPTION = "Conduit: The LLM CLI"
 DEFAULT_QUERY_FUNCTION = default_query_function
-PREFERRED_MODEL = settings.preferred_model
-DEFAULT_SYSTEM_MESSAGE = settings.system_prompt
 
 
 class ConduitCLI:
@@ -43,17 +50,27 @@ class ConduitCLI:
         project_name: str = DEFAULT_PROJECT_NAME,
         description: str = DEFAULT_DESCRIPTION,
         query_function: CLIQueryFunctionProtocol = DEFAULT_QUERY_FUNCTION,
-        model: str = PREFERRED_MODEL,
-        system_message: str = DEFAULT_SYSTEM_MESSAGE,
-        version: str = settings.version,
+        model: str | None = None,
+        system_message: str | None = None,
+        version: str | None = None,
     ):
+        """
+        model and system_message default to the user's settings, which are only
+        loaded here (not at import) so importing the CLI stays cheap.
+        """
         # Parameters
         self.project_name: str = project_name
         self.description: str = description
         self.query_function: CLIQueryFunctionProtocol = query_function
-        self.version: str = version
-        self.preferred_model: str = model
-        self.system_message: str = system_message
+        self._version: str | None = version
+        self.preferred_model: str = (
+            model if model is not None else config.settings.preferred_model
+        )
+        self.system_message: str = (
+            system_message
+            if system_message is not None
+            else config.settings.system_prompt
+        )
 
         # Components
         self.printer: Printer = Printer()
@@ -63,7 +80,7 @@ class ConduitCLI:
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
-        self.cli: click.Group = self._build_cli()
+        self.cli: LazyGroup = self._build_cli()
 
     @cached_property
     def repository(self) -> AsyncPostgresSessionRepository:
@@ -71,6 +88,10 @@ class ConduitCLI:
         Instantiate the repository.
         Note: The connection is NOT opened here. It is opened in run().
         """
+        from conduit.storage.repository.postgres_repository import (
+            AsyncPostgresSessionRepository,
+        )
+
         return AsyncPostgresSessionRepository(project_name=self.project_name)
 
     @cached_property
@@ -88,12 +109,15 @@ class ConduitCLI:
 
             return Conversation()
 
-    def _build_cli(self) -> click.Group:
+    @property
+    def version(self) -> str:
+        return self._version if self._version is not None else config.settings.version
+
+    def _build_cli(self) -> LazyGroup:
         stdin = self._get_stdin()
         printer = self.printer
-        version_string: str = self.version
 
-        @click.group(invoke_without_command=True)
+        @click.group(cls=LazyGroup, invoke_without_command=True)
         @click.option("--version", "show_version", is_flag=True)
         @click.option("--raw", is_flag=True)
         @click.pass_context
@@ -113,14 +137,14 @@ class ConduitCLI:
             ctx.obj["preferred_model"] = self.preferred_model
             ctx.obj["system_message"] = self.system_message
             ctx.obj["chat"] = False
-            ctx.obj["verbosity"] = settings.default_verbosity
+            ctx.obj["verbosity"] = config.settings.default_verbosity
             ctx.obj["db_name"] = "conduit"
 
             if raw:
                 printer.set_raw(True)
 
             if show_version:
-                click.echo(version_string)
+                click.echo(self.version)
                 ctx.exit()
 
             if ctx.invoked_subcommand is None:
@@ -134,13 +158,19 @@ class ConduitCLI:
         """
         _ = command_collection.attach(self.cli)
 
+    def attach_lazy(self, name: str, import_path: str) -> None:
+        """
+        Attach a command by import path ("package.module:attribute"); the module
+        is only imported when the command is invoked or listed.
+        """
+        self.cli.add_lazy_command(name, import_path)
+
     def run(self) -> None:
         """
         Execute the CLI.
-        Pool is lazily initialized on first use and shut down in the finally block.
+        Pools (Postgres, provider clients) are lazily initialized on first use
+        and shut down in the finally block.
         """
-        from conduit.storage.db_manager import db_manager
-
         try:
             self.cli()
         except Exception as e:
@@ -148,9 +178,20 @@ class ConduitCLI:
             raise
         finally:
             if not self.loop.is_closed():
-                from conduit.config import settings
-                self.loop.run_until_complete(settings.odometer_registry().flush())
-                self.loop.run_until_complete(db_manager.shutdown())
+                # Only shut down subsystems this command actually loaded; importing
+                # them here just to find them idle would dominate `conduit config`.
+                if "conduit.storage.odometer.odometer_registry" in sys.modules:
+                    self.loop.run_until_complete(
+                        config.settings.odometer_registry().stop()
+                    )
+                if "conduit.core.clients.client_pool" in sys.modules:
+                    from conduit.core.clients.client_pool import client_pool
+
+                    self.loop.run_until_complete(client_pool.shutdown())
+                if "conduit.storage.db_manager" in sys.modules:
+                    from conduit.storage.db_manager import db_manager
+
+                    self.loop.run_until_complete(db_manager.shutdown())
                 self.loop.close()
 
     def _get_stdin(self) -> str:
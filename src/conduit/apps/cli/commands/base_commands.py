@@ -380,10 +380,28 @@ class BaseCommands(CommandCollection):
             )
 
         @click.command()
+        @click.option(
+            "-s", "--search", "search_query", default=None,
+            help="Search past conversations in this project instead.",
+        )
+        @click.option("-n", "--limit", default=20, show_default=True, help="Results per page.")
+        @click.option("--page", default=1, show_default=True, help="Results page (with --search).")
         @click.pass_context
-        def history(ctx: click.Context):
-            """View message history."""
+        def history(ctx: click.Context, search_query: str | None, limit: int, page: int):
+            """View message history, or search it with --search."""
             repository: ConversationRepository = ctx.obj["repository"]()  # Lazy load
+
+            if search_query is not None:
+                handlers.handle_search(
+                    repository,
+                    search_query,
+                    ctx.obj["printer"],
+                    ctx.obj["loop"],
+                    limit=limit,
+                    page=page,
+                )
+                return
+
             conversation: Conversation = ctx.obj["conversation"]()  # Lazy load
 
             # Correctly extract session ID
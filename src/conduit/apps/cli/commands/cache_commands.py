@@ -99,3 +99,26 @@ def inspect(ctx: click.Context, project_name: str) -> None:
         loop=loop,
         db_name=db_name,
     )
+
+
+@cache.command()
+@click.argument("project_name", required=False, default=None)
+@click.option("--all", "all_projects", is_flag=True, help="Migrate all cache namespaces.")
+@click.pass_context
+def migrate(ctx: click.Context, project_name: str | None, all_projects: bool) -> None:
+    """Re-key entries written by older versions of conduit."""
+    if not project_name and not all_projects:
+        raise click.UsageError("Provide a PROJECT_NAME or use --all.")
+    if project_name and all_projects:
+        raise click.UsageError("PROJECT_NAME and --all are mutually exclusive.")
+
+    printer: Printer = ctx.obj["printer"]
+    loop: asyncio.AbstractEventLoop = ctx.obj["loop"]
+    db_name: str = ctx.obj["db_name"]
+
+    handlers.handle_cache_migrate(
+        project_name=project_name,
+        printer=printer,
+        loop=loop,
+        db_name=db_name,
+    )
@@ -6,11 +6,11 @@ This is a static class containing CLI command handlers for the Conduit applicati
 """
 
 from __future__ import annotations
-from conduit.config import settings
 from typing import TYPE_CHECKING
 import logging
 import json
 import sys
+import time
 import asyncio
 import click
 
@@ -25,9 +25,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Constants
-DEFAULT_VERBOSITY = settings.default_verbosity
-
 
 def _save_response(response: object, path: str) -> None:
     """
@@ -151,6 +148,58 @@ class BaseHandlers:
         conversation.print_history()
         sys.exit()
 
+    @staticmethod
+    def handle_search(
+        repository: AsyncSessionRepository,
+        query: str,
+        printer: Printer,
+        loop: asyncio.AbstractEventLoop,
+        limit: int = 20,
+        page: int = 1,
+    ) -> None:
+        """
+        Search past conversations and print ranked hits with snippets.
+        """
+        from rich.markup import escape
+        from rich.table import Table
+        from conduit.storage.repository.postgres_repository import (
+            SNIPPET_START,
+            SNIPPET_STOP,
+        )
+
+        logger.info(f"Searching message history for {query!r}...")
+        offset = (max(page, 1) - 1) * limit
+        hits = loop.run_until_complete(repository.search(query, limit=limit, offset=offset))
+
+        if not hits:
+            printer.print_pretty(f"[yellow]No messages match {escape(query)!r}.[/yellow]")
+            return
+
+        table = Table(title=f"Search: {query}", show_lines=True)
+        table.add_column("Session", style="cyan", no_wrap=True)
+        table.add_column("When", no_wrap=True)
+        table.add_column("Role")
+        table.add_column("Match")
+        for hit in hits:
+            snippet = " ".join(escape(hit["snippet"]).split())
+            snippet = snippet.replace(SNIPPET_START, "[bold yellow]").replace(
+                SNIPPET_STOP, "[/bold yellow]"
+            )
+            when = (
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(hit["created_at"] / 1000))
+                if hit["created_at"]
+                else ""
+            )
+            table.add_row(
+                f"{escape(hit['title'])}\n[dim]{hit['session_id'][:8]}[/dim]",
+                when,
+                hit["role"],
+                snippet,
+            )
+        printer.print_pretty(table)
+        if len(hits) == limit:
+            printer.print_pretty(f"[dim]More results: --page {max(page, 1) + 1}[/dim]")
+
     @staticmethod
     def handle_wipe(
         printer: Printer,
@@ -9,6 +9,7 @@ from conduit.config import settings
 
 if TYPE_CHECKING:
     from conduit.apps.cli.utils.printer import Printer
+    from conduit.domain.conversation.conversation import Conversation
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,11 @@ class BatchHandlers:
         as_json: bool,
         printer: Printer,
     ) -> None:
-        """Run prompts in parallel and display results."""
+        """
+        Run prompts in parallel and display results in input order, each as
+        soon as it and everything before it has completed. A failed prompt is
+        reported in place; the rest of the batch still runs.
+        """
         param_kwargs: dict[str, object] = {}
         if temperature is not None:
             param_kwargs["temperature"] = temperature
@@ -35,34 +40,59 @@ class BatchHandlers:
             **param_kwargs,
         )
 
-        conversations = batch.run(
-            prompt_strings_list=prompts,
-            max_concurrent=max_concurrent,
-        )
+        total = len(prompts)
+        completed: dict[int, Conversation | Exception] = {}
+        next_index = 0
+        json_results: list[dict[str, object]] = []
+        failures = 0
+
+        for index, result in batch.run_iter(
+            prompt_strings_list=prompts, max_concurrent=max_concurrent
+        ):
+            completed[index] = result
+            # Release the completed prefix, keeping output in input order
+            while next_index in completed:
+                result = completed.pop(next_index)
+                item: dict[str, object] = {"index": next_index, "prompt": prompts[next_index]}
+                if isinstance(result, Exception):
+                    failures += 1
+                    item["error"] = f"{type(result).__name__}: {result}"
+                else:
+                    item["response"] = str(result.content)
 
-        results = [
-            {"index": i, "prompt": p, "response": str(conv.content)}
-            for i, (p, conv) in enumerate(zip(prompts, conversations))
-        ]
+                if as_json:
+                    json_results.append(item)
+                elif raw:
+                    BatchHandlers._emit_raw(item)
+                else:
+                    BatchHandlers._emit_pretty(item, total, printer)
+                next_index += 1
 
         if as_json:
-            click.echo(json.dumps(results, ensure_ascii=False, indent=2))
-            return
+            click.echo(json.dumps(json_results, ensure_ascii=False, indent=2))
 
-        if raw:
-            for i, item in enumerate(results):
-                click.echo(item["response"])
-                if i < len(results) - 1:
-                    click.echo("---")
-            return
+        if failures:
+            raise click.ClickException(f"{failures} of {total} prompts failed.")
 
-        # Pretty mode
-        total = len(results)
-        for item in results:
-            idx = item["index"] + 1
-            truncated = item["prompt"][:50].replace("\n", " ")
-            if len(item["prompt"]) > 50:
-                truncated += "..."
-            header = f"[{idx}/{total}] {truncated}"
-            printer.print_pretty(header, style="bold cyan")
+    @staticmethod
+    def _emit_raw(item: dict[str, object]) -> None:
+        if item["index"]:
+            click.echo("---")
+        if "error" in item:
+            click.echo(f"Error: {item['error']}", err=True)
+        else:
+            click.echo(item["response"])
+
+    @staticmethod
+    def _emit_pretty(item: dict[str, object], total: int, printer: Printer) -> None:
+        idx = item["index"] + 1
+        prompt = str(item["prompt"])
+        truncated = prompt[:50].replace("\n", " ")
+        if len(prompt) > 50:
+            truncated += "..."
+        header = f"[{idx}/{total}] {truncated}"
+        printer.print_pretty(header, style="bold cyan")
+        if "error" in item:
+            printer.print_pretty(f"Error: {item['error']}", style="bold red")
+        else:
             printer.print_markdown(item["response"])
@@ -186,6 +186,39 @@ class CacheHandlers:
         syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
         printer.print_pretty(syntax)
 
+    @staticmethod
+    def handle_cache_migrate(
+        project_name: str | None,
+        printer: Printer,
+        loop: asyncio.AbstractEventLoop,
+        db_name: str,
+    ) -> None:
+        from conduit.storage.cache.postgres_cache_async import AsyncPostgresCache
+
+        try:
+            if project_name is None:
+                rows = loop.run_until_complete(
+                    AsyncPostgresCache(project_name="", db_name=db_name).ls_all()
+                )
+                project_names = [str(row["cache_name"]) for row in rows]
+            else:
+                project_names = [project_name]
+
+            for name in project_names:
+                cache = AsyncPostgresCache(project_name=name, db_name=db_name)
+                migrated, skipped = loop.run_until_complete(cache.migrate_keys())
+                printer.print_pretty(
+                    f"{name}: migrated {migrated} entries, skipped {skipped}."
+                )
+
+        except TimeoutError as e:
+            printer.print_pretty(f"[red]Connection timed out: {e}[/red]")
+            sys.exit(1)
+        except Exception as e:
+            logger.error(f"cache migrate failed: {e}")
+            printer.print_pretty(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+
 
 def _format_size(size_bytes: int) -> str:
     if size_bytes < 1024:
@@ -0,0 +1,40 @@
+"""
+Click group whose subcommands are imported on first use.
+
+Commands are registered as "package.module:attribute" import paths. Running
+`conduit ping` then only imports the module that defines `ping`, not the batch
+engine, the model store, etc. Listing commands (`conduit --help`) still imports
+them all, since Click needs each command's help text.
+"""
+
+from __future__ import annotations
+import importlib
+import click
+
+
+class LazyGroup(click.Group):
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = dict(lazy_commands or {})
+
+    def add_lazy_command(self, name: str, import_path: str) -> None:
+        """Register a command by import path, e.g. "pkg.commands:cache"."""
+        self.lazy_commands[name] = import_path
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load(cmd_name)
+        return command
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_commands.pop(cmd_name).split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attribute} is not a click command")
+        # Cache it as a regular command so it's only imported once
+        self.add_command(command, cmd_name)
+        return command
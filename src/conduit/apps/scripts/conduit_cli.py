@@ -1,11 +1,15 @@
 from conduit.apps.cli.commands.base_commands import BaseCommands
-from conduit.apps.cli.commands.batch_commands import batch_command
-from conduit.apps.cli.commands.cache_commands import cache
-from conduit.apps.cli.commands.models_commands import models_command
-from conduit.apps.cli.commands.update_commands import update
 from conduit.apps.cli.cli_class import ConduitCLI
 import sys
 
+# Subcommands with heavy imports, loaded only when invoked (or listed by --help)
+LAZY_COMMANDS = {
+    "cache": "conduit.apps.cli.commands.cache_commands:cache",
+    "models": "conduit.apps.cli.commands.models_commands:models_command",
+    "batch": "conduit.apps.cli.commands.batch_commands:batch_command",
+    "update": "conduit.apps.cli.commands.update_commands:update",
+}
+
 
 def query_entrypoint():
     """
@@ -45,10 +49,8 @@ def main():
     conduit_cli = ConduitCLI()
     commands = BaseCommands()
     conduit_cli.attach(commands)
-    conduit_cli.cli.add_command(cache)
-    conduit_cli.cli.add_command(models_command)
-    conduit_cli.cli.add_command(batch_command)
-    conduit_cli.cli.add_command(update)
+    for name, import_path in LAZY_COMMANDS.items():
+        conduit_cli.attach_lazy(name, import_path)
     conduit_cli.run()
 
 
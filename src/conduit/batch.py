@@ -19,6 +19,7 @@ results = batch.run(prompt_strings_list=["text1", "text2", "text3"])
 # Orchestration classes
 from conduit.core.conduit.batch.conduit_batch_async import ConduitBatchAsync
 from conduit.core.conduit.batch.conduit_batch_sync import ConduitBatchSync
+from conduit.core.conduit.batch.rate_limiter import RateLimit, RateLimitScheduler
 from conduit.core.prompt.prompt import Prompt
 
 # Primitives: dataclasses / enums
@@ -38,5 +39,7 @@ __all__ = [
     "GenerationRequest",
     "GenerationResponse",
     "Prompt",
+    "RateLimit",
+    "RateLimitScheduler",
     "Verbosity",
 ]
@@ -9,6 +9,8 @@ from conduit.domain.exceptions.exceptions import (
 from conduit.capabilities.tools.tool_function import ToolFunction
 from conduit.domain.message.message import ToolCall
 from typing import TYPE_CHECKING
+import asyncio
+import inspect
 import logging
 
 if TYPE_CHECKING:
@@ -32,7 +34,13 @@ class ToolRegistry:
             raise KeyError(f"Tool with name '{name}' is not registered.")
         return self._tools[name]
 
-    async def call_tool(self, tool_call: ToolCall) -> str:
+    async def call_tool(self, tool_call: ToolCall, timeout: float | None = None) -> str:
+        """
+        Run a tool call and return its result as a string.
+        Async tools are awaited on the event loop; sync tools run on the default
+        thread pool so CPU-bound work doesn't block concurrent tool calls.
+        A timeout is treated like a recoverable ToolExecutionError.
+        """
         tool = self.get_tool(tool_call.function_name)
 
         # Create a copy of arguments to run the function so we don't pollute
@@ -44,7 +52,10 @@ class ToolRegistry:
             func_args["_skill_registry"] = self._skill_registry
             func_args["_tool_registry"] = self
         try:
-            result = await tool.func(**func_args)
+            result = await asyncio.wait_for(_invoke(tool, func_args), timeout=timeout)
+        except TimeoutError:
+            logger.error(f"Tool '{tool.name}' timed out after {timeout}s (recoverable)")
+            return {"error": f"Tool '{tool.name}' timed out after {timeout} seconds."}
         except ToolExecutionError as e:
             # Return error to LLM
             logger.error(f"Tool '{tool.name}' failed (recoverable): {e}")
@@ -83,3 +94,12 @@ class ToolRegistry:
 
         self._skill_registry = skill_registry
         self.register(enable_skill_tool)
+
+
+async def _invoke(tool: Tool, func_args: dict) -> object:
+    if inspect.iscoroutinefunction(tool.func):
+        return await tool.func(**func_args)
+    result = await asyncio.to_thread(tool.func, **func_args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
@@ -10,8 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import tomllib
 from dataclasses import dataclass
+from functools import cache, cached_property
 from conduit.utils.progress.verbosity import Verbosity
-from rich.console import Console
 from xdg_base_dirs import (
     xdg_config_home,
     xdg_state_home,
@@ -19,10 +19,10 @@ from xdg_base_dirs import (
 )
 import os
 from collections.abc import Callable
-from typing import TYPE_CHECKING
-from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from rich.console import Console
     from conduit.storage.odometer.odometer_registry import OdometerRegistry
     from conduit.domain.request.generation_params import GenerationParams
     from conduit.domain.config.conduit_options import ConduitOptions
@@ -38,12 +38,6 @@ CONFIG_DIR = Path(xdg_config_home()) / "conduit"
 STATE_DIR = Path(xdg_state_home()) / "conduit"
 DATA_DIR = Path(xdg_data_home()) / "conduit"
 
-# Version
-try:
-    __version__ = version("conduit")
-except Exception:
-    __version__ = "unknown"
-
 # File paths
 SYSTEM_PROMPT_PATH = CONFIG_DIR / "system_message.jinja2"
 SETTINGS_TOML_PATH = CONFIG_DIR / "settings.toml"
@@ -55,15 +49,30 @@ DEFAULT_LOG_FILE = DATA_DIR / "conduit" / "conduit.log"
 DATASETS_DIR = DATA_DIR / "datasets"
 
 
+@cache
+def _version() -> str:
+    from importlib.metadata import version
+
+    try:
+        return version("conduit")
+    except Exception:
+        return "unknown"
+
+
+@cache
+def _default_console() -> Console:
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
 @dataclass
 class Settings:
     system_prompt: str
     preferred_model: str
     default_verbosity: Verbosity
-    default_console: Console
     paths: dict[str, Path]
     default_project_name: str
-    version: str
     # Lazy loaders
     odometer_registry: Callable[[], OdometerRegistry]
     default_params: Callable[[], GenerationParams]
@@ -71,6 +80,15 @@ class Settings:
     default_repository: Callable[[str], ConversationRepository]
     default_conduit_options: Callable[[str], ConduitOptions]
 
+    # Package metadata and rich are only loaded when asked for
+    @cached_property
+    def version(self) -> str:
+        return _version()
+
+    @cached_property
+    def default_console(self) -> Console:
+        return _default_console()
+
 
 def load_settings() -> Settings:
     # Defaults (lowest priority)
@@ -78,10 +96,8 @@ def load_settings() -> Settings:
         "system_prompt": "You are a helpful assistant.",
         "preferred_model": "gpt3",
         "default_verbosity": Verbosity.PROGRESS,
-        "default_console": Console(stderr=True),
         "paths": {},
         "default_project_name": "conduit",
-        "version": __version__,
     }
 
     # Config files (medium priority)
@@ -157,12 +173,16 @@ def load_settings() -> Settings:
     # CHANGED: Sync function, returns Lazy Cache
     def default_cache(project_name: str = default_project_name) -> ConduitCache:
         """
-        Lazy loader for the default AsyncPostgresCache instance.
+        Lazy loader for the default cache: an in-process LRU/TTL tier in front of
+        AsyncPostgresCache.
         """
         from conduit.storage.cache.postgres_cache_async import AsyncPostgresCache
+        from conduit.storage.cache.tiered_cache import AsyncTieredCache
 
         # We just pass parameters; the pool is created when accessed inside the loop
-        return AsyncPostgresCache(project_name=project_name, db_name="conduit")
+        return AsyncTieredCache(
+            AsyncPostgresCache(project_name=project_name, db_name="conduit")
+        )
 
     def default_repository(
         project_name: str = default_project_name,
@@ -183,7 +203,7 @@ def load_settings() -> Settings:
             project_name=name,
             cache=None,
             repository=None,
-            console=config["default_console"],
+            console=_default_console(),
         )
 
     def get_odometer_registry() -> OdometerRegistry:
@@ -212,5 +232,17 @@ def load_settings() -> Settings:
     return Settings(**config)
 
 
-# Singleton
-settings = load_settings()
+# Singleton, loaded on first access (PEP 562) so importing this module is cheap
+settings: Settings
+_settings: Settings | None = None
+
+
+def __getattr__(name: str) -> Any:
+    global _settings
+    if name == "settings":
+        if _settings is None:
+            _settings = load_settings()
+        return _settings
+    if name == "__version__":
+        return _version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from conduit.domain.config.prompt_caching import PromptCaching
+
+
+def cache_control(policy: PromptCaching) -> dict[str, Any]:
+    control: dict[str, Any] = {"type": "ephemeral"}
+    if policy.ttl != "5m":
+        control["ttl"] = policy.ttl
+    return control
+
+
+def _mark_message(message: dict[str, Any], control: dict[str, Any]) -> bool:
+    """
+    Put a breakpoint on the last content block of a converted message.
+    Returns False if the message has nothing to mark (empty text can't be cached).
+    """
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return False
+        message["content"] = [{"type": "text", "text": content, "cache_control": control}]
+        return True
+    if isinstance(content, list) and content:
+        last = content[-1]
+        if last.get("type") == "text" and not last.get("text"):
+            return False
+        content[-1] = {**last, "cache_control": control}
+        return True
+    return False
+
+
+def apply_cache_control(
+    policy: PromptCaching,
+    system: str | None,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None,
+) -> tuple[str | list[dict[str, Any]] | None, list[dict[str, Any]], list[dict[str, Any]] | None]:
+    """
+    Add Anthropic cache_control breakpoints per the policy; returns (system, messages, tools).
+
+    Anthropic caches the prompt prefix up to each breakpoint, in the order
+    tools -> system -> messages, and allows at most four. We use up to three:
+    - the last tool definition (caches every tool);
+    - the system prompt (converted to a text block);
+    - the last message before the latest user turn, so the history that will
+      be resent next turn is cached while the new input isn't written.
+    """
+    control = cache_control(policy)
+
+    if policy.tools and tools:
+        tools = [*tools[:-1], {**tools[-1], "cache_control": control}]
+
+    if policy.system and system:
+        system = [{"type": "text", "text": system, "cache_control": control}]
+
+    if policy.history and len(messages) > 1:
+        messages = list(messages)
+        # Walk back from the message before the latest turn to one we can mark
+        for index in range(len(messages) - 2, -1, -1):
+            message = {**messages[index]}
+            if isinstance(message.get("content"), list):
+                message["content"] = list(message["content"])
+            if _mark_message(message, control):
+                messages[index] = message
+                break
+
+    return system, messages, tools
@@ -4,6 +4,7 @@ from conduit.core.clients.payload_base import Payload
 from conduit.core.clients.anthropic.payload import AnthropicPayload
 from conduit.core.clients.anthropic.message_adapter import convert_message_to_anthropic
 from conduit.core.clients.anthropic.tool_adapter import convert_tool_to_anthropic
+from conduit.core.clients.anthropic.cache_adapter import apply_cache_control
 from conduit.domain.result.response import GenerationResponse
 from conduit.domain.result.response_metadata import ResponseMetadata, StopReason
 from conduit.domain.message.message import AssistantMessage, ToolCall
@@ -22,12 +23,26 @@ if TYPE_CHECKING:
     from instructor import Instructor
 
 
+def cache_usage(usage: Any) -> dict[str, int]:
+    """
+    Cache accounting from an Anthropic usage block. Anthropic reports cached
+    tokens separately: input_tokens excludes them.
+    """
+    return {
+        "cache_read_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
+        "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+    }
+
+
 class AnthropicClient(Client):
     """
     Client implementation for Anthropic's Claude API.
     Async only.
     """
 
+    provider = "anthropic"
+    api_key_env = "ANTHROPIC_API_KEY"
+
     @cached_property
     def async_client(self) -> AsyncAnthropic:
         """
@@ -116,11 +131,18 @@ class AnthropicClient(Client):
                 for tool in request.options.tool_registry.tools
             ]
 
+        # Opt-in prompt caching: mark the stable prefix with cache_control breakpoints
+        system_param: str | list[dict[str, Any]] | None = system_content
+        if request.options.prompt_caching is not None:
+            system_param, converted_messages, tools = apply_cache_control(
+                request.options.prompt_caching, system_content, converted_messages, tools
+            )
+
         anthropic_payload = AnthropicPayload(
             model=request.params.model,
             messages=converted_messages,
             max_tokens=request.params.max_tokens if request.params.max_tokens else 4096,
-            system=system_content,
+            system=system_param,
             temperature=request.params.temperature,
             top_p=request.params.top_p,
             stream=request.params.stream,
@@ -270,6 +292,7 @@ class AnthropicClient(Client):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            **cache_usage(result.usage),
         )
 
         # Create and return Response
@@ -350,6 +373,7 @@ class AnthropicClient(Client):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            **cache_usage(completion.usage),
         )
 
         # Create and return Response
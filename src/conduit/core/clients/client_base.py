@@ -4,8 +4,10 @@ Both sync and async methods are defined here.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, ClassVar, override
+import hashlib
 import logging
+import os
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -19,6 +21,32 @@ logger = logging.getLogger(__name__)
 
 
 class Client:
+    # Connection identity; ClientPool shares one instance per (provider, base URL, API key)
+    provider: ClassVar[str] = ""
+    base_url: ClassVar[str | None] = None
+    api_key_env: ClassVar[str | None] = None
+
+    @classmethod
+    def pool_key(cls) -> tuple[str, str | None, str | None]:
+        """
+        Key under which ClientPool shares instances of this client.
+        The API key is hashed so it never shows up in logs or reprs.
+        """
+        api_key = os.getenv(cls.api_key_env) if cls.api_key_env else None
+        api_key_digest = (
+            hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else None
+        )
+        return (cls.provider or cls.__name__, cls.base_url, api_key_digest)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying SDK client (and its HTTP connection pool), if one was created.
+        """
+        for attr in ("async_client", "_raw_client"):
+            sdk_client = self.__dict__.get(attr)
+            if sdk_client is not None:
+                await sdk_client.close()
+
     def _convert_messages(self, messages: Sequence[Message]) -> list[dict[str, Any]]:
         return [self._convert_message(m) for m in messages]
 
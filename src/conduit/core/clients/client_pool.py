@@ -0,0 +1,88 @@
+"""
+Process-wide pool of provider clients.
+
+Every generation step builds a fresh ModelAsync, and each provider Client owns an
+SDK client (AsyncOpenAI, AsyncAnthropic, ...) with its own HTTP connection pool.
+Sharing Client instances keeps those keep-alive connections warm across calls
+instead of repeating the TCP/TLS handshake per request.
+
+Clients are keyed by Client.pool_key() -> (provider, base URL, API key digest),
+and are bound to the event loop they were created in: httpx connection pools
+cannot be reused across loops, so a changed (or closed) loop triggers a rebuild,
+the same way RemoteClient._client does.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from conduit.core.clients.client_base import Client
+
+logger = logging.getLogger(__name__)
+
+ClientT = TypeVar("ClientT", bound="Client")
+
+
+class ClientPool:
+    """
+    Keyed cache of Client instances, scoped to the running event loop.
+    """
+
+    def __init__(self):
+        # pool_key -> (client, loop it was created in)
+        self._entries: dict[
+            tuple[str, str | None, str | None],
+            tuple[Client, asyncio.AbstractEventLoop],
+        ] = {}
+
+    def get(self, client_cls: type[ClientT]) -> ClientT:
+        """
+        Return the shared client for client_cls, building it if needed.
+        Outside a running loop there is nothing to bind connections to, so a
+        fresh, unpooled client is returned (e.g. ModelSync construction).
+        """
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return client_cls()
+
+        key = client_cls.pool_key()
+        entry = self._entries.get(key)
+        if entry is not None:
+            client, loop = entry
+            if loop is current_loop and not current_loop.is_closed():
+                return client  # type: ignore[return-value]
+            logger.debug(f"Event loop changed; rebuilding pooled {client_cls.__name__}")
+        else:
+            logger.debug(f"Initializing pooled {client_cls.__name__}")
+
+        client = client_cls()
+        self._entries[key] = (client, current_loop)
+        return client
+
+    async def shutdown(self) -> None:
+        """
+        Close every pooled client that belongs to the running loop and empty the pool.
+        Clients bound to other loops are dropped; their loops own their sockets.
+        """
+        entries, self._entries = self._entries, {}
+        if not entries:
+            return
+
+        current_loop = asyncio.get_running_loop()
+        logger.info(f"Closing {len(entries)} pooled provider client(s)...")
+        for client, loop in entries.values():
+            if loop is not current_loop:
+                continue
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close {client.__class__.__name__}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+client_pool = ClientPool()
@@ -7,6 +7,7 @@ from functools import cached_property
 from conduit.core.clients.client_base import Client
 from conduit.core.clients.payload_base import Payload
 from conduit.core.clients.google.payload import GooglePayload
+from conduit.core.clients.openai.cache_adapter import cached_prompt_tokens
 from conduit.core.clients.google.message_adapter import convert_message_to_google
 from conduit.core.clients.google.tool_adapter import convert_tool_to_google
 from conduit.core.clients.google.image_params import GoogleImageParams
@@ -35,6 +36,10 @@ class GoogleClient(Client):
     Async by default.
     """
 
+    provider = "google"
+    base_url = "https://generativelanguage.googleapis.com/v1beta/"
+    api_key_env = "GOOGLE_API_KEY"
+
     @cached_property
     def async_client(self) -> AsyncOpenAI:
         """
@@ -44,7 +49,7 @@ class GoogleClient(Client):
 
         async_client = AsyncOpenAI(
             api_key=self._get_api_key(),
-            base_url="https://generativelanguage.googleapis.com/v1beta/",
+            base_url=self.base_url,
         )
         return async_client
 
@@ -209,6 +214,7 @@ class GoogleClient(Client):
         model_stem = result.model
         input_tokens = result.usage.prompt_tokens
         output_tokens = result.usage.completion_tokens
+        cache_read_tokens = cached_prompt_tokens(result.usage)
 
         # Determine stop reason
         stop_reason = StopReason.STOP
@@ -257,6 +263,7 @@ class GoogleClient(Client):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            cache_read_tokens=cache_read_tokens,
         )
 
         # Create and return Response
@@ -294,6 +301,7 @@ class GoogleClient(Client):
         model_stem = completion.model
         input_tokens = completion.usage.prompt_tokens
         output_tokens = completion.usage.completion_tokens
+        cache_read_tokens = cached_prompt_tokens(completion.usage)
 
         # Determine stop reason
         stop_reason = StopReason.STOP
@@ -315,6 +323,7 @@ class GoogleClient(Client):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            cache_read_tokens=cache_read_tokens,
         )
 
         # Create and return Response
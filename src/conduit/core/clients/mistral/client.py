@@ -27,6 +27,10 @@ class MistralClient(Client):
     Async only.
     """
 
+    provider = "mistral"
+    base_url = "https://api.mistral.ai/v1"
+    api_key_env = "MISTRAL_API_KEY"
+
     def __init__(self):
         instructor_client, raw_client = self._initialize_clients()
         self._client: Instructor = instructor_client
@@ -38,7 +42,7 @@ class MistralClient(Client):
 
         raw_client = AsyncOpenAI(
             api_key=self._get_api_key(),
-            base_url="https://api.mistral.ai/v1",
+            base_url=self.base_url,
         )
         instructor_client = instructor.from_openai(raw_client)
         return instructor_client, raw_client
@@ -91,25 +95,26 @@ class MistralClient(Client):
 
     @override
     async def tokenize(self, model: str, payload: str | Sequence[Message]) -> int:
-        import tiktoken
+        from conduit.core.model.models.tokens import token_counter
 
-        encoding = tiktoken.get_encoding("cl100k_base")
+        def count(text: str) -> int:
+            return token_counter.count(text, encoding="cl100k_base")
 
         if isinstance(payload, str):
-            return len(encoding.encode(payload))
+            return count(payload)
 
         if isinstance(payload, list):
             tokens_per_message = 3
             num_tokens = 0
             for message in payload:
                 num_tokens += tokens_per_message
-                num_tokens += len(encoding.encode(message.role.value))
+                num_tokens += count(message.role.value)
                 if isinstance(message.content, str):
-                    num_tokens += len(encoding.encode(message.content))
+                    num_tokens += count(message.content)
                 elif isinstance(message.content, list):
                     for block in message.content:
                         if hasattr(block, "text"):
-                            num_tokens += len(encoding.encode(block.text))
+                            num_tokens += count(block.text)
             num_tokens += 3  # reply primer
             return num_tokens
 
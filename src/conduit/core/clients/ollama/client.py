@@ -40,6 +40,9 @@ class OllamaClient(Client):
     Async only.
     """
 
+    provider = "ollama"
+    base_url = "http://localhost:11434/v1"
+
     def __init__(self):
         # 1. Load Ollama context sizes from the JSON file
         self._ollama_context_sizes = self._load_context_sizes()
@@ -75,7 +78,7 @@ class OllamaClient(Client):
         Raw client for standard completions, Instructor for structured responses.
         """
         raw_client = AsyncOpenAI(
-            base_url="http://localhost:11434/v1",
+            base_url=self.base_url,
             api_key="ollama",  # required by SDK but unused by Ollama
         )
         instructor_client = instructor.from_openai(
@@ -138,6 +141,8 @@ class OllamaClient(Client):
             top_p=request.params.top_p,
             max_tokens=request.params.max_tokens,
             stream=request.params.stream,
+            # Report token usage on the final chunk so streamed calls are metered
+            stream_options={"include_usage": True} if request.params.stream else None,
             extra_body=filtered_extra if filtered_extra else None,
             logprobs=client_params.get("logprobs"),
             response_format=response_format,
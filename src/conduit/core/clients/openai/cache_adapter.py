@@ -0,0 +1,26 @@
+from __future__ import annotations
+import hashlib
+import json
+from typing import Any
+
+
+def prompt_cache_key(
+    messages: list[dict[str, Any]], tools: list[dict[str, Any]] | None
+) -> str:
+    """
+    Routing key for OpenAI's automatic prefix cache, derived from the stable
+    prefix (system prompt and tools). Requests sharing a key are routed to the
+    same cache, which raises hit rates when many prefixes are in flight.
+    """
+    system = [m.get("content") for m in messages if m.get("role") in ("system", "developer")]
+    prefix = json.dumps([system, tools or []], sort_keys=True, default=str)
+    return "conduit-" + hashlib.blake2b(prefix.encode(), digest_size=12).hexdigest()
+
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """
+    Cached prompt tokens from an OpenAI-compatible usage block (OpenAI, Gemini).
+    These are a subset of prompt_tokens, not in addition to them.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) or 0
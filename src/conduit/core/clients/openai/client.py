@@ -2,6 +2,10 @@ from __future__ import annotations
 from conduit.core.clients.client_base import Client
 from conduit.core.clients.payload_base import Payload
 from conduit.core.clients.openai.payload import OpenAIPayload
+from conduit.core.clients.openai.cache_adapter import (
+    cached_prompt_tokens,
+    prompt_cache_key,
+)
 from conduit.core.clients.openai.message_adapter import convert_message_to_openai
 from conduit.core.clients.openai.tool_adapter import convert_tool_to_openai
 from conduit.core.clients.openai.audio_params import OpenAIAudioParams
@@ -40,6 +44,9 @@ class OpenAIClient(Client, ABC):
     Async by default.
     """
 
+    provider = "openai"
+    api_key_env = "OPENAI_API_KEY"
+
     @cached_property
     def async_client(self) -> AsyncOpenAI:
         """
@@ -105,9 +112,16 @@ class OpenAIClient(Client, ABC):
             top_p=request.params.top_p,
             max_tokens=request.params.max_tokens,
             stream=request.params.stream,
+            # Report token usage on the final chunk so streamed calls are metered
+            stream_options={"include_usage": True} if request.params.stream else None,
             tools=final_tools,
             parallel_tool_calls=parallel_tool_calls,
         )
+        # OpenAI caches long prefixes automatically; the key just improves routing
+        if request.options.prompt_caching is not None:
+            openai_payload.prompt_cache_key = prompt_cache_key(
+                converted_messages, final_tools
+            )
         return openai_payload
 
     # Tokenization
@@ -121,11 +135,14 @@ class OpenAIClient(Client, ABC):
         - Images: 85 tokens (low detail) or 765 tokens (high/auto detail estimate).
         - Tool Calls: Counts function name + serialized JSON arguments.
         """
-        encoding = self._get_encoding(model)
+        from conduit.core.model.models.tokens import token_counter
+
+        def count(text: str) -> int:
+            return token_counter.count(text, model=model)
 
         # CASE 1: Raw String
         if isinstance(payload, str):
-            return len(encoding.encode(payload))
+            return count(payload)
 
         # CASE 2: Message History (ChatML)
         elif isinstance(payload, list):
@@ -147,12 +164,12 @@ class OpenAIClient(Client, ABC):
                     if hasattr(message.role, "value")
                     else str(message.role)
                 )
-                num_tokens += len(encoding.encode(role_str))
+                num_tokens += count(role_str)
 
                 # 2. Content (Text or Multimodal)
                 if message.content:
                     if isinstance(message.content, str):
-                        num_tokens += len(encoding.encode(message.content))
+                        num_tokens += count(message.content)
                     elif isinstance(message.content, list):
                         for block in message.content:
                             # We use hasattr/getattr to support both Pydantic objects and dicts
@@ -161,7 +178,7 @@ class OpenAIClient(Client, ABC):
                             # Text Block
                             if block_type == "text":
                                 text = getattr(block, "text", "")
-                                num_tokens += len(encoding.encode(text))
+                                num_tokens += count(text)
 
                             # Image Block (Estimation)
                             elif block_type == "image_url":
@@ -179,16 +196,16 @@ class OpenAIClient(Client, ABC):
                 if hasattr(message, "tool_calls") and message.tool_calls:
                     for call in message.tool_calls:
                         # Function name
-                        num_tokens += len(encoding.encode(call.function_name))
+                        num_tokens += count(call.function_name)
                         # Arguments (JSON string)
                         # We dump the dict to a string to estimate tokens
                         args_str = json.dumps(call.arguments)
-                        num_tokens += len(encoding.encode(args_str))
+                        num_tokens += count(args_str)
 
                 # 4. Name (Optional override)
                 if hasattr(message, "name") and message.name:
                     num_tokens += tokens_per_name
-                    num_tokens += len(encoding.encode(message.name))
+                    num_tokens += count(message.name)
 
             # Add reply primer: <|start|>assistant<|message|>
             num_tokens += tokens_reply_primer
@@ -196,14 +213,6 @@ class OpenAIClient(Client, ABC):
 
         raise ValueError("Payload must be string or Sequence[Message]")
 
-    def _get_encoding(self, model: str):
-        import tiktoken
-
-        try:
-            return tiktoken.encoding_for_model(model)
-        except KeyError:
-            return tiktoken.get_encoding("cl100k_base")
-
     def discover_models(self) -> list[str]:
         import openai
 
@@ -266,6 +275,7 @@ class OpenAIClient(Client, ABC):
         model_stem = result.model
         input_tokens = result.usage.prompt_tokens
         output_tokens = result.usage.completion_tokens
+        cache_read_tokens = cached_prompt_tokens(result.usage)
 
         # Determine stop reason
         stop_reason = StopReason.STOP
@@ -313,6 +323,7 @@ class OpenAIClient(Client, ABC):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            cache_read_tokens=cache_read_tokens,
         )
 
         # Create and return Response
@@ -570,6 +581,7 @@ class OpenAIClient(Client, ABC):
         model_stem = completion.model
         input_tokens = completion.usage.prompt_tokens
         output_tokens = completion.usage.completion_tokens
+        cache_read_tokens = cached_prompt_tokens(completion.usage)
 
         # Determine stop reason
         stop_reason = StopReason.STOP
@@ -606,6 +618,7 @@ class OpenAIClient(Client, ABC):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            cache_read_tokens=cache_read_tokens,
         )
 
         # Create and return Response
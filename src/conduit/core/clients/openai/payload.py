@@ -21,6 +21,7 @@ class OpenAIPayload(BaseModel):
     max_tokens: int | None = None
     max_completion_tokens: int | None = None
     stream: bool | None = None
+    stream_options: dict[str, Any] | None = None
     frequency_penalty: float | None = Field(default=None, ge=-2.0, le=2.0)
     presence_penalty: float | None = Field(default=None, ge=-2.0, le=2.0)
     logit_bias: dict[str, float] | None = None
@@ -33,3 +34,6 @@ class OpenAIPayload(BaseModel):
     tools: list[dict[str, Any]] | None = None
     tool_choice: str | dict[str, Any] | None = None
     parallel_tool_calls: bool | None = None
+
+    # Caching
+    prompt_cache_key: str | None = None
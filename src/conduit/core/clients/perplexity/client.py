@@ -35,6 +35,10 @@ class PerplexityClient(Client):
     Async only.
     """
 
+    provider = "perplexity"
+    base_url = "https://api.perplexity.ai"
+    api_key_env = "PERPLEXITY_API_KEY"
+
     def __init__(self):
         instructor_client, raw_client = self._initialize_client()
         self._client: Instructor = instructor_client
@@ -48,7 +52,7 @@ class PerplexityClient(Client):
         """
         raw_client = AsyncOpenAI(
             api_key=self._get_api_key(),
-            base_url="https://api.perplexity.ai",
+            base_url=self.base_url,
         )
         instructor_client = instructor.from_perplexity(raw_client)
         return instructor_client, raw_client
@@ -112,16 +116,17 @@ class PerplexityClient(Client):
         Return the token count for a string, per model's tokenization function.
         cl100k_base is good enough for Perplexity approximation.
         """
-        import tiktoken
+        from conduit.core.model.models.tokens import token_counter
 
         # Perplexity models are often Llama-based, but cl100k_base is the
         # standard fallback for OpenAI-compatible APIs in Python without
         # heavy `transformers` dependencies.
-        encoding = tiktoken.get_encoding("cl100k_base")
+        def count(text: str) -> int:
+            return token_counter.count(text, encoding="cl100k_base")
 
         # CASE 1: Raw String
         if isinstance(payload, str):
-            return len(encoding.encode(payload))
+            return count(payload)
 
         # CASE 2: Message History
         if isinstance(payload, list):
@@ -133,7 +138,7 @@ class PerplexityClient(Client):
                 num_tokens += tokens_per_message
 
                 # Role
-                num_tokens += len(encoding.encode(message.role.value))
+                num_tokens += count(message.role.value)
 
                 # Content
                 # Perplexity generally only handles Text.
@@ -159,7 +164,7 @@ class PerplexityClient(Client):
                 else:
                     content_str = str(message.content)
 
-                num_tokens += len(encoding.encode(content_str))
+                num_tokens += count(content_str)
 
             num_tokens += 3  # reply primer
             return num_tokens
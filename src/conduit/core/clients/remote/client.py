@@ -75,7 +75,7 @@ class RemoteClient(Client):
         """
         from conduit.core.model.models.modelstore import ModelStore
 
-        if model_name in ModelStore.cloud_models():
+        if ModelStore.is_cloud_model(model_name):
             logger.debug(f"Model '{model_name}' is a registered cloud model.")
             return True
         else:
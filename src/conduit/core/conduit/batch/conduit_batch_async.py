@@ -1,21 +1,43 @@
 from __future__ import annotations
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Any, override
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING, override
 
 from conduit.core.conduit.conduit_async import ConduitAsync
 from conduit.core.prompt.prompt import Prompt
 from conduit.domain.conversation.conversation import Conversation
 from conduit.domain.request.generation_params import GenerationParams
 from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.request.request import GenerationRequest
+
+if TYPE_CHECKING:
+    from conduit.core.conduit.batch.rate_limiter import RateLimitScheduler
+    from conduit.storage.cache.batch_cache import AsyncBatchCache
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _PreparedItem:
+    """
+    Per-item work done once up front: the rendered prompt, and with a batch
+    cache, the prepared conversation and its first-step cache key.
+    """
+
+    rendered: str | None = None
+    conversation: Conversation | None = None
+    key: str | None = None
+
+
 class ConduitBatchAsync:
     """
     Async implementation of Batch Conduit - a stateless execution engine.
-    Handles concurrency control (semaphores) and batch strategy (Template vs String).
+    Handles concurrency control (adaptive per-model rate limiting, or a flat
+    semaphore) and batch strategy (Template vs String).
     """
 
     def __init__(self, prompt: Prompt | None = None):
@@ -31,7 +53,9 @@ class ConduitBatchAsync:
         params: GenerationParams,
         options: ConduitOptions,
         max_concurrent: int | None = None,
-    ) -> list[Conversation]:
+        scheduler: RateLimitScheduler | None = None,
+        partial: bool = False,
+    ) -> list[Conversation] | list[Conversation | Exception]:
         """
         Execute the batch asynchronously.
 
@@ -40,11 +64,61 @@ class ConduitBatchAsync:
             prompt_strings_list: List of pre-rendered strings (Mode 2).
             params: Fully resolved generation parameters.
             options: Fully resolved conduit options.
-            max_concurrent: Limit on concurrent tasks.
+            max_concurrent: Fixed limit on concurrent tasks. When omitted, calls go
+                through an adaptive RateLimitScheduler instead.
+            scheduler: Scheduler to use (e.g. one configured with RPM/TPM limits);
+                shared across runs it keeps what it learned about each provider.
+            partial: Return failed items as their exception instead of raising
+                the first failure (which cancels the rest of the batch).
 
         Returns:
             list[Conversation]: Results in the same order as inputs.
         """
+        total = len(input_variables_list or prompt_strings_list or [])
+        results: list[Conversation | Exception | None] = [None] * total
+
+        stream = self.run_iter(
+            input_variables_list,
+            prompt_strings_list,
+            params,
+            options,
+            max_concurrent=max_concurrent,
+            scheduler=scheduler,
+        )
+        try:
+            async for index, result in stream:
+                if isinstance(result, Exception) and not partial:
+                    raise result
+                results[index] = result
+        finally:
+            await stream.aclose()
+
+        return results  # type: ignore[return-value]
+
+    async def run_iter(
+        self,
+        input_variables_list: list[dict[str, Any]] | None,
+        prompt_strings_list: list[str] | None,
+        params: GenerationParams,
+        options: ConduitOptions,
+        max_concurrent: int | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        window: int | None = None,
+    ) -> AsyncIterator[tuple[int, Conversation | Exception]]:
+        """
+        Execute the batch, yielding (index, Conversation | Exception) as each item
+        completes, so results can be processed or persisted while the batch runs.
+        A failed item is yielded as its exception; the rest of the batch carries on.
+
+        Args:
+            input_variables_list, prompt_strings_list, params, options,
+            max_concurrent, scheduler: As for run().
+            window: Max items in flight (tasks created, cache keys prefetched).
+                Items are started lazily as earlier ones complete, so memory is
+                bounded by the window rather than the batch size.
+
+        Closing the iterator early cancels everything still in flight.
+        """
         # 1. Validate Mode
         if input_variables_list and prompt_strings_list:
             raise ValueError(
@@ -65,51 +139,220 @@ class ConduitBatchAsync:
         from conduit.storage.db_manager import db_manager
         await db_manager.get_pool()
 
-        # 2. Setup Concurrency
-        semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        # 2. Setup Concurrency: an explicit max_concurrent keeps the flat semaphore
+        semaphore = None
+        if scheduler is None and max_concurrent:
+            semaphore = asyncio.Semaphore(max_concurrent)
+        elif scheduler is None:
+            from conduit.core.conduit.batch.rate_limiter import RateLimitScheduler
 
-        # 3. Create Tasks
-        tasks = []
+            scheduler = RateLimitScheduler()
+        window = window or max(
+            max_concurrent or 0, scheduler.max_concurrency if scheduler else 0
+        )
 
+        # 3. Resolve (conduit, input_variables) pairs, lazily
         if input_variables_list:
             # Mode 1: Template mode - reuse one ConduitAsync with stored prompt
             # This is efficient as we don't re-parse the template every time
             conduit = ConduitAsync(self.prompt)
-            tasks = [
-                self._maybe_with_semaphore(
-                    conduit.run(input_vars, params, options),
-                    semaphore,
-                )
-                for input_vars in input_variables_list
-            ]
-            logger.info(
-                f"Executing {len(tasks)} conversations in template mode with max_concurrent={max_concurrent or 'unlimited'}"
+            items = ((conduit, input_vars) for input_vars in input_variables_list)
+            mode, total = "template", len(input_variables_list)
+        else:
+            # Mode 2: String mode - create temporary ConduitAsync for each string
+            # run with None for variables since prompt is pre-rendered
+            items = (
+                (ConduitAsync(Prompt(prompt_str)), None)
+                for prompt_str in prompt_strings_list
             )
+            mode, total = "string", len(prompt_strings_list)
 
-        elif prompt_strings_list:
-            # Mode 2: String mode - create temporary ConduitAsync for each string
-            for prompt_str in prompt_strings_list:
-                # We create a lightweight Prompt object for each string
-                temp_conduit = ConduitAsync(Prompt(prompt_str))
-                tasks.append(
-                    self._maybe_with_semaphore(
-                        # run with None for variables since prompt is pre-rendered
-                        temp_conduit.run(None, params, options),
-                        semaphore,
-                    )
+        # 4. Run against a batch-scoped cache, resolved one window at a time
+        batch_cache = self._batch_cache(options)
+        if batch_cache is not None:
+            options = options.model_copy(update={"cache": batch_cache})
+
+        logger.info(
+            f"Executing {total} conversations in {mode} mode with "
+            f"max_concurrent={max_concurrent or 'adaptive'}, window={window}"
+        )
+
+        # 5. Keep at most `window` tasks in flight; yield each as it completes
+        in_flight: dict[asyncio.Task, tuple[int, str | None]] = {}
+        indexed = enumerate(items)
+        try:
+            while chunk := list(itertools.islice(indexed, window)):
+                prepared = await self._prepare_chunk(batch_cache, chunk, params, options)
+                # Cache hits never reach the provider, so they skip the limiter
+                scheduled = [
+                    scheduler is not None
+                    and not (batch_cache is not None and batch_cache.is_hit(item.key))
+                    for item in prepared
+                ]
+                estimates = await self._estimate_tokens(
+                    prepared, scheduled, params, scheduler
                 )
-            logger.info(
-                f"Executing {len(tasks)} conversations in string mode with max_concurrent={max_concurrent or 'unlimited'}"
-            )
+                for (index, (conduit, input_vars)), item, is_scheduled, tokens in zip(
+                    chunk, prepared, scheduled, estimates, strict=True
+                ):
+                    if len(in_flight) >= window:
+                        for result in await self._harvest(in_flight, batch_cache, window):
+                            yield result
+                    run_item = functools.partial(
+                        self._run_item, conduit, input_vars, item, params, options
+                    )
+                    if is_scheduled:
+                        coroutine = scheduler.submit(params.model, run_item, tokens)
+                    else:
+                        coroutine = self._maybe_with_semaphore(run_item(), semaphore)
+                    in_flight[asyncio.create_task(coroutine)] = (index, item.key)
 
-        # 4. Execute
-        conversations = await asyncio.gather(*tasks, return_exceptions=False)
+            while in_flight:
+                for result in await self._harvest(in_flight, batch_cache, window):
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            # Write back remaining cache misses as one bulk upsert
+            if batch_cache is not None:
+                await batch_cache.flush()
 
         # Flush telemetry once for the whole batch
         from conduit.config import settings
         await settings.odometer_registry().flush()
 
-        return list(conversations)
+    async def _harvest(
+        self,
+        in_flight: dict[asyncio.Task, tuple[int, str | None]],
+        batch_cache: AsyncBatchCache | None,
+        window: int,
+    ) -> list[tuple[int, Conversation | Exception]]:
+        """
+        Wait for at least one in-flight task and collect everything that finished.
+        """
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        results = []
+        for task in done:
+            index, key = in_flight.pop(task)
+            error = task.exception()
+            if error is not None and not isinstance(error, Exception):
+                raise error  # KeyboardInterrupt and friends are not per-item failures
+            results.append((index, error if error is not None else task.result()))
+            if batch_cache is not None:
+                batch_cache.discard(key)
+
+        # Bound buffered cache writes by the window as well
+        if batch_cache is not None and batch_cache.pending_writes >= window:
+            await batch_cache.flush()
+        return sorted(results, key=lambda result: result[0])
+
+    def _batch_cache(self, options: ConduitOptions) -> AsyncBatchCache | None:
+        """
+        Batch-scoped view of the configured cache, or None when the cache can't
+        batch (or persistence makes conversations stateful).
+        """
+        from conduit.storage.cache.protocol import BatchConduitCache
+        from conduit.storage.cache.batch_cache import AsyncBatchCache
+
+        if options.cache is None or not options.use_cache:
+            return None
+        if not isinstance(options.cache, BatchConduitCache):
+            return None
+        # With a repository, each run resumes the last stored conversation,
+        # so first-step requests can't be known up front.
+        if options.repository is not None:
+            return None
+        return AsyncBatchCache(options.cache)
+
+    async def _prepare_chunk(
+        self,
+        batch_cache: AsyncBatchCache | None,
+        chunk: list[tuple[int, tuple[ConduitAsync, dict[str, Any] | None]]],
+        params: GenerationParams,
+        options: ConduitOptions,
+    ) -> list[_PreparedItem]:
+        """
+        Render every item in the chunk once. With a batch cache, also prepare its
+        conversation, compute its first-step cache key, and resolve all the keys
+        in one query. An item that fails to render reports its error when it runs.
+        """
+        prepared: list[_PreparedItem] = []
+        for _, (conduit, input_vars) in chunk:
+            item = _PreparedItem()
+            prepared.append(item)
+            try:
+                item.rendered = conduit._render_prompt(input_vars)
+            except Exception:
+                continue
+            if batch_cache is None:
+                continue
+            item.conversation = await conduit._prepare_conversation(
+                item.rendered, params, options
+            )
+            request = GenerationRequest.from_conversation(
+                item.conversation, params, options
+            )
+            item.key = request.generate_cache_key()
+
+        if batch_cache is not None:
+            await batch_cache.prefetch(
+                [item.key for item in prepared if item.key is not None]
+            )
+        return prepared
+
+    async def _estimate_tokens(
+        self,
+        prepared: list[_PreparedItem],
+        scheduled: list[bool],
+        params: GenerationParams,
+        scheduler: RateLimitScheduler | None,
+    ) -> list[int]:
+        """
+        Estimated tokens for each scheduled item in the chunk, counted in one
+        batch off the event loop (0 for the rest).
+        """
+        tokens = [0] * len(prepared)
+        if scheduler is None:
+            return tokens
+
+        positions = [
+            position
+            for position, item in enumerate(prepared)
+            if scheduled[position] and item.rendered is not None
+        ]
+        if positions:
+            estimates = await asyncio.to_thread(
+                scheduler.estimate_tokens,
+                params.model,
+                [prepared[position].rendered for position in positions],
+                params.max_tokens,
+            )
+            for position, estimate in zip(positions, estimates, strict=True):
+                tokens[position] = estimate
+        return tokens
+
+    @staticmethod
+    async def _run_item(
+        conduit: ConduitAsync,
+        input_variables: dict[str, Any] | None,
+        item: _PreparedItem,
+        params: GenerationParams,
+        options: ConduitOptions,
+    ) -> Conversation:
+        """
+        Run one item from what _prepare_chunk already did. The prepared
+        conversation is used once; a retried attempt prepares a fresh one.
+        """
+        if item.rendered is None:
+            # Rendering failed up front: run() raises the error for this item
+            return await conduit.run(input_variables, params, options)
+        conversation, item.conversation = item.conversation, None
+        if conversation is None:
+            conversation = await conduit._prepare_conversation(
+                item.rendered, params, options
+            )
+        return await conduit._run_prepared(conversation, params, options)
 
     async def _maybe_with_semaphore(
         self,
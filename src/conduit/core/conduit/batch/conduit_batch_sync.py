@@ -1,6 +1,7 @@
 from __future__ import annotations
 import asyncio
 import logging
+from collections.abc import Iterator
 from typing import Any, TYPE_CHECKING, override
 
 from conduit.config import settings
@@ -13,6 +14,7 @@ from conduit.utils.concurrency.warn import _warn_if_loop_exists
 
 if TYPE_CHECKING:
     from rich.console import Console
+    from conduit.core.conduit.batch.rate_limiter import RateLimitScheduler
     from conduit.utils.progress.verbosity import Verbosity
 
 logger = logging.getLogger(__name__)
@@ -60,18 +62,22 @@ class ConduitBatchSync:
         prompt_strings_list: list[str] | None = None,
         *,
         max_concurrent: int | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        partial: bool = False,
         cached: bool | None = None,
         persist: bool | None = None,
         verbosity: Verbosity | None = None,
         param_overrides: dict[str, Any] | None = None,
-    ) -> list[Conversation]:
+    ) -> list[Conversation] | list[Conversation | Exception]:
         """
         Execute batch processing synchronously.
 
         Args:
             input_variables_list: List of input variable dicts (requires Prompt).
             prompt_strings_list: List of pre-rendered prompt strings.
-            max_concurrent: Max concurrent requests (for rate limiting).
+            max_concurrent: Fixed max concurrent requests; omit for adaptive rate limiting.
+            scheduler: RateLimitScheduler with per-provider/model RPM/TPM limits.
+            partial: Return failed items as exceptions instead of raising.
             cached: Per-call override for caching.
             persist: Per-call override for persistence.
             verbosity: Per-call override for logging.
@@ -96,9 +102,64 @@ class ConduitBatchSync:
                 params=effective_params,
                 options=effective_options,
                 max_concurrent=max_concurrent,
+                scheduler=scheduler,
+                partial=partial,
             )
         )
 
+    def run_iter(
+        self,
+        input_variables_list: list[dict[str, Any]] | None = None,
+        prompt_strings_list: list[str] | None = None,
+        *,
+        max_concurrent: int | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        window: int | None = None,
+        cached: bool | None = None,
+        persist: bool | None = None,
+        verbosity: Verbosity | None = None,
+        param_overrides: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[int, Conversation | Exception]]:
+        """
+        Execute batch processing, yielding (index, Conversation | Exception) as
+        each item completes. See ConduitBatchAsync.run_iter.
+
+        The batch runs on one event loop that is driven between yields, so work
+        only progresses while the caller is iterating.
+        """
+        effective_params = self._build_params(param_overrides)
+        effective_options = self._build_options(
+            cached=cached,
+            persist=persist,
+            verbosity=verbosity,
+        )
+        stream = self._impl.run_iter(
+            input_variables_list,
+            prompt_strings_list,
+            effective_params,
+            effective_options,
+            max_concurrent=max_concurrent,
+            scheduler=scheduler,
+            window=window,
+        )
+
+        async def next_result() -> tuple[int, Conversation | Exception] | None:
+            return await anext(stream, None)
+
+        async def close() -> None:
+            await stream.aclose()
+
+        _warn_if_loop_exists()
+        with asyncio.Runner() as runner:
+            try:
+                while (result := runner.run(next_result())) is not None:
+                    yield result
+            except KeyboardInterrupt:
+                logger.warning("Batch operation cancelled by user.")
+                raise
+            finally:
+                runner.run(close())
+
     # Factory
     @classmethod
     def create(
@@ -0,0 +1,284 @@
+"""
+Adaptive, per-model rate limiting for batch runs.
+
+A flat semaphore either underuses a provider or trips its rate limits, and the
+right number differs per provider (and per model) in a mixed batch. Instead,
+each (provider, model) pair gets an AdaptiveLimiter that enforces:
+
+- optional requests-per-minute and tokens-per-minute budgets (sliding 60s window),
+  with tokens estimated up front by the local TokenCounter, one batch per window
+  (never a provider count-tokens endpoint, which would add a round trip per item);
+- a concurrency window tuned by AIMD: +1/limit on every success (about +1 per
+  round trip of `limit` requests), x0.5 on a 429 / overload response, after
+  which the limiter cools down (Retry-After if the provider sent one).
+
+RateLimitScheduler owns the limiters and retries rate-limited calls, so large
+batches converge on the provider's real limit without hand-tuning max_concurrent.
+"""
+
+from __future__ import annotations
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from conduit.core.model.models.tokens import token_counter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WINDOW_SECONDS = 60.0
+# 429 = rate limited, 503 = unavailable, 529 = Anthropic "overloaded"
+RATE_LIMIT_STATUS_CODES = frozenset({429, 503, 529})
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Per-minute budgets for one provider or model. None means unbounded.
+    """
+
+    rpm: int | None = None
+    tpm: int | None = None
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """
+    If exc (or anything in its cause chain) is a rate-limit / overload response,
+    return the suggested wait in seconds (0.0 when the provider didn't say).
+    Returns None for any other error.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        status = getattr(current, "status_code", None)
+        if status in RATE_LIMIT_STATUS_CODES or type(current).__name__ in (
+            "RateLimitError",
+            "OverloadedError",
+        ):
+            response = getattr(current, "response", None)
+            headers = getattr(response, "headers", None) or {}
+            try:
+                return max(float(headers.get("retry-after", 0) or 0), 0.0)
+            except (TypeError, ValueError):
+                return 0.0
+        current = current.__cause__ or current.__context__
+    return None
+
+
+class _SlidingWindow:
+    """
+    Amount consumed over the last WINDOW_SECONDS, against a per-minute capacity.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._events: deque[tuple[float, int]] = deque()
+        self._total = 0
+
+    def _evict(self, now: float) -> None:
+        while self._events and self._events[0][0] <= now - WINDOW_SECONDS:
+            _, amount = self._events.popleft()
+            self._total -= amount
+
+    def wait_time(self, amount: int, now: float) -> float:
+        """
+        Seconds until `amount` fits. A single oversized request is let through
+        once the window is empty rather than blocking forever.
+        """
+        self._evict(now)
+        if not self._events or self._total + amount <= self.capacity:
+            return 0.0
+        freed = 0
+        for timestamp, consumed in self._events:
+            freed += consumed
+            if self._total - freed + amount <= self.capacity:
+                return timestamp + WINDOW_SECONDS - now
+        return self._events[-1][0] + WINDOW_SECONDS - now
+
+    def record(self, amount: int, now: float) -> None:
+        self._events.append((now, amount))
+        self._total += amount
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency window plus RPM/TPM budgets for one (provider, model).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: RateLimit,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 256,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.name = name
+        self.concurrency = float(initial_concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._requests = _SlidingWindow(limit.rpm) if limit.rpm else None
+        self._tokens = _SlidingWindow(limit.tpm) if limit.tpm else None
+        self._cooldown_until = 0.0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        """
+        asyncio primitives are bound to one loop; a scheduler reused across
+        ConduitBatchSync runs (one loop each) gets a fresh Condition per loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    def _wait_time(self, tokens: int, now: float) -> float | None:
+        """
+        0.0 if a request can start now, seconds to wait if a budget or cooldown
+        is in the way, or None if we must wait for an in-flight request to finish.
+        """
+        if self.in_flight >= int(self.concurrency):
+            return None
+        waits = [self._cooldown_until - now]
+        if self._requests is not None:
+            waits.append(self._requests.wait_time(1, now))
+        if self._tokens is not None:
+            waits.append(self._tokens.wait_time(tokens, now))
+        return max(max(waits), 0.0)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        condition = self.condition
+        async with condition:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_time(tokens, now)
+                if wait == 0.0:
+                    break
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(condition.wait(), timeout=wait)
+            self.in_flight += 1
+            if self._requests is not None:
+                self._requests.record(1, now)
+            if self._tokens is not None:
+                self._tokens.record(tokens, now)
+
+    async def release(self, rate_limited: float | None = None) -> None:
+        """
+        Finish a request. rate_limited is retry_after() of its error, if any.
+        """
+        condition = self.condition
+        async with condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if rate_limited is None:
+                # Additive increase: roughly +1 per `concurrency` successes
+                self.concurrency = min(
+                    self.concurrency + 1 / self.concurrency, self.max_concurrency
+                )
+            elif now >= self._cooldown_until:
+                # Multiplicative decrease, once per cooldown: requests already in
+                # flight when the limit was hit will 429 too and shouldn't compound it
+                self.concurrency = max(
+                    self.concurrency * self.decrease_factor, self.min_concurrency
+                )
+                self._cooldown_until = now + (rate_limited or self.cooldown)
+                logger.info(
+                    f"{self.name} rate limited; concurrency -> {int(self.concurrency)}"
+                )
+            condition.notify_all()
+
+
+class RateLimitScheduler:
+    """
+    Routes batch calls through one AdaptiveLimiter per (provider, model).
+
+    limits maps a model name or a provider name to its RateLimit; model entries
+    take precedence. Unlisted models get AIMD concurrency control only.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] | None = None,
+        *,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 256,
+        max_retries: int = 5,
+    ):
+        self.limits = limits or {}
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._limiters: dict[tuple[str, str], AdaptiveLimiter] = {}
+
+    def limiter(self, model: str) -> AdaptiveLimiter:
+        from conduit.core.model.models.modelstore import ModelStore
+
+        provider = ModelStore.identify_provider(model)
+        key = (provider, model)
+        if key not in self._limiters:
+            limit = self.limits.get(model) or self.limits.get(provider) or RateLimit()
+            self._limiters[key] = AdaptiveLimiter(
+                f"{provider}/{model}",
+                limit,
+                initial_concurrency=min(self.initial_concurrency, self.max_concurrency),
+                max_concurrency=self.max_concurrency,
+            )
+        return self._limiters[key]
+
+    @staticmethod
+    def estimate_tokens(
+        model: str, texts: list[str], max_output_tokens: int | None = None
+    ) -> list[int]:
+        """
+        Input tokens per text, counted locally in one TokenCounter.count_batch
+        call (spread over all cores), plus the output allowance, which providers
+        count against TPM up front. Falls back to ~4 chars/token if tiktoken is
+        unavailable.
+        """
+        try:
+            input_tokens = token_counter.count_batch(texts, model=model)
+        except Exception as e:
+            logger.debug(f"Token estimate for {model} fell back to heuristic: {e}")
+            input_tokens = [len(text) // 4 + 1 for text in texts]
+        return [tokens + (max_output_tokens or 0) for tokens in input_tokens]
+
+    async def submit(
+        self, model: str, call: Callable[[], Awaitable[T]], tokens: int = 0
+    ) -> T:
+        """
+        Run call() under the model's limiter, retrying rate-limited attempts.
+        """
+        limiter = self.limiter(model)
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire(tokens)
+            try:
+                result = await call()
+            except Exception as e:
+                wait = retry_after(e)
+                await limiter.release(rate_limited=wait)
+                if wait is None or attempt == self.max_retries:
+                    raise
+                logger.debug(f"Retrying {model} after rate limit (attempt {attempt + 1})")
+                continue
+            except BaseException:
+                await limiter.release()
+                raise
+            await limiter.release()
+            return result
+        raise AssertionError("unreachable")
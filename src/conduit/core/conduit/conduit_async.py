@@ -7,7 +7,9 @@ from typing import override, TYPE_CHECKING, Any
 import logging
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from conduit.core.prompt.prompt import Prompt
+    from conduit.domain.result.stream_events import StreamEvent
 
 logger = logging.getLogger(__name__)
 
@@ -42,19 +44,64 @@ class ConduitAsync(ConduitBase):
         # 2. Prepare conversation (may load from repository)
         conversation = await self._prepare_conversation(rendered, params, options)
 
+        # 3-4. Execute and save
+        return await self._run_prepared(conversation, params, options)
+
+    async def _run_prepared(
+        self,
+        conversation: Conversation,
+        params: GenerationParams,
+        options: ConduitOptions,
+    ) -> Conversation:
+        """
+        The rest of run() for an already prepared conversation (batches prepare
+        conversations up front to derive cache keys).
+        """
         # 3. Execute via Engine
         updated_conversation = await self.pipe(conversation, params, options)
 
         # 4. Save if repository is configured
+        await self._persist(updated_conversation, options)
+
+        return updated_conversation
+
+    async def stream(
+        self,
+        input_variables: dict[str, Any] | None,
+        params: GenerationParams,
+        options: ConduitOptions,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Execute the Conduit, streaming typed events as they are produced.
+
+        Yields TextDelta / ToolCallDelta while the model generates, ResponseComplete
+        after each model call (cached and metered like run()), ToolResult for each
+        executed tool, and finally ConversationComplete once the conversation has
+        been persisted.
+
+        Args:
+            input_variables: Template variables for the prompt
+            params: Generation parameters (model, temperature, etc.)
+            options: Conduit options (cache, repository, console, etc.)
+        """
+        from conduit.domain.result.stream_events import ConversationComplete
+
+        rendered = self._render_prompt(input_variables)
+        conversation = await self._prepare_conversation(rendered, params, options)
+
+        async for event in self.pipe_stream(conversation, params, options):
+            if isinstance(event, ConversationComplete):
+                await self._persist(event.conversation, options)
+            yield event
+
+    async def _persist(self, conversation: Conversation, options: ConduitOptions) -> None:
         if options.repository:
             logger.info("Saving conversation to repository.")
-            if updated_conversation.session:
+            if conversation.session:
                 await options.repository.save_session(
-                    updated_conversation.session, name=updated_conversation.topic
+                    conversation.session, name=conversation.topic
                 )
             else:
                 logger.warning(
                     "Conversation has no session initialized; skipping persistence."
                 )
-
-        return updated_conversation
@@ -5,9 +5,13 @@ from conduit.domain.config.conduit_options import ConduitOptions
 from conduit.domain.message.message import UserMessage
 from conduit.domain.message.role import Role
 from conduit.core.prompt.prompt import Prompt
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, override
 import logging
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from conduit.domain.result.stream_events import StreamEvent
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +45,19 @@ class ConduitBase:
 
         return await Engine.run(conversation, params, options)
 
+    def pipe_stream(
+        self,
+        conversation: Conversation,
+        params: GenerationParams,
+        options: ConduitOptions,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Streaming counterpart of pipe(): yields Engine stream events.
+        """
+        from conduit.core.engine.engine import Engine
+
+        return Engine.stream(conversation, params, options)
+
     # Pure CPU helper methods
     def _render_prompt(self, input_variables: dict[str, Any] | None) -> str:
         """
@@ -55,8 +72,10 @@ class ConduitBase:
         self, rendered_prompt: str, params: GenerationParams, options: ConduitOptions
     ) -> Conversation:
         """
-        PURE CPU: Build initial conversation object.
+        Build initial conversation object.
         Load from repository if enabled and last conversation exists.
+        Trims history to the model's context window, whose size is looked up
+        (once per model) through ModelStore in a worker thread.
         Handles recovery from interrupted sessions (dangling User messages).
         """
         from conduit.storage.repository.persistence_mode import PersistenceMode
@@ -73,8 +92,6 @@ class ConduitBase:
                 if options.persistence_mode == PersistenceMode.OVERWRITE:
                     logger.info("Overwriting conversation as per persistence_mode.")
                     conversation.messages = []
-                else:
-                    conversation.prune(keep=options.max_history)
 
                 # Ensure system prompt is consistent if we loaded a conversation
                 if params.system:
@@ -106,6 +123,23 @@ class ConduitBase:
 
         # Add rendered prompt as UserMessage
         conversation.add(UserMessage(content=rendered_prompt))
+
+        # Trim history to what fits the model's context window
+        non_system = [m for m in conversation.messages if m.role != Role.SYSTEM]
+        if len(non_system) > 1:
+            from conduit.domain.conversation.context_window import ContextWindow
+
+            window = await ContextWindow.for_model(
+                params.model,
+                max_output_tokens=params.max_tokens,
+                budget=options.context_budget,
+                max_messages=options.max_history,
+            )
+            try:
+                await window.fit(conversation)
+            except Exception as e:
+                # e.g. the tokenizer couldn't be loaded; send the history as is
+                logger.warning(f"Could not fit history to the context window: {e}")
         return conversation
 
     # Abstract methods (must be implemented by subclasses)
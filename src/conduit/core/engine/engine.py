@@ -16,7 +16,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from conduit.domain.request.generation_params import GenerationParams
+    from conduit.domain.result.stream_events import StreamEvent
     from conduit.domain.config.conduit_options import ConduitOptions
 
 
@@ -56,6 +58,60 @@ class Engine:
         logger.warning(f"Engine hit max_steps ({max_steps}). returning current state.")
         return conversation
 
+    @staticmethod
+    async def stream(
+        conversation: Conversation,
+        params: GenerationParams,
+        options: ConduitOptions,
+        max_steps: int = 20,  # Safety limit for auto-looping
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Streaming counterpart of run(): same FSM, but GENERATE steps stream their
+        deltas, tool executions surface as ToolResult events, and the run ends with
+        a ConversationComplete carrying the final conversation.
+        """
+        from conduit.core.engine.generate import generate_stream
+        from conduit.domain.result.stream_events import (
+            ConversationComplete,
+            ResponseComplete,
+            ToolResult,
+        )
+
+        step_count = 0
+
+        while step_count < max_steps:
+            if not conversation.last:
+                raise EngineError("Conversation is empty.")
+
+            match conversation.state:
+                # 1. LLM Generation (streamed)
+                case ConversationState.GENERATE:
+                    async for event in generate_stream(conversation, params, options):
+                        if isinstance(event, ResponseComplete):
+                            conversation = event.conversation
+                        yield event
+
+                # 2. Tool Execution (The Loop back)
+                case ConversationState.EXECUTE:
+                    executed_from = len(conversation.messages)
+                    conversation = await Engine._execute(conversation, params, options)
+                    for message in conversation.messages[executed_from:]:
+                        yield ToolResult(message=message)
+
+                # 3. Stop Conditions
+                case ConversationState.TERMINATE:
+                    yield ConversationComplete(conversation=conversation)
+                    return
+
+                case ConversationState.INCOMPLETE:
+                    raise EngineError("Conversation is incomplete.")
+
+            step_count += 1
+
+        # If we exit the loop, we hit the limit
+        logger.warning(f"Engine hit max_steps ({max_steps}). returning current state.")
+        yield ConversationComplete(conversation=conversation)
+
     # Handlers
     @staticmethod
     async def _generate(
@@ -6,11 +6,14 @@ from __future__ import annotations
 from conduit.domain.exceptions.exceptions import EngineError
 from conduit.domain.message.message import ToolMessage
 from typing import TYPE_CHECKING
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from conduit.capabilities.tools.registry import ToolRegistry
+    from conduit.domain.message.message import ToolCall
     from conduit.domain.request.generation_params import GenerationParams
     from conduit.domain.config.conduit_options import ConduitOptions
     from conduit.domain.conversation.conversation import Conversation
@@ -27,20 +30,51 @@ async def execute(
     tool_calls = conversation.tool_calls
     if len(tool_calls) == 0:
         raise EngineError("No tool calls found in the conversation.")
-    # Execute each tool call and add the result to the conversation
+
+    # Execute the tool calls (concurrently if allowed)
     logger.debug(f"Executing {len(tool_calls)} tool calls.")
-    for index, tool_call in enumerate(tool_calls):
-        # Execute the tool call
-        logger.debug(f"Executing tool call {index + 1}/{len(tool_calls)}: {tool_call}")
-        content = await tool_registry.call_tool(tool_call)
-        tool_call_id = tool_call.id
-        name = tool_call.function_name
-        # Create a ToolMessage from the result and add it to the conversation
+    if options.parallel_tool_calls and len(tool_calls) > 1:
+        semaphore = asyncio.Semaphore(options.max_concurrent_tools)
+
+        async def run(index: int, tool_call: ToolCall) -> str:
+            async with semaphore:
+                return await _call(tool_registry, tool_call, index, len(tool_calls), options)
+
+        tasks = [
+            asyncio.create_task(run(index, tool_call))
+            for index, tool_call in enumerate(tool_calls)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # A crashing tool stops the turn, as the sequential loop would
+            for task in tasks:
+                task.cancel()
+            raise
+    else:
+        results = [
+            await _call(tool_registry, tool_call, index, len(tool_calls), options)
+            for index, tool_call in enumerate(tool_calls)
+        ]
+
+    # Add the results to the conversation in the original call order
+    for tool_call, content in zip(tool_calls, results):
         tool_message = ToolMessage.from_result(
             result=content,
-            tool_call_id=tool_call_id,
-            name=name,
+            tool_call_id=tool_call.id,
+            name=tool_call.function_name,
         )
         conversation.add(tool_message)
     logger.debug("Finished executing tool calls.")
     return conversation
+
+
+async def _call(
+    tool_registry: ToolRegistry,
+    tool_call: ToolCall,
+    index: int,
+    total: int,
+    options: ConduitOptions,
+) -> str:
+    logger.debug(f"Executing tool call {index + 1}/{total}: {tool_call}")
+    return await tool_registry.call_tool(tool_call, timeout=options.tool_timeout)
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from conduit.domain.conversation.conversation import Conversation
 from conduit.domain.result.response import GenerationResponse
 from conduit.domain.request.request import GenerationRequest
@@ -7,25 +8,16 @@ from conduit.domain.config.conduit_options import ConduitOptions
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from conduit.domain.message.message import Message
+    from conduit.domain.result.stream_events import StreamEvent
 
 
 async def generate(
     conversation: Conversation, params: GenerationParams, options: ConduitOptions
 ) -> Conversation:
-    # 1. Clone the conversation to work on it safely
-    working_conversation = conversation.model_copy(deep=True)
-
-    # 2. Ensure system prompt is correctly placed.
-    messages = working_conversation.messages
-    has_system_message = any(msg.role.value == "system" for msg in messages)
-    if not has_system_message and params.system:
-        working_conversation.ensure_system_message(params.system)
-
-    # 3. Prepare and execute the request.
-    request = GenerationRequest(
-        messages=working_conversation.messages, params=params, options=options
-    )
+    # 1-3. Branch the conversation and build the request
+    working_conversation, request = _prepare(conversation, params, options)
 
     model = ModelAsync(params.model)
     response = await model.pipe(request)
@@ -40,3 +32,42 @@ async def generate(
 
     # 5. Return the updated conversation
     return working_conversation
+
+
+async def generate_stream(
+    conversation: Conversation, params: GenerationParams, options: ConduitOptions
+) -> AsyncIterator[StreamEvent]:
+    """
+    Streaming variant of generate(): yields the model's delta events, then a
+    ResponseComplete whose `conversation` is the branched conversation with the
+    new assistant message added.
+    """
+    from conduit.domain.result.stream_events import ResponseComplete
+
+    working_conversation, request = _prepare(conversation, params, options)
+
+    model = ModelAsync(params.model)
+    async for event in model.pipe_stream(request):
+        if isinstance(event, ResponseComplete):
+            working_conversation.add(event.response.message)
+            event = event.model_copy(update={"conversation": working_conversation})
+        yield event
+
+
+def _prepare(
+    conversation: Conversation, params: GenerationParams, options: ConduitOptions
+) -> tuple[Conversation, GenerationRequest]:
+    # 1. Branch the conversation to work on it safely (shares message payloads)
+    working_conversation = conversation.fork()
+
+    # 2. Ensure system prompt is correctly placed.
+    messages = working_conversation.messages
+    has_system_message = any(msg.role.value == "system" for msg in messages)
+    if not has_system_message and params.system:
+        working_conversation.ensure_system_message(params.system)
+
+    # 3. Prepare the request.
+    request = GenerationRequest(
+        messages=working_conversation.messages, params=params, options=options
+    )
+    return working_conversation, request
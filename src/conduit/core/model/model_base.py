@@ -3,15 +3,16 @@ from conduit.domain.request.request import GenerationRequest
 from conduit.domain.request.generation_params import GenerationParams
 from conduit.domain.request.query_input import QueryInput, constrain_query_input
 from conduit.core.clients.client_base import Client
-from conduit.middleware.middleware import middleware
+from conduit.middleware.middleware import middleware, stream_middleware
 from typing import TYPE_CHECKING, override
 import logging
 
 # Load only if type checking
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
     from conduit.domain.message.message import Message
     from conduit.domain.result.result import GenerationResult
+    from conduit.domain.result.stream_events import StreamEvent
     from conduit.domain.config.conduit_options import ConduitOptions
     from conduit.core.model.modalities.audio import AudioSync, AudioAsync
     from conduit.core.model.modalities.image import ImageSync, ImageAsync
@@ -67,6 +68,16 @@ class ModelBase:
         """
         return await self.client.query(request)
 
+    @stream_middleware
+    async def pipe_stream(self, request: GenerationRequest) -> AsyncIterator[StreamEvent]:
+        """
+        Streaming delegation point - asks the client for a raw stream.
+        The request keeps stream=False so streamed and non-streamed calls share cache keys;
+        only the copy handed to the client is flipped to stream=True.
+        """
+        params = request.params.model_copy(update={"stream": True})
+        return await self.client.query(request.model_copy(update={"params": params}))
+
     # Helper methods
     def _prepare_request(
         self, query_input: QueryInput, params: GenerationParams, options: ConduitOptions
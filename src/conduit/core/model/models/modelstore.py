@@ -9,11 +9,13 @@ from conduit.config import settings
 from conduit.core.model.models.providerstore import ProviderStore
 from conduit.core.model.models.provider import Provider
 from conduit.core.clients.client_base import Client
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, TYPE_CHECKING
 import json
 import itertools
 import logging
+import os
 from rich.console import RenderableType
 
 if TYPE_CHECKING:
@@ -26,33 +28,96 @@ DIR_PATH = Path(__file__).parent
 MODELS_PATH = DIR_PATH / "models.json"
 ALIASES_PATH = DIR_PATH / "aliases.json"
 
+LOCAL_PROVIDERS = ("ollama", "local")
 
-class ModelStore:
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@dataclass(frozen=True)
+class _ModelRegistry:
     """
-    Class to manage model information for the Conduit library.
-    Provides methods to retrieve supported models, aliases, and validate model names.
+    Parsed snapshot of models.json, aliases.json and the Ollama cache, indexed for O(1) lookups.
     """
 
+    mtimes: tuple[int | None, ...]
+    models: dict[str, list[str]]
+    aliases: dict[str, str]
+    provider_by_model: dict[str, str]
+    cloud_models: frozenset[str]
+
     @classmethod
-    def models(cls) -> dict[str, list[str]]:
-        """
-        Definitive list of models supported by Conduit library, as well as the local list of ollama models.
-        """
+    def load(cls, ollama_path: Path, mtimes: tuple[int | None, ...]) -> _ModelRegistry:
         with open(MODELS_PATH) as f:
             models_json = json.load(f)
 
-        ollama_path = settings.paths["OLLAMA_MODELS_PATH"]
         if ollama_path.exists():
             from conduit.core.clients.ollama.server_registry import all_cached_models
 
             models_json["ollama"] = all_cached_models(ollama_path)
 
-        return models_json
+        with open(ALIASES_PATH) as f:
+            aliases = json.load(f)
+
+        # First provider listing a model wins, matching the old linear scan
+        provider_by_model: dict[str, str] = {}
+        for provider, model_list in models_json.items():
+            for model in model_list:
+                provider_by_model.setdefault(model, provider)
+
+        cloud_models = frozenset(
+            model
+            for provider, model_list in models_json.items()
+            if provider not in LOCAL_PROVIDERS
+            for model in model_list
+        )
+        return cls(
+            mtimes=mtimes,
+            models=models_json,
+            aliases=aliases,
+            provider_by_model=provider_by_model,
+            cloud_models=cloud_models,
+        )
+
+
+class ModelStore:
+    """
+    Class to manage model information for the Conduit library.
+    Provides methods to retrieve supported models, aliases, and validate model names.
+    """
+
+    _registry_snapshot: _ModelRegistry | None = None
+
+    @classmethod
+    def _registry(cls) -> _ModelRegistry:
+        """
+        In-memory registry, reloaded only when one of the backing files changes on disk.
+        """
+        ollama_path = settings.paths["OLLAMA_MODELS_PATH"]
+        mtimes = (_mtime(MODELS_PATH), _mtime(ALIASES_PATH), _mtime(ollama_path))
+        registry = cls._registry_snapshot
+        if registry is None or registry.mtimes != mtimes:
+            logger.debug("Loading model registry from disk.")
+            registry = _ModelRegistry.load(ollama_path, mtimes)
+            cls._registry_snapshot = registry
+        return registry
+
+    @classmethod
+    def models(cls) -> dict[str, list[str]]:
+        """
+        Definitive list of models supported by Conduit library, as well as the local list of ollama models.
+        """
+        models = cls._registry().models
+        return {provider: list(model_list) for provider, model_list in models.items()}
 
     @classmethod
     def list_models(cls) -> list[str]:
         """List of all models supported by Conduit library."""
-        models = cls.models()
+        models = cls._registry().models
         return list(itertools.chain.from_iterable(models.values()))
 
     @classmethod
@@ -83,37 +148,37 @@ class ModelStore:
         models — all cloud providers are always registered, so anything not in the
         registry is a locally-hosted Ollama model (possibly on a remote server).
         """
-        models = cls.models()
-        for provider, model_list in models.items():
-            if model in model_list:
-                return provider
-        return "ollama"
+        return cls._registry().provider_by_model.get(model, "ollama")
 
     @classmethod
     def local_models(cls) -> list[str]:
         """List of all locally hosted models supported by Conduit library."""
-        models = cls.models()
+        models = cls._registry().models
         local_models = []
         for provider, model_list in models.items():
-            if provider in ["ollama", "local"]:
+            if provider in LOCAL_PROVIDERS:
                 local_models.extend(model_list)
         return local_models
 
     @classmethod
     def cloud_models(cls) -> list[str]:
         """List of all cloud-hosted models supported by Conduit library."""
-        models = cls.models()
+        models = cls._registry().models
         cloud_models: list[str] = []
         for provider, model_list in models.items():
-            if provider not in ["ollama", "local"]:
+            if provider not in LOCAL_PROVIDERS:
                 cloud_models.extend(model_list)
         return cloud_models
 
+    @classmethod
+    def is_cloud_model(cls, model: str) -> bool:
+        """Check whether a model is hosted by a cloud provider."""
+        return model in cls._registry().cloud_models
+
     @classmethod
     def aliases(cls) -> dict[str, str]:
         """Definitive list of model aliases supported by Conduit library."""
-        with open(ALIASES_PATH) as f:
-            return json.load(f)
+        return dict(cls._registry().aliases)
 
     @classmethod
     def is_supported(cls, model: str) -> bool:
@@ -121,9 +186,8 @@ class ModelStore:
         Check if the model is supported by the Conduit library.
         Returns True if the model is supported, False otherwise.
         """
-        in_aliases = model in cls.aliases().keys()
-        in_models = model in list(itertools.chain.from_iterable(cls.models().values()))
-        return in_aliases or in_models
+        registry = cls._registry()
+        return model in registry.aliases or model in registry.provider_by_model
 
     @classmethod
     def validate_model(cls, model: str) -> str:
@@ -131,14 +195,10 @@ class ModelStore:
         Validate the model name against the supported models and aliases.
         Converts aliases to their corresponding model names if necessary.
         """
-        # Load aliases
-        aliases = cls.aliases()
-        # Assign models based on aliases
-        if model in cls.aliases().keys():
-            model = aliases[model]
-            return model
-        elif cls.is_supported(model):
-            model = model
+        registry = cls._registry()
+        if model in registry.aliases:
+            return registry.aliases[model]
+        elif model in registry.provider_by_model:
             return model
         else:
             raise ValueError(
@@ -321,14 +381,13 @@ class ModelStore:
     ) -> Client:
         """
         Get the client for a specific model.
+        SDK clients come from the process-wide ClientPool, so repeated calls share
+        one HTTP connection pool per (provider, base URL, API key).
         """
         try:
             model_name = cls.validate_model(model_name)
         except ValueError:
             pass  # unknown to local registry — fall through to Ollama as default
-        from conduit.core.model.models.modelstore import ModelStore
-
-        model_list = ModelStore.models()
         # Handle remote execution mode first
         if execution_mode == "remote":
             from conduit.core.clients.remote.client import RemoteClient
@@ -336,35 +395,34 @@ class ModelStore:
             return RemoteClient(model_name)
 
         # Now all sync / async modes
-        if model_name in model_list["anthropic"]:
-            from conduit.core.clients.anthropic.client import AnthropicClient
+        from conduit.core.clients.client_pool import client_pool
 
-            return AnthropicClient()
-        elif model_name in model_list["google"]:
-            from conduit.core.clients.google.client import GoogleClient
+        match cls.identify_provider(model_name):
+            case "anthropic":
+                from conduit.core.clients.anthropic.client import AnthropicClient
 
-            return GoogleClient()
-        elif model_name in model_list["ollama"]:
-            from conduit.core.clients.ollama.client import OllamaClient
+                return client_pool.get(AnthropicClient)
+            case "google":
+                from conduit.core.clients.google.client import GoogleClient
 
-            return OllamaClient()
-        elif model_name in model_list["perplexity"]:
-            from conduit.core.clients.perplexity.client import PerplexityClient
+                return client_pool.get(GoogleClient)
+            case "perplexity":
+                from conduit.core.clients.perplexity.client import PerplexityClient
 
-            return PerplexityClient()
-        elif model_name in model_list["mistral"]:
-            from conduit.core.clients.mistral.client import MistralClient
+                return client_pool.get(PerplexityClient)
+            case "mistral":
+                from conduit.core.clients.mistral.client import MistralClient
 
-            return MistralClient()
-        elif model_name in model_list["openai"]:
-            from conduit.core.clients.openai.client import OpenAIClient
+                return client_pool.get(MistralClient)
+            case "openai":
+                from conduit.core.clients.openai.client import OpenAIClient
 
-            return OpenAIClient()
-        else:
-            # Model not in any known provider list — assume local Ollama
-            from conduit.core.clients.ollama.client import OllamaClient
+                return client_pool.get(OpenAIClient)
+            case _:
+                # Ollama, or not in any known provider list — assume local Ollama
+                from conduit.core.clients.ollama.client import OllamaClient
 
-            return OllamaClient()
+                return client_pool.get(OllamaClient)
 
     ## Get subsets of models by provider
     @classmethod
@@ -22,8 +22,170 @@ Example usage:
     hf_tokens = hf_tokenizer.count_tokens("Hello, world!")
 """
 
+from __future__ import annotations
 import abc
+import hashlib
+import logging
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tiktoken import Encoding
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+COUNT_CACHE_SIZE = 100_000
+
+
+def _load_encoding(name: str) -> Encoding:
+    import tiktoken
+
+    logger.info(f"Loading tiktoken encoding '{name}'")
+    return tiktoken.get_encoding(name)
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class TokenCounter:
+    """
+    Process-wide token counting with tiktoken.
+
+    - Encoders are loaded once per encoding (model family) and shared.
+    - Counts are kept in an LRU keyed by (encoding, hash of the text), so
+      re-counting the same prompt, chunk or message is a dict lookup.
+    - count_batch() encodes cache misses with tiktoken's encode_ordinary_batch,
+      which spreads the work over a thread pool (tiktoken releases the GIL).
+
+    Special tokens are counted as ordinary text, so user text containing e.g.
+    "<|endoftext|>" is counted rather than rejected.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = COUNT_CACHE_SIZE,
+        num_threads: int | None = None,
+        loader: Callable[[str], Encoding] = _load_encoding,
+    ):
+        self.cache_size = cache_size
+        self.num_threads = num_threads or os.cpu_count() or 1
+        self._loader = loader
+        self._encodings: dict[str, Encoding] = {}
+        self._counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Encoders
+    def encoding(self, name: str = DEFAULT_ENCODING) -> Encoding:
+        """The tiktoken encoding called name, loaded once per process."""
+        encoding = self._encodings.get(name)
+        if encoding is None:
+            with self._lock:
+                encoding = self._encodings.get(name)
+                if encoding is None:
+                    encoding = self._encodings[name] = self._loader(name)
+        return encoding
+
+    def encoding_for_model(self, model: str, fallback: str = DEFAULT_ENCODING) -> Encoding:
+        return self.encoding(encoding_name_for_model(model, fallback))
+
+    def _resolve(self, model: str | None, encoding: str | None, fallback: str) -> str:
+        if encoding is not None:
+            return encoding
+        if model is not None:
+            return encoding_name_for_model(model, fallback)
+        return fallback
+
+    # Counting
+    def count(
+        self,
+        text: str,
+        model: str | None = None,
+        encoding: str | None = None,
+        fallback: str = DEFAULT_ENCODING,
+    ) -> int:
+        """
+        Number of tokens in text, for model (or an explicit encoding name).
+        Models tiktoken doesn't know fall back to the fallback encoding.
+        """
+        name = self._resolve(model, encoding, fallback)
+        key = (name, _text_key(text))
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                return cached
+        count = len(self.encoding(name).encode_ordinary(text))
+        self._store({key: count})
+        return count
+
+    def count_batch(
+        self,
+        texts: Sequence[str],
+        model: str | None = None,
+        encoding: str | None = None,
+        fallback: str = DEFAULT_ENCODING,
+    ) -> list[int]:
+        """
+        Token counts for many texts. Cached and duplicate texts are encoded once;
+        the rest are encoded in parallel.
+        """
+        name = self._resolve(model, encoding, fallback)
+        keys = [(name, _text_key(text)) for text in texts]
+        counts: dict[tuple[str, bytes], int] = {}
+        misses: dict[tuple[str, bytes], str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts, strict=True):
+                cached = self._counts.get(key)
+                if cached is not None:
+                    self._counts.move_to_end(key)
+                    counts[key] = cached
+                else:
+                    misses[key] = text
+
+        if misses:
+            encoded = self.encoding(name).encode_ordinary_batch(
+                list(misses.values()), num_threads=self.num_threads
+            )
+            fresh = {
+                key: len(tokens) for key, tokens in zip(misses, encoded, strict=True)
+            }
+            self._store(fresh)
+            counts.update(fresh)
+
+        return [counts[key] for key in keys]
+
+    def _store(self, counts: dict[tuple[str, bytes], int]) -> None:
+        with self._lock:
+            self._counts.update(counts)
+            for key in counts:
+                self._counts.move_to_end(key)
+            while len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+@cache
+def encoding_name_for_model(model: str, fallback: str = DEFAULT_ENCODING) -> str:
+    """tiktoken's encoding for model, or fallback if tiktoken doesn't know it."""
+    from tiktoken.model import encoding_name_for_model as tiktoken_encoding_name
+
+    try:
+        return tiktoken_encoding_name(model)
+    except KeyError:
+        return fallback
+
+
+# Singleton
+token_counter = TokenCounter()
 
 
 class BaseTokenizer(abc.ABC):
@@ -55,28 +217,25 @@ class OpenAITokenizer(BaseTokenizer):
     OpenAI models (GPT-3.5, GPT-4, etc.).
     """
 
-    def __init__(self, encoding_name: str = "cl100k_base"):
+    def __init__(self, encoding_name: str = DEFAULT_ENCODING):
         self.encoding_name = encoding_name
-        self._tokenizer = None
 
     @property
-    def tokenizer(self):
-        """Lazy-loads the tiktoken tokenizer."""
-        if self._tokenizer is None:
-            try:
-                import tiktoken
-
-                print(f"[Lazy Load] Loading tiktoken for '{self.encoding_name}'...")
-                self._tokenizer = tiktoken.get_encoding(self.encoding_name)
-            except ImportError:
-                raise ImportError(
-                    "tiktoken is not installed. Please run: pip install tiktoken"
-                )
-        return self._tokenizer
+    def tokenizer(self) -> Encoding:
+        """The shared tiktoken encoder, loaded once per process."""
+        try:
+            return token_counter.encoding(self.encoding_name)
+        except ImportError:
+            raise ImportError(
+                "tiktoken is not installed. Please run: pip install tiktoken"
+            )
 
     def encode(self, text: str) -> list[int]:
         return self.tokenizer.encode(text)
 
+    def count_tokens(self, text: str) -> int:
+        return token_counter.count(text, encoding=self.encoding_name)
+
 
 class AnthropicTokenizer(OpenAITokenizer):
     """
@@ -87,14 +246,30 @@ class AnthropicTokenizer(OpenAITokenizer):
     values by 15-30%, making this suitable for estimates but not precise accounting.
     """
 
-    def __init__(self, encoding_name: str = "cl100k_base"):
-        print("---")
-        print("WARNING: AnthropicTokenizer is an APPROXIMATION.")
-        print("The actual token count may be 15-30% higher than reported.")
-        print("---")
+    def __init__(self, encoding_name: str = DEFAULT_ENCODING):
+        logger.warning(
+            "AnthropicTokenizer is an APPROXIMATION. "
+            "The actual token count may be 15-30% higher than reported."
+        )
         super().__init__(encoding_name)
 
 
+@cache
+def _load_hf_tokenizer(model_hf_name: str):
+    from transformers import AutoTokenizer
+
+    # Read token from env var
+    token = os.getenv("HUGGINGFACEHUB_API_TOKEN") or os.getenv("HF_TOKEN")
+    if not token:
+        logger.warning(
+            "HUGGINGFACEHUB_API_TOKEN or HF_TOKEN env var not set. "
+            "Gated models will fail."
+        )
+
+    logger.info(f"Loading transformers tokenizer for '{model_hf_name}'")
+    return AutoTokenizer.from_pretrained(model_hf_name, token=token)
+
+
 class GeminiTokenizer(BaseTokenizer):
     """
     Tokenizer for Google Gemini models using Hugging Face transformers.
@@ -111,28 +286,11 @@ class GeminiTokenizer(BaseTokenizer):
     @property
     def tokenizer(self):
         """
-        Lazy-loads the transformers tokenizer.
+        Lazy-loads the transformers tokenizer (shared across instances).
         """
         if self._tokenizer is None:
             try:
-                from transformers import AutoTokenizer
-
-                # --- START MODIFICATION ---
-                # Read token from env var
-                token = os.getenv("HUGGINGFACEHUB_API_TOKEN") or os.getenv("HF_TOKEN")
-                if not token:
-                    print(
-                        "WARNING: HUGGINGFACEHUB_API_TOKEN or HF_TOKEN env var not set. "
-                        "Gated models will fail."
-                    )
-
-                print(f"[Lazy Load] Loading transformers for '{self.model_hf_name}'...")
-                self._tokenizer = AutoTokenizer.from_pretrained(
-                    self.model_hf_name,
-                    token=token,  # Pass the token here
-                )
-                # --- END MODIFICATION ---
-
+                self._tokenizer = _load_hf_tokenizer(self.model_hf_name)
             except ImportError:
                 raise ImportError(
                     "transformers is not installed. "
@@ -162,28 +320,11 @@ class HuggingFaceTokenizer(BaseTokenizer):
     @property
     def tokenizer(self):
         """
-        Lazy-loads the transformers tokenizer.
+        Lazy-loads the transformers tokenizer (shared across instances).
         """
         if self._tokenizer is None:
             try:
-                from transformers import AutoTokenizer
-
-                # --- START MODIFICATION ---
-                # Read token from env var
-                token = os.getenv("HUGGINGFACEHUB_API_TOKEN") or os.getenv("HF_TOKEN")
-                if not token:
-                    print(
-                        "WARNING: HUGGINGFACEHUB_API_TOKEN or HF_TOKEN env var not set. "
-                        "Gated models will fail."
-                    )
-
-                print(f"[Lazy Load] Loading transformers for '{self.model_hf_name}'...")
-                self._tokenizer = AutoTokenizer.from_pretrained(
-                    self.model_hf_name,
-                    token=token,  # Pass the token here
-                )
-                # --- END MODIFICATION ---
-
+                self._tokenizer = _load_hf_tokenizer(self.model_hf_name)
             except ImportError:
                 raise ImportError(
                     "transformers is not installed. "
@@ -0,0 +1,189 @@
+"""
+Assemble raw provider stream chunks into typed delta events and, once the stream
+is exhausted, a complete GenerationResponse (text, tool calls, usage, stop reason).
+
+Handles the chunk formats our streaming clients return:
+- OpenAI-compatible ChatCompletionChunk (OpenAI, Ollama): choices[0].delta, usage on the final chunk
+- Anthropic raw message events: message_start / content_block_* / message_delta
+- Test fixture chunks exposing `.content`
+"""
+
+from __future__ import annotations
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+from conduit.domain.message.message import AssistantMessage, ToolCall
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata, StopReason
+from conduit.domain.result.stream_events import StreamEvent, TextDelta, ToolCallDelta
+
+if TYPE_CHECKING:
+    from conduit.domain.request.request import GenerationRequest
+
+logger = logging.getLogger(__name__)
+
+_STOP_REASONS: dict[str, StopReason] = {
+    # OpenAI-compatible
+    "stop": StopReason.STOP,
+    "length": StopReason.LENGTH,
+    "tool_calls": StopReason.TOOL_CALLS,
+    "content_filter": StopReason.CONTENT_FILTER,
+    # Anthropic
+    "end_turn": StopReason.STOP,
+    "stop_sequence": StopReason.STOP,
+    "max_tokens": StopReason.LENGTH,
+    "tool_use": StopReason.TOOL_CALLS,
+}
+
+
+class StreamAccumulator:
+    """
+    Stateful, single-pass consumer of one provider stream.
+    feed() is O(len(chunk)); text is kept as a list of fragments and joined once.
+    """
+
+    def __init__(self, provider: str | None = None):
+        self.provider = provider
+        self.model_slug: str | None = None
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.stop_reason: StopReason = StopReason.STOP
+        self._text: list[str] = []
+        # index -> {"id", "name", "arguments": list[str]}
+        self._tool_calls: dict[int, dict[str, Any]] = {}
+
+    @property
+    def text(self) -> str:
+        return "".join(self._text)
+
+    def feed(self, chunk: Any) -> list[StreamEvent]:
+        """
+        Consume one chunk and return the delta events it carries.
+        """
+        chunk_type = getattr(chunk, "type", None)
+        if isinstance(chunk_type, str) and chunk_type.startswith(
+            ("message_", "content_block_")
+        ):
+            return self._feed_anthropic(chunk)
+        if hasattr(chunk, "choices"):
+            return self._feed_openai(chunk)
+
+        content = getattr(chunk, "content", None)
+        if content:
+            self._text.append(content)
+            return [TextDelta(text=content)]
+        return []
+
+    def _feed_openai(self, chunk: Any) -> list[StreamEvent]:
+        events: list[StreamEvent] = []
+        self.model_slug = getattr(chunk, "model", None) or self.model_slug
+
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            self.input_tokens = usage.prompt_tokens or 0
+            self.output_tokens = usage.completion_tokens or 0
+            details = getattr(usage, "prompt_tokens_details", None)
+            self.cache_read_tokens = getattr(details, "cached_tokens", None) or 0
+
+        if not chunk.choices:
+            return events
+        choice = chunk.choices[0]
+        delta = choice.delta
+
+        if getattr(delta, "content", None):
+            self._text.append(delta.content)
+            events.append(TextDelta(text=delta.content))
+
+        for tool_delta in getattr(delta, "tool_calls", None) or []:
+            function = getattr(tool_delta, "function", None)
+            name = getattr(function, "name", None)
+            arguments = getattr(function, "arguments", None) or ""
+            events.append(
+                self._add_tool_delta(tool_delta.index, tool_delta.id, name, arguments)
+            )
+
+        if getattr(choice, "finish_reason", None):
+            self.stop_reason = _STOP_REASONS.get(choice.finish_reason, StopReason.STOP)
+        return events
+
+    def _feed_anthropic(self, event: Any) -> list[StreamEvent]:
+        match event.type:
+            case "message_start":
+                self.model_slug = event.message.model
+                usage = event.message.usage
+                self.input_tokens = usage.input_tokens or 0
+                self.cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+                self.cache_write_tokens = (
+                    getattr(usage, "cache_creation_input_tokens", None) or 0
+                )
+            case "content_block_start":
+                block = event.content_block
+                if block.type == "tool_use":
+                    return [self._add_tool_delta(event.index, block.id, block.name, "")]
+            case "content_block_delta":
+                delta = event.delta
+                if delta.type == "text_delta" and delta.text:
+                    self._text.append(delta.text)
+                    return [TextDelta(text=delta.text)]
+                if delta.type == "input_json_delta":
+                    return [
+                        self._add_tool_delta(event.index, None, None, delta.partial_json)
+                    ]
+            case "message_delta":
+                if event.usage is not None:
+                    self.output_tokens = event.usage.output_tokens or 0
+                if event.delta.stop_reason:
+                    self.stop_reason = _STOP_REASONS.get(
+                        event.delta.stop_reason, StopReason.STOP
+                    )
+        return []
+
+    def _add_tool_delta(
+        self, index: int, id: str | None, name: str | None, arguments: str
+    ) -> ToolCallDelta:
+        state = self._tool_calls.setdefault(
+            index, {"id": None, "name": None, "arguments": []}
+        )
+        if id:
+            state["id"] = id
+        if name:
+            state["name"] = name
+        if arguments:
+            state["arguments"].append(arguments)
+        return ToolCallDelta(index=index, id=id, name=name, arguments=arguments)
+
+    def to_response(
+        self, request: GenerationRequest, duration: float
+    ) -> GenerationResponse:
+        """
+        Build the final GenerationResponse. Duration is in milliseconds.
+        """
+        tool_calls = []
+        for index in sorted(self._tool_calls):
+            state = self._tool_calls[index]
+            raw_arguments = "".join(state["arguments"])
+            tool_call = ToolCall(
+                function_name=state["name"],
+                arguments=json.loads(raw_arguments) if raw_arguments else {},
+                provider=self.provider,
+            )
+            if state["id"]:
+                tool_call.id = state["id"]
+            tool_calls.append(tool_call)
+
+        message = AssistantMessage(
+            content=self.text or None,
+            tool_calls=tool_calls or None,
+        )
+        metadata = ResponseMetadata(
+            duration=duration,
+            model_slug=self.model_slug or request.params.model,
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            stop_reason=self.stop_reason,
+            cache_read_tokens=self.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens,
+        )
+        return GenerationResponse(message=message, request=request, metadata=metadata)
@@ -1,4 +1,6 @@
+import inspect
 import json
+import re
 from abc import ABC, abstractmethod
 from typing import Any
 from conduit.core.parser.stream.protocol import SyncStream, AsyncStream
@@ -13,11 +15,25 @@ class StreamParser(ABC):
 
     Supports early termination: can close stream as soon as first complete
     object is found (useful for token efficiency with parallel async requests).
+
+    Parsing is incremental: each chunk is scanned once as it arrives and the
+    scanner state (offsets, nesting depth, string/escape flags) is carried to
+    the next chunk, so a stream of n characters costs O(n) overall.
+    Chunks are kept in a list and joined only when the buffer is read.
     """
 
     def __init__(self, stream: SyncStream | AsyncStream):
         self.stream = stream
-        self.buffer = ""
+        self._reset()
+
+    @property
+    def buffer(self) -> str:
+        """
+        Everything received so far.
+        """
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
 
     def parse(
         self, close_on_match: bool = True, check_interval: int = 1
@@ -25,32 +41,29 @@ class StreamParser(ABC):
         """
         Consume sync stream and parse.
         """
-        self.buffer = ""
+        self._reset()
         chunk_count = 0
 
         try:
             for chunk in self.stream:
                 content = self._get_chunk_content(chunk)
                 if content:
-                    self.buffer += content
+                    self._receive(content)
                     chunk_count += 1
 
-                # Check for complete object periodically
-                if close_on_match and chunk_count % check_interval == 0:
-                    text, obj = self._parse_buffer(self.buffer)
-                    if obj:
-                        # Found complete object - close stream to save tokens
-                        if hasattr(self.stream, "close"):
-                            self.stream.close()
-                        break
+                # Stop once a complete object is found (stream closed in finally)
+                if (
+                    close_on_match
+                    and self._match is not None
+                    and chunk_count % check_interval == 0
+                ):
+                    break
         finally:
             # Ensure stream is always closed
             if hasattr(self.stream, "close"):
                 self.stream.close()
 
-        # Final parse on complete buffer
-        text, obj = self._parse_buffer(self.buffer)
-        return text, obj, self.buffer
+        return self._result(close_on_match)
 
     async def parse_async(
         self, close_on_match: bool = True, check_interval: int = 1
@@ -58,7 +71,7 @@ class StreamParser(ABC):
         """
         Consume async stream and parse.
         """
-        self.buffer = ""
+        self._reset()
         chunk_count = 0
 
         try:
@@ -66,42 +79,74 @@ class StreamParser(ABC):
             async for chunk in self.stream:
                 content = self._get_chunk_content(chunk)
                 if content:
-                    self.buffer += content
+                    self._receive(content)
                     chunk_count += 1
 
-                if close_on_match and chunk_count % check_interval == 0:
-                    text, obj = self._parse_buffer(self.buffer)
-                    if obj:
-                        # Found object, close stream
-                        if hasattr(self.stream, "close"):
-                            # check if close is async (it usually is for async streams)
-                            close_method = self.stream.close
-                            if hasattr(close_method, "__call__") and hasattr(
-                                close_method, "__await__"
-                            ):
-                                await close_method()
-                            else:
-                                close_method()
-                        break
+                if (
+                    close_on_match
+                    and self._match is not None
+                    and chunk_count % check_interval == 0
+                ):
+                    break
         finally:
             if hasattr(self.stream, "close"):
-                close_method = self.stream.close
-                if hasattr(close_method, "__call__") and hasattr(
-                    close_method, "__await__"
-                ):
-                    await close_method()
-                else:
-                    close_method()
-
-        text, obj = self._parse_buffer(self.buffer)
-        return text, obj, self.buffer
+                # close is usually a coroutine for async streams, but not always
+                result = self.stream.close()
+                if inspect.isawaitable(result):
+                    await result
+
+        return self._result(close_on_match)
+
+    def _reset(self) -> None:
+        self._parts: list[str] = []
+        # (start_index, end_index, object) of the first complete object
+        self._match: tuple[int, int, Any] | None = None
+        self._reset_scanner()
+
+    def _receive(self, content: str) -> None:
+        self._parts.append(content)
+        # Only the first object is extracted; stop scanning once we have it
+        if self._match is None:
+            self._match = self._feed(content)
+
+    def _result(self, close_on_match: bool) -> tuple[str, Any, str]:
+        """
+        Returns (text, object, buffer).
+        With close_on_match, text is what preceded the object and anything after
+        it is discarded (hallucination); otherwise text is the buffer minus the object.
+        """
+        buffer = self.buffer
+        if self._match is None:
+            return buffer, None, buffer
+        start, end, obj = self._match
+        text = buffer[:start] if close_on_match else buffer[:start] + buffer[end:]
+        return text, obj, buffer
 
-    @abstractmethod
     def _parse_buffer(self, buffer: str) -> tuple[str, Any]:
         """
-        Parse buffer and extract first structured object.
+        Parse a complete buffer in one go and extract the first structured object.
         Returns: (text_before_object, extracted_object)
         """
+        self._reset_scanner()
+        match = self._feed(buffer)
+        if match is None:
+            return buffer, None
+        return buffer[: match[0]], match[2]
+
+    @abstractmethod
+    def _reset_scanner(self) -> None:
+        """
+        Clear incremental scanner state.
+        """
+        ...
+
+    @abstractmethod
+    def _feed(self, text: str) -> tuple[int, int, Any] | None:
+        """
+        Scan the next piece of the stream, continuing from the previous call.
+        Returns (start_index, end_index, object) once the first complete object
+        has been seen, with indices relative to the whole stream.
+        """
         ...
 
     def _get_chunk_content(self, chunk) -> str | None:
@@ -137,46 +182,52 @@ class XMLStreamParser(StreamParser):
     def __init__(
         self, stream: SyncStream | AsyncStream, tag_name: str = "function_calls"
     ):
-        super().__init__(stream)
         self.tag_name = tag_name
         self.start_tag = f"<{tag_name}"
         self.end_tag = f"</{tag_name}>"
+        self._tags = re.compile(f"{re.escape(self.start_tag)}|{re.escape(self.end_tag)}")
+        # Enough trailing characters to catch a tag split across chunks
+        self._overlap = max(len(self.start_tag), len(self.end_tag)) - 1
+        super().__init__(stream)
 
-    def _parse_buffer(self, buffer: str) -> tuple[str, str | None]:
-        # Find first occurrence of opening tag
-        start_index = buffer.find(self.start_tag)
-        if start_index == -1:
-            return buffer, None
-
-        # Initialize state machine
-        depth = 1
-        scan_head = start_index + len(self.start_tag)
-
-        # Scan through buffer tracking depth
-        while depth > 0:
-            next_start = buffer.find(self.start_tag, scan_head)
-            next_end = buffer.find(self.end_tag, scan_head)
-
-            if next_end == -1:
-                return buffer, None
-
-            if next_start != -1 and next_start < next_end:
-                depth += 1
-                scan_head = next_start + len(self.start_tag)
-            else:
-                depth -= 1
-                scan_head = next_end + len(self.end_tag)
-
-        object_end_index = scan_head
-
-        # Extract the complete XML object
-        xml_obj = buffer[start_index:object_end_index]
-
-        # Extract text BEFORE the object.
-        # Everything after object_end_index is discarded (hallucination)
-        text_before = buffer[:start_index]
-
-        return text_before, xml_obj
+    def _reset_scanner(self) -> None:
+        self._scanned = 0  # characters fed so far
+        self._tail = ""  # last few characters, re-scanned with the next chunk
+        self._start = -1  # index of the opening tag, -1 until found
+        self._depth = 0
+        self._candidate: list[str] = []  # text from the opening tag onwards
+
+    def _feed(self, text: str) -> tuple[int, int, str] | None:
+        window = self._tail + text
+        base = self._scanned - len(self._tail)
+        seen = len(self._tail)
+        self._scanned += len(text)
+        # Text from here on belongs to the candidate object (if one is open)
+        candidate_from = seen
+
+        for tag in self._tags.finditer(window):
+            if tag.end() <= seen:
+                # Lies entirely in the tail: handled with the previous chunk
+                continue
+            is_start = tag.group() == self.start_tag
+
+            if self._start == -1:
+                if not is_start:
+                    continue
+                self._start = base + tag.start()
+                self._depth = 1
+                candidate_from = tag.start()
+                continue
+
+            self._depth += 1 if is_start else -1
+            if self._depth == 0:
+                xml_obj = "".join(self._candidate) + window[candidate_from : tag.end()]
+                return self._start, base + tag.end(), xml_obj
+
+        if self._start != -1:
+            self._candidate.append(window[candidate_from:])
+        self._tail = window[-self._overlap :]
+        return None
 
 
 class JSONStreamParser(StreamParser):
@@ -184,71 +235,85 @@ class JSONStreamParser(StreamParser):
     Parser for extracting JSON objects from streams using state machine.
     """
 
+    # Characters that change scanner state; everything else is skipped over
+    _OPENING = re.compile(r"[{\[]")
+    _SIGNIFICANT = re.compile(r'[\\"{}\[\]]')
+
     def __init__(self, stream: SyncStream | AsyncStream):
         super().__init__(stream)
 
-    def _parse_buffer(self, buffer: str) -> tuple[str, dict | list | None]:
-        scan_head = 0
-        while scan_head < len(buffer):
-            # 1. Find first opening brace or bracket
-            start_index = -1
-            for i in range(scan_head, len(buffer)):
-                if buffer[i] == "{" or buffer[i] == "[":
-                    start_index = i
-                    break
-
-            if start_index == -1:
-                return buffer, None
-
-            start_char = buffer[start_index]
-            end_char = "}" if start_char == "{" else "]"
-
-            # 2. Initialize state machine
-            depth = 1
-            in_string = False
-            escaped = False
-
-            # 3. Scan char by char
-            for i in range(start_index + 1, len(buffer)):
-                char = buffer[i]
-
-                if escaped:
-                    escaped = False
-                    continue
-
-                if char == "\\":
-                    escaped = True
-                    continue
-
-                if char == '"':
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == start_char:
-                        depth += 1
-                    elif char == end_char:
-                        depth -= 1
-
-                    if depth == 0:
-                        # 4. Found balanced structure
-                        end_index = i
-                        candidate_str = buffer[start_index : end_index + 1]
-
-                        try:
-                            # 5. Validate with json.loads()
-                            parsed_obj = json.loads(candidate_str)
-
-                            # Success!
-                            # Return text BEFORE the object. Discard tail.
-                            text_before = buffer[:start_index]
-                            return text_before, parsed_obj
-
-                        except json.JSONDecodeError:
-                            scan_head = start_index + 1
-                            break
-
-            if depth != 0:
-                return buffer, None
+    def _reset_scanner(self) -> None:
+        self._scanned = 0
+        self._clear_candidate()
+
+    def _clear_candidate(self) -> None:
+        self._start = -1  # index of the opening brace/bracket, -1 until found
+        self._start_char = ""
+        self._end_char = ""
+        self._depth = 0
+        self._in_string = False
+        self._skip = -1  # index of the character after a backslash
+        self._candidate: list[str] = []
+
+    def _feed(self, text: str) -> tuple[int, int, dict | list] | None:
+        # A balanced candidate that fails json.loads hands back its text (minus
+        # the opening character) to be scanned again.
+        while text:
+            match, text = self._scan(text)
+            if match is not None:
+                return match
+        return None
 
-        return buffer, None
+    def _scan(self, text: str) -> tuple[tuple[int, int, Any] | None, str]:
+        base = self._scanned
+        self._scanned += len(text)
+        candidate_from = position = 0
+
+        # 1. Find first opening brace or bracket
+        if self._start == -1:
+            opening = self._OPENING.search(text)
+            if opening is None:
+                return None, ""
+            candidate_from, position = opening.start(), opening.end()
+            self._start = base + candidate_from
+            self._start_char = opening.group()
+            self._end_char = "}" if self._start_char == "{" else "]"
+            self._depth = 1
+
+        # 2. Scan significant characters only, tracking depth outside strings
+        for token in self._SIGNIFICANT.finditer(text, position):
+            index = token.start()
+            if base + index == self._skip:
+                continue
+            char = token.group()
+
+            if char == "\\":
+                self._skip = base + index + 1
+                continue
+
+            if char == '"':
+                self._in_string = not self._in_string
+                continue
+
+            if self._in_string:
+                continue
+
+            if char == self._start_char:
+                self._depth += 1
+            elif char == self._end_char:
+                self._depth -= 1
+                if self._depth == 0:
+                    # 3. Found balanced structure; validate with json.loads()
+                    end = base + index + 1
+                    candidate_str = "".join(self._candidate) + text[candidate_from:index + 1]
+                    try:
+                        return (self._start, end, json.loads(candidate_str)), ""
+                    except json.JSONDecodeError:
+                        # Not JSON after all: rescan from just past the opening character
+                        retry = candidate_str[1:] + text[index + 1 :]
+                        self._scanned = self._start + 1
+                        self._clear_candidate()
+                        return None, retry
+
+        self._candidate.append(text[candidate_from:])
+        return None, ""
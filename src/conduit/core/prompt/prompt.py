@@ -4,6 +4,7 @@ Prompt class -- coordinates templates, input variables, and rendering.
 
 from __future__ import annotations
 from jinja2 import Environment, StrictUndefined, meta, Template
+from functools import lru_cache
 from typing import TYPE_CHECKING, override
 import logging
 
@@ -17,6 +18,35 @@ env = Environment(
     undefined=StrictUndefined
 )  # set jinja2 to throw errors if a variable is undefined
 
+# Compiled templates kept across Prompt instances (batch inputs, per-chunk prompts)
+TEMPLATE_CACHE_SIZE = 256
+# Anything that can start a jinja construct; "\r" because jinja normalizes newlines
+_JINJA_MARKERS = (
+    env.block_start_string,
+    env.variable_start_string,
+    env.comment_start_string,
+    "\r",
+)
+
+
+def is_plain_text(prompt_string: str) -> bool:
+    """
+    True if jinja would render prompt_string unchanged (bar the trailing newline),
+    so it doesn't need compiling.
+    """
+    return not any(marker in prompt_string for marker in _JINJA_MARKERS)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(prompt_string: str) -> tuple[Template, frozenset[str]]:
+    """
+    Compile a template and find its input variables, once per distinct string.
+    The cache is keyed by the string's hash; Templates are safe to share.
+    """
+    template = env.from_string(prompt_string)
+    input_schema = frozenset(meta.find_undeclared_variables(env.parse(prompt_string)))
+    return template, input_schema
+
 
 class Prompt:
     """ "
@@ -30,22 +60,30 @@ class Prompt:
     # Init methods
     def __init__(self, prompt_string: str):
         self.prompt_string: str = prompt_string
-        self.template: Template = env.from_string(prompt_string)
+        self._plain: bool = is_plain_text(prompt_string)
         self.input_schema: set[str] = self._get_input_schema()
 
+    @property
+    def template(self) -> Template:
+        return compile_template(self.prompt_string)[0]
+
     def _get_input_schema(self) -> set[str]:
         """
         Returns a set of variable names from the template.
         This can be used to validate that the input variables match the template.
         """
-        parsed_content = env.parse(self.prompt_string)
-        return meta.find_undeclared_variables(parsed_content)
+        if self._plain:
+            return set()
+        return set(compile_template(self.prompt_string)[1])
 
     # Main methods
     def render(self, input_variables: dict[str, str]) -> str:
         """
         takes a dictionary of variables
         """
+        if self._plain:
+            # What jinja would produce: it drops a single trailing newline
+            return self.prompt_string.removesuffix("\n")
         rendered_prompt = self.template.render(
             **input_variables
         )  # this takes all named variables from the dictionary we pass to this.
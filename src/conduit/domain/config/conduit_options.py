@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, ConfigDict, field_validator
 from conduit.storage.cache.protocol import ConduitCache
 from conduit.storage.repository.protocol import AsyncSessionRepository
 from conduit.capabilities.tools.registry import ToolRegistry
+from conduit.domain.config.prompt_caching import PromptCaching
 from rich.console import Console
 
 
@@ -44,17 +45,46 @@ class ConduitOptions(BaseModel):
         default=True,
         description="Enable parallel tool calls (multiple tools in one turn). Supported by OpenAI, Google, and Ollama.",
     )
+    max_concurrent_tools: int = Field(
+        default=8,
+        ge=1,
+        description="Max tool calls from a single turn executed concurrently (when parallel_tool_calls is enabled).",
+    )
+    tool_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Per-tool-call timeout in seconds; a timed-out call is reported back to the LLM as an error.",
+    )
+
+    prompt_caching: PromptCaching | None = Field(
+        default=None,
+        description="Provider prompt-prefix caching policy; True for the defaults, None to disable.",
+    )
 
     # Overrides for request behavior
     use_cache: bool | None = True  # Technically: "if cache exists, use it"
     include_history: bool = True  # Whether to include conversation history
     persistence_mode: PersistenceMode = PersistenceMode.RESUME
-    max_history: int = 40  # Max non-system messages to retain before pruning
+    context_budget: int | None = Field(
+        default=None,
+        ge=1,
+        description="Token budget for history sent to the model; derived from the model's context window if None.",
+    )
+    max_history: int | None = None  # Optional cap on non-system messages, on top of the token budget
 
     # Dev options
     debug_payload: bool = False  # Log full request/response payloads for debugging
     use_remote: bool = False  # Whether to use remote server for model execution
 
+    @field_validator("prompt_caching", mode="before")
+    @classmethod
+    def prompt_caching_from_bool(cls, v):
+        if v is True:
+            return PromptCaching()
+        if v is False:
+            return None
+        return v
+
     @field_validator("verbosity")
     @classmethod
     def verbosity_must_not_be_none(cls, v):
@@ -0,0 +1,28 @@
+from __future__ import annotations
+from typing import Literal
+from pydantic import BaseModel, Field
+
+
+class PromptCaching(BaseModel):
+    """
+    Opt-in policy for provider-side prompt prefix caching.
+
+    Anthropic only caches up to explicit `cache_control` breakpoints, so the policy
+    decides which stable parts of the prompt get one: the tool definitions, the
+    system prompt, and the history before the latest turn. OpenAI and Gemini
+    cache prefixes automatically; for OpenAI the policy also sets a
+    prompt_cache_key derived from the stable prefix, to route repeated prefixes
+    to the same cache.
+
+    Cached tokens are reported in ResponseMetadata.cache_read_tokens /
+    cache_write_tokens either way.
+    """
+
+    system: bool = Field(default=True, description="Cache the system prompt.")
+    tools: bool = Field(default=True, description="Cache the tool definitions.")
+    history: bool = Field(
+        default=True, description="Cache the conversation before the latest turn."
+    )
+    ttl: Literal["5m", "1h"] = Field(
+        default="5m", description="Anthropic cache lifetime; 1h writes cost more."
+    )
@@ -0,0 +1,313 @@
+"""
+Token-budgeted context windows.
+
+History is trimmed to a token budget derived from the model's context window
+(ModelSpec.context_window), instead of to a fixed number of messages:
+
+- every message's token count is cached on first use, so a growing conversation
+  only tokenizes the message that was just added;
+- messages are trimmed oldest-first in whole turns: an assistant message that made
+  tool calls is kept or dropped together with its tool results, since providers
+  reject tool results whose call is missing (and vice versa);
+- the system message and the latest turn are always kept;
+- optionally, the trimmed turns are summarized into the system message first.
+
+Counts are estimates (tiktoken, ChatML overhead), same as Client.tokenize for
+OpenAI; the budget keeps a safety margin for providers whose tokenizers differ.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING
+
+from conduit.core.model.models.tokens import encoding_name_for_model, token_counter
+from conduit.domain.message.role import Role
+
+if TYPE_CHECKING:
+    from conduit.domain.conversation.conversation import Conversation
+    from conduit.domain.message.message import Message
+
+logger = logging.getLogger(__name__)
+
+# Message cap used when the model's context window can't be looked up
+FALLBACK_MAX_MESSAGES = 40
+# Share of the window kept free for the response when max_tokens isn't set
+OUTPUT_RESERVE_RATIO = 0.25
+MAX_OUTPUT_RESERVE = 8192
+# Estimates can undercount (Anthropic/Gemini tokenizers differ from tiktoken)
+SAFETY_MARGIN = 0.9
+
+# ChatML overhead, as in OpenAIClient.tokenize
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+REPLY_PRIMER = 3
+IMAGE_TOKENS = {"low": 85, "high": 765, "auto": 765}
+
+SUMMARY_HEADER = "Summary of the earlier conversation:"
+
+# model -> context window, resolved once per process
+_context_windows: dict[str, int] = {}
+# model -> monotonic time until which a failed lookup isn't retried
+_failed_lookups: dict[str, float] = {}
+FAILED_LOOKUP_TTL_SECONDS = 60.0
+
+# id(message) -> (weakref, field objects the counts were computed from, {encoding: count})
+_counts: dict[int, tuple[weakref.ref, tuple[object, ...], dict[str, int]]] = {}
+
+
+# Per-message counts
+def _sources(message: Message) -> tuple[object, ...]:
+    content = message.content
+    parts = tuple(content) if isinstance(content, list) else ()
+    return (
+        message.role,
+        content,
+        *parts,
+        getattr(message, "tool_calls", None),
+        getattr(message, "name", None),
+    )
+
+
+def _count(message: Message, encoding: str) -> int:
+    def count(text: str) -> int:
+        return token_counter.count(text, encoding=encoding)
+
+    tokens = TOKENS_PER_MESSAGE + count(message.role.value)
+
+    content = message.content
+    if isinstance(content, str):
+        tokens += count(content)
+    elif isinstance(content, list):
+        for part in content:
+            if isinstance(part, str):
+                tokens += count(part)
+            elif getattr(part, "type", None) == "text":
+                tokens += count(part.text)
+            elif getattr(part, "type", None) == "image_url":
+                tokens += IMAGE_TOKENS.get(part.detail, IMAGE_TOKENS["auto"])
+    elif content is not None:
+        tokens += count(json.dumps(content, default=str))
+
+    for call in getattr(message, "tool_calls", None) or []:
+        tokens += count(call.function_name)
+        tokens += count(json.dumps(call.arguments))
+
+    name = getattr(message, "name", None)
+    if name:
+        tokens += TOKENS_PER_NAME + count(name)
+    return tokens
+
+
+def message_tokens(message: Message, model: str) -> int:
+    """
+    Estimated tokens for one message, computed once per message and encoding.
+    The cache is validated against the message's fields (an `is` check), so
+    reassigning content or tool calls recounts.
+    """
+    encoding = encoding_name_for_model(model)
+    key = id(message)
+    sources = _sources(message)
+    entry = _counts.get(key)
+    if entry is not None:
+        ref, cached_sources, by_encoding = entry
+        if (
+            ref() is message
+            and len(cached_sources) == len(sources)
+            and all(a is b for a, b in zip(cached_sources, sources))
+        ):
+            if encoding not in by_encoding:
+                by_encoding[encoding] = _count(message, encoding)
+            return by_encoding[encoding]
+
+    count = _count(message, encoding)
+
+    def _forget(ref: weakref.ref, key: int = key) -> None:
+        current = _counts.get(key)
+        if current is not None and current[0] is ref:
+            del _counts[key]
+
+    _counts[key] = (weakref.ref(message, _forget), sources, {encoding: count})
+    return count
+
+
+def count_tokens(messages: Sequence[Message], model: str) -> int:
+    """Estimated prompt tokens for a message list, including the reply primer."""
+    if not messages:
+        return 0
+    return sum(message_tokens(m, model) for m in messages) + REPLY_PRIMER
+
+
+# Budgets
+async def context_window_for(model: str) -> int | None:
+    """
+    The model's context window from its ModelSpec, or None if the spec can't be
+    loaded. Successful lookups are cached per process. Failures are remembered
+    for FAILED_LOOKUP_TTL_SECONDS only, so a brief database outage doesn't pin a
+    model to a guess, and an unknown model costs one lookup per interval rather
+    than one per turn.
+    """
+    window = _context_windows.get(model)
+    if window is not None:
+        return window
+    if _failed_lookups.get(model, 0.0) > time.monotonic():
+        return None
+
+    from conduit.core.model.models.modelstore import ModelStore
+
+    try:
+        # ModelSpecRepository is sync and runs its own event loop
+        spec = await asyncio.to_thread(ModelStore.get_model, model)
+        window = spec.context_window
+    except Exception as e:
+        logger.warning(f"No context window for {model}: {e}")
+        window = None
+    if not window:
+        _failed_lookups[model] = time.monotonic() + FAILED_LOOKUP_TTL_SECONDS
+        return None
+    _failed_lookups.pop(model, None)
+    _context_windows[model] = window
+    return window
+
+
+def token_budget(context_window: int, max_output_tokens: int | None = None) -> int:
+    """Prompt tokens available once the response is reserved for."""
+    if max_output_tokens is None:
+        max_output_tokens = min(
+            int(context_window * OUTPUT_RESERVE_RATIO), MAX_OUTPUT_RESERVE
+        )
+    return max(int((context_window - max_output_tokens) * SAFETY_MARGIN), 0)
+
+
+# Trimming
+def group_turns(messages: Sequence[Message]) -> list[list[Message]]:
+    """
+    Split messages into units that are kept or dropped together: a message, plus
+    any tool results that follow an assistant message's tool calls.
+    """
+    groups: list[list[Message]] = []
+    for message in messages:
+        if message.role == Role.TOOL and groups:
+            groups[-1].append(message)
+        else:
+            groups.append([message])
+    return groups
+
+
+class ContextWindow:
+    """
+    Fits a conversation's message view to a token budget. The Session keeps the
+    full history; only Conversation.messages (what gets sent) is trimmed.
+    """
+
+    def __init__(
+        self, model: str, budget: int | None, max_messages: int | None = None
+    ):
+        self.model = model
+        self.budget = budget
+        self.max_messages = max_messages
+
+    @classmethod
+    async def for_model(
+        cls,
+        model: str,
+        max_output_tokens: int | None = None,
+        budget: int | None = None,
+        max_messages: int | None = None,
+    ) -> ContextWindow:
+        """
+        A window sized from the model's ModelSpec, unless budget is given. If the
+        model's context window is unknown, history isn't trimmed by tokens; it is
+        capped at max_messages (FALLBACK_MAX_MESSAGES by default) instead.
+        """
+        if budget is None:
+            context_window = await context_window_for(model)
+            if context_window is None:
+                return cls(model, None, max_messages or FALLBACK_MAX_MESSAGES)
+            budget = token_budget(context_window, max_output_tokens)
+        return cls(model, budget, max_messages)
+
+    def tokens(self, messages: Sequence[Message]) -> int:
+        return count_tokens(messages, self.model)
+
+    def _split(
+        self, messages: Sequence[Message]
+    ) -> tuple[Message | None, list[list[Message]], list[Message]]:
+        """
+        (system, groups to keep, messages dropped). Drops whole turns oldest-first
+        until the rest fits; the latest turn always stays.
+        """
+        system = messages[0] if messages and messages[0].role == Role.SYSTEM else None
+        groups = group_turns(messages[1:] if system else messages)
+
+        used = REPLY_PRIMER + (message_tokens(system, self.model) if system else 0)
+        kept: list[list[Message]] = []
+        count = 0
+        for group in reversed(groups):
+            cost = sum(message_tokens(m, self.model) for m in group)
+            over_budget = self.budget is not None and used + cost > self.budget
+            over_count = (
+                self.max_messages is not None and count + len(group) > self.max_messages
+            )
+            if kept and (over_budget or over_count):
+                break
+            kept.append(group)
+            used += cost
+            count += len(group)
+        kept.reverse()
+
+        # Start on a user turn where possible: providers reject a leading
+        # assistant or tool message
+        while len(kept) > 1 and kept[0][0].role != Role.USER:
+            kept.pop(0)
+
+        kept_ids = {id(m) for group in kept for m in group}
+        dropped = [m for group in groups for m in group if id(m) not in kept_ids]
+        if self.budget is not None and used > self.budget:
+            logger.warning(
+                f"Latest turn alone ({used} tokens) exceeds the {self.budget} token budget for {self.model}."
+            )
+        return system, kept, dropped
+
+    async def fit(
+        self,
+        conversation: Conversation,
+        summarize: Callable[[list[Message]], Awaitable[str]] | None = None,
+    ) -> list[Message]:
+        """
+        Trim conversation.messages to the budget and return the dropped messages.
+        With summarize, the dropped turns are summarized into the system message
+        (and the window re-fitted around the longer system message).
+        """
+        system, kept, dropped = self._split(conversation.messages)
+        if not dropped:
+            return []
+
+        conversation.messages = ([system] if system else []) + [
+            m for group in kept for m in group
+        ]
+
+        if summarize is not None:
+            from conduit.domain.message.message import SystemMessage
+
+            summary = await summarize(dropped)
+            base = str(system.content) if system and system.content else ""
+            content = f"{base}\n\n{SUMMARY_HEADER}\n{summary}".lstrip()
+            conversation.system = SystemMessage(content=content)
+            _, kept, more = self._split(conversation.messages)
+            conversation.messages = [conversation.system] + [
+                m for group in kept for m in group
+            ]
+            dropped.extend(more)
+
+        limit = (
+            f"{self.budget} tokens"
+            if self.budget is not None
+            else f"{self.max_messages} messages"
+        )
+        logger.info(f"Context window: dropped {len(dropped)} messages to fit {limit}.")
+        return dropped
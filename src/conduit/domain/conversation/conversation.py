@@ -151,6 +151,23 @@ class Conversation(BaseModel):
         self.messages.append(message)
         self.leaf = message.message_id
 
+    def fork(self) -> Conversation:
+        """
+        Branch this conversation without copying message payloads.
+        Messages are immutable once added, so the fork shares them with the original
+        (including any base64 image/audio content); only the list of references and the
+        Session index are copied. Appending to the fork leaves the original untouched,
+        and both remain views over the same predecessor-linked message graph.
+        """
+        session = None
+        if self.session is not None:
+            session = self.session.model_copy(
+                update={"message_dict": dict(self.session.message_dict)}
+            )
+        return self.model_copy(
+            update={"messages": list(self.messages), "session": session}
+        )
+
     def wipe(self) -> None:
         self.messages = []
         self.leaf = (
@@ -166,9 +183,13 @@ class Conversation(BaseModel):
                 self.messages.insert(0, system)
 
     def tokens(self, model_name: str) -> int:
-        raise NotImplementedError(
-            "Token counting not yet implemented for Conversation."
-        )
+        """
+        Estimated prompt tokens for the messages, per model_name's tokenizer.
+        Per-message counts are cached, so repeated calls only count new messages.
+        """
+        from conduit.domain.conversation.context_window import count_tokens
+
+        return count_tokens(self.messages, model_name)
 
     def ensure_system_message(
         self, system_content: str = settings.system_prompt
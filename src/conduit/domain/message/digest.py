@@ -0,0 +1,133 @@
+"""
+Content digests for messages, used to build cache keys.
+
+A cache key used to be a SHA256 over the canonical JSON of every message, so each
+lookup re-serialized (and re-escaped) every base64 image and audio payload in the
+conversation. Here, instead:
+
+- each blob (ImageContent.url, AudioContent.data) is hashed once and referenced by
+  its digest;
+- each message gets a digest of its role + content, built from those references;
+- both are memoized per object, so a conversation that grows by one turn only
+  hashes the new message.
+
+Memos are keyed by object identity and validated against the exact field objects
+they were computed from (an `is` check), so reassigning a field invalidates them.
+They are kept outside the models on purpose: pydantic compares private attributes
+in __eq__, and a digest must never make two equal messages compare unequal.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from conduit.domain.message.message import Message
+
+# id(obj) -> (weakref to obj, field objects the digest was computed from, digest)
+_memo: dict[int, tuple[weakref.ref, tuple[object, ...], str]] = {}
+
+
+def canonical_json_bytes(obj: object) -> bytes:
+    """
+    Canonical JSON encoding for hashing:
+    - sorted keys for deterministic order
+    - compact separators to avoid whitespace differences
+    - UTF-8 bytes for stable hashing
+    """
+    return json.dumps(
+        obj,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def sha256_json(obj: object) -> str:
+    return hashlib.sha256(canonical_json_bytes(obj)).hexdigest()
+
+
+def _memoized(obj: object, sources: tuple[object, ...], compute) -> str:
+    key = id(obj)
+    entry = _memo.get(key)
+    if entry is not None:
+        ref, cached_sources, digest = entry
+        if (
+            ref() is obj
+            and len(cached_sources) == len(sources)
+            and all(a is b for a, b in zip(cached_sources, sources))
+        ):
+            return digest
+
+    digest = compute()
+
+    def _forget(ref: weakref.ref, key: int = key) -> None:
+        current = _memo.get(key)
+        if current is not None and current[0] is ref:
+            del _memo[key]
+
+    _memo[key] = (weakref.ref(obj, _forget), sources, digest)
+    return digest
+
+
+def part_digest(part: object) -> str:
+    """
+    Digest of one item of list content (str, TextContent, ImageContent, AudioContent).
+    """
+    from conduit.domain.message.message import AudioContent, ImageContent, TextContent
+
+    if isinstance(part, str):
+        return sha256_json(part)
+    if isinstance(part, TextContent):
+        return _memoized(
+            part, (part.text,), lambda: sha256_json({"type": part.type, "text": part.text})
+        )
+    if isinstance(part, ImageContent):
+        return _memoized(
+            part,
+            (part.url, part.detail),
+            lambda: sha256_json(
+                {
+                    "type": part.type,
+                    "detail": part.detail,
+                    "url_sha256": hashlib.sha256(part.url.encode("utf-8")).hexdigest(),
+                }
+            ),
+        )
+    if isinstance(part, AudioContent):
+        return _memoized(
+            part,
+            (part.data, part.format),
+            lambda: sha256_json(
+                {
+                    "type": part.type,
+                    "format": part.format,
+                    "data_sha256": hashlib.sha256(part.data.encode("utf-8")).hexdigest(),
+                }
+            ),
+        )
+    # Anything else (e.g. a raw dict) is hashed as JSON
+    return sha256_json(part)
+
+
+def message_digest(message: Message) -> str:
+    """
+    Digest of a message's role + content; the rest of the message (ids,
+    timestamps, metadata) doesn't take part, same as the cache key.
+    """
+    role = message.role_str
+    content = message.content
+
+    if isinstance(content, list):
+        # Parts memoize themselves; combining their digests is cheap
+        return sha256_json({"role": role, "content": [part_digest(p) for p in content]})
+    if isinstance(content, dict):
+        # Mutable in place, so never memoized
+        return sha256_json({"role": role, "content": content})
+    return _memoized(
+        message,
+        (role, content),
+        lambda: sha256_json({"role": role, "content": content}),
+    )
@@ -11,10 +11,13 @@ from pydantic import BaseModel
 from conduit.domain.request.generation_params import GenerationParams
 from conduit.domain.config.conduit_options import ConduitOptions
 from conduit.domain.message.message import MessageUnion
+from conduit.domain.message.digest import (
+    canonical_json_bytes as _canonical_json_bytes,
+    message_digest,
+)
 from conduit.utils.progress.verbosity import Verbosity
 from collections.abc import Sequence
 import hashlib
-import json
 import logging
 from typing import TYPE_CHECKING, override
 
@@ -26,20 +29,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-# Hashing helpers
-def _canonical_json_bytes(obj: object) -> bytes:
-    """
-    Canonical JSON encoding for hashing:
-    - sorted keys for deterministic order
-    - compact separators to avoid whitespace differences
-    - UTF-8 bytes for stable hashing
-    """
-    return json.dumps(
-        obj,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    ).encode("utf-8")
+# Bumped whenever generate_cache_key changes; see AsyncPostgresCache.migrate_keys
+CACHE_KEY_VERSION = 2
 
 
 def _response_model_id(model_cls: type[BaseModel] | None) -> str | None:
@@ -68,13 +59,27 @@ class GenerationRequest(BaseModel):
 
     def generate_cache_key(self) -> str:
         """
-        Cache identity = canonical(params) + ordered(messages).
+        Cache identity = canonical(params) + ordered(message digests).
 
         - Params: all GenerationParams fields EXCEPT response_model and response_model_schema,
           plus response_model's module.qualname when present.
-        - Messages: ordered list of {role, content} pairs only.
+        - Messages: ordered list of per-message digests over {role, content} only
+          (see conduit.domain.message.digest). Blobs enter as their own digests, and
+          digests are memoized, so this stays cheap for long multimodal conversations.
         - Canonical JSON (sorted keys) is hashed with SHA256.
         """
+        key_payload = {
+            "version": CACHE_KEY_VERSION,
+            "params": self._normalize_params_for_cache(),
+            "messages": [message_digest(m) for m in self.messages],
+        }
+        return hashlib.sha256(_canonical_json_bytes(key_payload)).hexdigest()
+
+    def generate_legacy_cache_key(self) -> str:
+        """
+        Version 1 cache key: the full canonical JSON of every message, blobs included.
+        Only used to re-key entries written before CACHE_KEY_VERSION 2.
+        """
         key_payload = {
             "params": self._normalize_params_for_cache(),
             "messages": self._normalize_messages_for_cache(),
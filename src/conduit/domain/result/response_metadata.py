@@ -28,6 +28,14 @@ class ResponseMetadata(BaseModel):
     cache_hit: bool = Field(
         default=False, description="Whether the response was served from cache"
     )
+    cache_read_tokens: int = Field(
+        default=0,
+        description="Prompt tokens served from the provider's prefix cache. Included in input_tokens for OpenAI/Gemini, reported separately by Anthropic.",
+    )
+    cache_write_tokens: int = Field(
+        default=0,
+        description="Prompt tokens written to the provider's prefix cache (Anthropic only).",
+    )
     logprobs: list[dict] | None = Field(
         default=None, description="Per-token logprobs from the model, if requested"
     )
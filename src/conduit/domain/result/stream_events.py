@@ -0,0 +1,78 @@
+"""
+Typed events yielded by the streaming API (ConduitAsync.stream / Engine.stream / ModelAsync.pipe_stream).
+
+A streamed run produces, in order:
+- TextDelta / ToolCallDelta as the provider emits tokens,
+- ResponseComplete once a model call finishes (after caching and telemetry),
+- ToolResult for every tool the Engine executes between model calls,
+- ConversationComplete once, at the very end (after persistence).
+
+Use StreamEventUnion (discriminated on `type`) when (de)serializing.
+"""
+
+from __future__ import annotations
+from typing import Annotated, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from conduit.domain.conversation.conversation import Conversation
+from conduit.domain.message.message import ToolMessage
+from conduit.domain.result.response import GenerationResponse
+
+
+class StreamEvent(BaseModel):
+    """
+    Base class for all stream events.
+    Use this for isinstance checks.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class TextDelta(StreamEvent):
+    """A fragment of assistant text."""
+
+    type: Literal["text_delta"] = "text_delta"
+    text: str
+
+
+class ToolCallDelta(StreamEvent):
+    """
+    A fragment of a tool call. The first delta for an index carries id and name;
+    `arguments` is a fragment of the JSON-encoded arguments.
+    """
+
+    type: Literal["tool_call_delta"] = "tool_call_delta"
+    index: int
+    id: str | None = None
+    name: str | None = None
+    arguments: str = ""
+
+
+class ResponseComplete(StreamEvent):
+    """
+    A model call finished; carries the assembled response.
+    Inside the Engine, `conversation` is the conversation with the response message added.
+    """
+
+    type: Literal["response_complete"] = "response_complete"
+    response: GenerationResponse
+    conversation: Conversation | None = None
+
+
+class ToolResult(StreamEvent):
+    """The Engine executed a tool call."""
+
+    type: Literal["tool_result"] = "tool_result"
+    message: ToolMessage
+
+
+class ConversationComplete(StreamEvent):
+    """The run finished; carries the final conversation."""
+
+    type: Literal["conversation_complete"] = "conversation_complete"
+    conversation: Conversation
+
+
+StreamEventUnion = Annotated[
+    TextDelta | ToolCallDelta | ResponseComplete | ToolResult | ConversationComplete,
+    Field(discriminator="type"),
+]
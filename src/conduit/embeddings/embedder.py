@@ -0,0 +1,125 @@
+"""
+Embedders: anything that turns a batch of texts into a 2D float array, one row per text.
+
+- HeadwaterEmbedder: sentence-transformers models served by Headwater.
+- HashingEmbedder: local and deterministic (hashed word and character n-grams);
+  no model or network, so it's what tests and offline runs use. It captures
+  lexical overlap only, not meaning.
+"""
+
+from __future__ import annotations
+import hashlib
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-mpnet-base-v2"
+HASHING_DIMENSIONS = 256
+
+_WORD = re.compile(r"\w+")
+
+
+@runtime_checkable
+class Embedder(Protocol):
+    """
+    Async interface for text embedding.
+    """
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Return a (len(texts), dimensions) float32 array, rows in input order.
+        """
+        ...
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing embedder: word unigrams and character trigrams hashed into a
+    fixed number of signed buckets. Same text, same vector, on every machine.
+    """
+
+    def __init__(self, dimensions: int = HASHING_DIMENSIONS):
+        if dimensions < 1:
+            raise ValueError("dimensions must be at least 1")
+        self.dimensions = dimensions
+
+    def _features(self, text: str) -> list[str]:
+        words = _WORD.findall(text.lower())
+        grams = []
+        for word in words:
+            padded = f" {word} "
+            grams.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+        return words + grams
+
+    def embed_one(self, text: str) -> np.ndarray:
+        import numpy as np
+
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self.dimensions] += sign
+        return vector
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        import numpy as np
+
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return np.stack([self.embed_one(text) for text in texts])
+
+
+# Served embedding models, listed once per process
+_served_models: frozenset[str] | None = None
+
+
+async def served_embedding_models() -> frozenset[str]:
+    global _served_models
+    if _served_models is None:
+        from headwater_client.client.headwater_client_async import HeadwaterAsyncClient
+
+        async with HeadwaterAsyncClient() as client:
+            specs = await client.embeddings.list_embedding_models()
+        _served_models = frozenset(spec.model for spec in specs)
+    return _served_models
+
+
+class HeadwaterEmbedder:
+    """
+    Embeds through the Headwater server's embeddings endpoint. The model is
+    validated against the server's model list on first use.
+    """
+
+    def __init__(self, model: str = DEFAULT_EMBEDDING_MODEL):
+        self.model = model
+        self._validated = False
+
+    async def validate(self) -> None:
+        if not self._validated:
+            if self.model not in await served_embedding_models():
+                raise ValueError(f"Model '{self.model}' is not a valid embedding model.")
+            self._validated = True
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        import numpy as np
+        from headwater_api.classes import ChromaBatch, EmbeddingsRequest
+        from headwater_client.client.headwater_client_async import HeadwaterAsyncClient
+
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        await self.validate()
+        request = EmbeddingsRequest(
+            model=self.model,
+            batch=ChromaBatch(ids=[str(i) for i in range(len(texts))], documents=list(texts)),
+        )
+        async with HeadwaterAsyncClient() as client:
+            response = await client.embeddings.generate_embeddings(request)
+        if len(response.embeddings) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} embeddings from {self.model}, got {len(response.embeddings)}."
+            )
+        return np.asarray(response.embeddings, dtype=np.float32)
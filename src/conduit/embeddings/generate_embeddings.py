@@ -1,3 +1,4 @@
+from functools import cache
 from headwater_client.client.headwater_client import HeadwaterClient
 from headwater_api.classes import (
     ChromaBatch,
@@ -63,10 +64,16 @@ def list_embedding_models() -> list[EmbeddingModelSpec]:
     return client.embeddings.list_embedding_models()
 
 
+@cache
+def _served_model_names() -> frozenset[str]:
+    return frozenset(spec.model for spec in list_embedding_models())
+
+
 def validate_model(model_name: str) -> bool:
-    client = HeadwaterClient()
-    specs = client.embeddings.list_embedding_models()
-    return any(spec.model == model_name for spec in specs)
+    """
+    Whether the server offers this model; the model list is fetched once per process.
+    """
+    return model_name in _served_model_names()
 
 
 if __name__ == "__main__":
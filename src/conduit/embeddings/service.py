@@ -0,0 +1,213 @@
+"""
+EmbeddingService: the async front door for embeddings.
+
+- Dedupe: each distinct text (by content hash) is embedded once per call, and
+  texts already in flight for another caller are awaited, not re-sent.
+- Persistence: vectors are looked up in an EmbeddingStore by (model, text hash)
+  before anything is sent, so re-running over unchanged chunks costs nothing.
+- Micro-batching: misses from concurrent callers are collected for
+  `batch_window` seconds (or until `max_batch_size` texts are waiting) and sent
+  together, in requests of at most max_batch_size texts, with at most
+  max_concurrent_batches requests open at once.
+
+Results are float32 NumPy arrays, one row per input text, in input order.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+from collections.abc import Sequence
+from functools import cache
+from typing import TYPE_CHECKING
+
+from conduit.embeddings.embedder import DEFAULT_EMBEDDING_MODEL
+from conduit.embeddings.store import text_key
+
+if TYPE_CHECKING:
+    import numpy as np
+    from conduit.embeddings.embedder import Embedder
+    from conduit.embeddings.store import EmbeddingStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_BATCH_WINDOW_SECONDS = 0.005
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+
+
+class EmbeddingService:
+    """
+    Deduplicating, persistently cached, micro-batching wrapper around an
+    Embedder. Implements the Embedder protocol itself.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        embedder: Embedder | None = None,
+        store: EmbeddingStore | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be at least 1")
+        if embedder is None:
+            from conduit.embeddings.embedder import HeadwaterEmbedder
+
+            embedder = HeadwaterEmbedder(model)
+        if store is None:
+            from conduit.embeddings.store import SQLiteEmbeddingStore
+
+            store = SQLiteEmbeddingStore()
+        self.model = model
+        self.embedder = embedder
+        self.store = store
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.max_concurrent_batches = max_concurrent_batches
+
+        # Batching state below belongs to one event loop (see _bind)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # key -> future for texts queued or being embedded
+        self._inflight: dict[str, asyncio.Future] = {}
+        # key -> text waiting for the next flush
+        self._queue: dict[str, str] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._send_slots = asyncio.Semaphore(max_concurrent_batches)
+
+        self.texts_requested = 0
+        self.texts_embedded = 0
+        self.store_hits = 0
+        self.batches_sent = 0
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        import numpy as np
+
+        self.texts_requested += len(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        keys = [text_key(text) for text in texts]
+        unique = dict(zip(keys, texts))
+
+        vectors = await self.store.get_many(self.model, list(unique))
+        self.store_hits += len(vectors)
+
+        missing = {key: text for key, text in unique.items() if key not in vectors}
+        if missing:
+            vectors.update(await self._request(missing))
+
+        return np.stack([vectors[key] for key in keys]).astype(np.float32, copy=False)
+
+    # Micro-batching
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Futures, the flush timer and send tasks are bound to the loop that made
+        them. The service is a process-wide singleton, so when it is used from a
+        new loop (e.g. a later asyncio.run after the last one closed mid-batch),
+        drop the old loop's state rather than await futures that can't resolve.
+        """
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.debug("Event loop changed; resetting embedding batch state")
+        self._loop = loop
+        self._inflight = {}
+        self._queue = {}
+        self._flush_handle = None
+        self._tasks = set()
+        self._send_slots = asyncio.Semaphore(self.max_concurrent_batches)
+
+    async def _request(self, items: dict[str, str]) -> dict[str, np.ndarray]:
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        futures: dict[str, asyncio.Future] = {}
+        for key, text in items.items():
+            future = self._inflight.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._inflight[key] = future
+                self._queue[key] = text
+            futures[key] = future
+
+        if len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._queue and self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        # Shielded: one caller being cancelled mustn't cancel a shared future
+        results = await asyncio.gather(*(asyncio.shield(f) for f in futures.values()))
+        return dict(zip(futures, results))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        queued = list(self._queue.items())
+        self._queue.clear()
+        for start in range(0, len(queued), self.max_batch_size):
+            batch = dict(queued[start : start + self.max_batch_size])
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: dict[str, str]) -> None:
+        self.batches_sent += 1
+        # Futures stay registered until resolved, so texts requested meanwhile
+        # join this batch instead of being sent again
+        futures = {key: self._inflight[key] for key in batch}
+        try:
+            async with self._send_slots:
+                matrix = await self.embedder.embed(list(batch.values()))
+            if len(matrix) != len(batch):
+                raise ValueError(
+                    f"Embedder returned {len(matrix)} vectors for {len(batch)} texts."
+                )
+            vectors = {key: matrix[row] for row, key in enumerate(batch)}
+            self.texts_embedded += len(vectors)
+            # Persist before resolving: callers may exit the event loop as soon
+            # as they have their vectors
+            try:
+                await self.store.set_many(self.model, vectors)
+            except Exception as e:
+                logger.warning(f"Could not persist {len(vectors)} embeddings: {e}")
+            for key, future in futures.items():
+                if not future.done():
+                    future.set_result(vectors[key])
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Retrieved here so futures whose callers were all cancelled
+                    # don't log "exception was never retrieved"
+                    future.exception()
+        finally:
+            for key, future in futures.items():
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "model": self.model,
+            "texts_requested": self.texts_requested,
+            "store_hits": self.store_hits,
+            "texts_embedded": self.texts_embedded,
+            "batches_sent": self.batches_sent,
+        }
+
+
+@cache
+def embedding_service(model: str = DEFAULT_EMBEDDING_MODEL) -> EmbeddingService:
+    """
+    The process-wide service for a model, so concurrent callers share batches,
+    in-flight texts and the persistent store.
+    """
+    return EmbeddingService(model)
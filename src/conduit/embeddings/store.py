@@ -0,0 +1,155 @@
+"""
+Persistent embedding storage, keyed by (model, text hash).
+
+Embeddings are a pure function of model and text, so they never expire; the
+store only grows. SQLiteEmbeddingStore is the default (one file under the
+conduit data dir); MemoryEmbeddingStore is for tests and throwaway runs.
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on bound parameters is 999
+_SELECT_CHUNK = 500
+
+
+def text_key(text: str) -> str:
+    """Content hash used as the cache key for a text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def default_store_path() -> Path:
+    from conduit.config import DATA_DIR
+
+    return DATA_DIR / "embeddings.sqlite"
+
+
+@runtime_checkable
+class EmbeddingStore(Protocol):
+    """
+    Async interface for persisted embeddings.
+    """
+
+    async def get_many(self, model: str, keys: list[str]) -> dict[str, np.ndarray]:
+        """
+        Return the stored vectors for these text keys; misses are omitted.
+        """
+        ...
+
+    async def set_many(self, model: str, vectors: dict[str, np.ndarray]) -> None:
+        """
+        Store text key -> vector pairs for this model.
+        """
+        ...
+
+
+class MemoryEmbeddingStore:
+    """
+    In-process store; nothing survives the process.
+    """
+
+    def __init__(self):
+        self._vectors: dict[tuple[str, str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    async def get_many(self, model: str, keys: list[str]) -> dict[str, np.ndarray]:
+        hits = {}
+        for key in keys:
+            vector = self._vectors.get((model, key))
+            if vector is not None:
+                hits[key] = vector
+        return hits
+
+    async def set_many(self, model: str, vectors: dict[str, np.ndarray]) -> None:
+        for key, vector in vectors.items():
+            self._vectors[(model, key)] = vector
+
+
+class SQLiteEmbeddingStore:
+    """
+    SQLite-backed store: float32 vectors as blobs. Queries run in a worker
+    thread so they don't block the event loop.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path) if path is not None else default_store_path()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, key)
+                )
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _get_many(self, model: str, keys: list[str]) -> dict[str, np.ndarray]:
+        import numpy as np
+
+        hits = {}
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), _SELECT_CHUNK):
+                chunk = keys[start : start + _SELECT_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? AND key IN ({placeholders})",
+                    [model, *chunk],
+                )
+                for key, blob in rows:
+                    hits[key] = np.frombuffer(blob, dtype=np.float32)
+        return hits
+
+    def _set_many(self, model: str, vectors: dict[str, np.ndarray]) -> None:
+        import numpy as np
+
+        rows = [
+            (model, key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in vectors.items()
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, key, vector) VALUES (?, ?, ?)",
+                    rows,
+                )
+
+    async def get_many(self, model: str, keys: list[str]) -> dict[str, np.ndarray]:
+        if not keys:
+            return {}
+        return await asyncio.to_thread(self._get_many, model, keys)
+
+    async def set_many(self, model: str, vectors: dict[str, np.ndarray]) -> None:
+        if vectors:
+            await asyncio.to_thread(self._set_many, model, vectors)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -145,6 +145,8 @@ async def middleware_context_manager(request: GenerationRequest):
                 model=model_name,
                 input_tokens=result.metadata.input_tokens,
                 output_tokens=result.metadata.output_tokens,
+                cache_read_tokens=result.metadata.cache_read_tokens,
+                cache_write_tokens=result.metadata.cache_write_tokens,
             )
             telemetry.emit_token_event(event)
 
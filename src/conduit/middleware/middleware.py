@@ -2,12 +2,16 @@ from __future__ import annotations
 from conduit.middleware.context_manager import middleware_context_manager
 from conduit.domain.request.request import GenerationRequest
 import functools
+import json
 import logging
+import time
 from typing import TYPE_CHECKING
-from collections.abc import Callable, Awaitable
+from collections.abc import AsyncIterator, Callable, Awaitable
 
 if TYPE_CHECKING:
+    from conduit.domain.result.response import GenerationResponse
     from conduit.domain.result.result import GenerationResult
+    from conduit.domain.result.stream_events import StreamEvent
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +49,12 @@ def middleware(
             # Check for cache hit (passed back from context manager)
             if ctx["cache_hit"] is True:
                 result = ctx["result"]
+            # Cacheable miss: coalesce with an identical request already in flight
+            elif request.options.cache is not None and request.options.use_cache:
+                result, shared = await _single_flight(request, func, args, kwargs)
+                # A shared result is treated as a cache hit: no cache write, no telemetry
+                ctx["cache_hit"] = shared
+                ctx["result"] = result
             # If no cache hit, execute the function
             else:
                 result = await func(*args, **kwargs)
@@ -58,3 +68,117 @@ def middleware(
         return result
 
     return async_wrapper
+
+
+async def _single_flight(
+    request: GenerationRequest,
+    func: Callable[..., Awaitable[GenerationResult]],
+    args: tuple,
+    kwargs: dict,
+) -> tuple[GenerationResult, bool]:
+    """
+    Run func through the process-wide SingleFlight, keyed by the request's cache key.
+    Returns (result, shared). Exactly one caller gets shared=False and writes the
+    cache and telemetry (a follower, if the caller that started the request was
+    cancelled); the others get their own copy, marked as a cache hit.
+    """
+    from conduit.domain.result.response import GenerationResponse
+    from conduit.middleware.single_flight import single_flight
+    from conduit.storage.cache.memory_cache import _detach
+
+    async def call() -> tuple[GenerationResult, GenerationResult]:
+        result = await func(*args, **kwargs)
+        # Snapshot before the first caller resumes and re-parents the message
+        snapshot = _detach(result) if isinstance(result, GenerationResponse) else result
+        return result, snapshot
+
+    (result, snapshot), shared = await single_flight.do(
+        request.generate_cache_key(), call
+    )
+    if not shared or not isinstance(snapshot, GenerationResponse):
+        return result, shared
+
+    response = _detach(snapshot)
+    response.metadata.cache_hit = True
+    return response, True
+
+
+def stream_middleware(
+    func: Callable[..., Awaitable[GenerationResult]],
+) -> Callable[..., AsyncIterator[StreamEvent]]:
+    """
+    Streaming counterpart of `middleware`.
+    The wrapped function returns the client's raw stream; the wrapper turns it into
+    typed delta events, assembles the final GenerationResponse, and hands it to
+    `middleware_context_manager` so caching and telemetry run exactly as for
+    non-streamed calls. Cache hits are replayed as deltas.
+    Ends with a ResponseComplete event. If the consumer stops early, the partial
+    response is neither cached nor counted.
+    """
+    from conduit.core.parser.stream.accumulator import StreamAccumulator
+    from conduit.domain.result.response import GenerationResponse
+    from conduit.domain.result.stream_events import ResponseComplete
+
+    @functools.wraps(func)
+    async def async_wrapper(*args: object, **kwargs: object) -> AsyncIterator[StreamEvent]:
+        request = get_request(*args, **kwargs)
+
+        async with middleware_context_manager(request) as ctx:
+            if ctx["cache_hit"] is True:
+                for event in replay_response(ctx["result"]):
+                    yield event
+            else:
+                start_time = time.time()
+                raw = await func(*args, **kwargs)
+                if isinstance(raw, GenerationResponse):
+                    # Client doesn't stream this output type; surface it as a single delta
+                    for event in replay_response(raw):
+                        yield event
+                    ctx["result"] = raw
+                else:
+                    accumulator = StreamAccumulator(
+                        provider=getattr(getattr(args[0], "client", None), "provider", None)
+                    )
+                    try:
+                        async for chunk in raw:
+                            for event in accumulator.feed(chunk):
+                                yield event
+                    finally:
+                        await _close_stream(raw)
+                    duration = (time.time() - start_time) * 1000
+                    ctx["result"] = accumulator.to_response(request, duration)
+
+        yield ResponseComplete(response=ctx["result"])
+
+    return async_wrapper
+
+
+def replay_response(response: GenerationResponse) -> list[StreamEvent]:
+    """
+    Express a complete response as the delta events a live stream would have produced.
+    """
+    from conduit.domain.result.stream_events import TextDelta, ToolCallDelta
+
+    events: list[StreamEvent] = []
+    message = response.message
+    if message.content:
+        events.append(TextDelta(text=str(message)))
+    for index, tool_call in enumerate(message.tool_calls or []):
+        events.append(
+            ToolCallDelta(
+                index=index,
+                id=tool_call.id,
+                name=tool_call.function_name,
+                arguments=json.dumps(tool_call.arguments),
+            )
+        )
+    return events
+
+
+async def _close_stream(stream: object) -> None:
+    close = getattr(stream, "close", None)
+    if close is None:
+        return
+    result = close()
+    if hasattr(result, "__await__"):
+        await result
@@ -0,0 +1,87 @@
+"""
+Single-flight coalescing of identical in-flight calls.
+
+When several callers request the same key at once (duplicate prompts in a batch,
+parallel eval configs sharing a request), only the first one runs the call; the
+others await the same result. The cache can't help here: every caller checks it
+before the first response has been written.
+
+The call runs in its own task, and each caller awaits it through asyncio.shield:
+- a caller that is cancelled stops waiting without affecting the others;
+- the underlying call is cancelled only once every caller has gone away;
+- an exception raised by the call is raised to every caller;
+- exactly one caller receives the result as its own (shared=False), normally the
+  one that started the call. If that caller was cancelled, the first surviving
+  waiter takes over, so a call that was paid for is still cached and metered.
+
+Calls are keyed per event loop, since a task can't be awaited from another loop.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call[R]:
+    __slots__ = ("claimed", "task", "waiters")
+
+    def __init__(self, task: asyncio.Task[R]):
+        self.task = task
+        self.waiters = 0
+        self.claimed = False
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, str], _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Run call() unless a call for key is already in flight, in which case wait
+        for that one. Returns (result, shared); shared is False for exactly one
+        caller: the first to receive the result (the starter, unless it left).
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (loop, key)
+        entry = self._calls.get(call_key)
+
+        if entry is None:
+            entry = _Call(loop.create_task(call()))
+            self._calls[call_key] = entry
+            entry.task.add_done_callback(lambda _: self._finish(call_key, entry))
+        else:
+            logger.debug(f"Coalescing with in-flight request {key[:12]}")
+
+        entry.waiters += 1
+        try:
+            result = await asyncio.shield(entry.task)
+            shared, entry.claimed = entry.claimed, True
+            return result, shared
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                # Nobody is waiting any more: abandon the underlying call
+                entry.task.cancel()
+
+    def _finish(self, call_key: tuple[asyncio.AbstractEventLoop, str], entry: _Call) -> None:
+        if self._calls.get(call_key) is entry:
+            del self._calls[call_key]
+        # Mark the exception retrieved even if every waiter was cancelled
+        if not entry.task.cancelled():
+            entry.task.exception()
+
+
+single_flight = SingleFlight()
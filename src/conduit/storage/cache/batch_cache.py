@@ -0,0 +1,107 @@
+from __future__ import annotations
+import logging
+from typing import TYPE_CHECKING
+from conduit.storage.cache.memory_cache import _detach
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from conduit.domain.request.request import GenerationRequest
+    from conduit.domain.result.response import GenerationResponse
+    from conduit.storage.cache.protocol import BatchConduitCache
+
+
+class AsyncBatchCache:
+    """
+    Batch-scoped view over a BatchConduitCache, used by ConduitBatchAsync.
+
+    - prefetch() resolves every known cache key in one get_many() call.
+    - get() answers prefetched keys from memory (hits and known misses alike),
+      and only falls through to the backend for keys it has never seen
+      (e.g. follow-up steps of a tool loop).
+    - set() buffers writes; flush() sends them back as one set_many() upsert.
+    - discard() drops a prefetched entry once its item is done, so a streamed
+      batch only holds the keys of items in flight.
+    """
+
+    def __init__(self, backend: BatchConduitCache):
+        self.backend = backend
+        self._prefetched: dict[str, GenerationResponse | None] = {}
+        self._pending: dict[str, GenerationResponse] = {}
+
+    @property
+    def project_name(self) -> str:
+        return self.backend.project_name
+
+    async def prefetch(self, keys: list[str]) -> int:
+        """
+        Resolve keys in bulk. Returns the number of hits.
+        """
+        unique_keys = [key for key in dict.fromkeys(keys) if key not in self._prefetched]
+        if not unique_keys:
+            return 0
+
+        hits = await self.backend.get_many(unique_keys)
+        for key in unique_keys:
+            self._prefetched[key] = hits.get(key)
+        logger.info(
+            f"Batch cache prefetch: {len(hits)} hits, {len(unique_keys) - len(hits)} misses."
+        )
+        return len(hits)
+
+    def is_hit(self, key: str | None) -> bool:
+        """
+        True if prefetch() found key in the backend.
+        """
+        return self._prefetched.get(key) is not None
+
+    def discard(self, key: str | None) -> None:
+        """
+        Forget a prefetched key once its item is done, keeping memory bounded
+        on long batches. A later lookup falls through to the backend.
+        """
+        self._prefetched.pop(key, None)
+
+    @property
+    def pending_writes(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        """
+        Write all buffered responses back in a single bulk upsert.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        logger.debug(f"Batch cache flush: writing {len(pending)} entries.")
+        await self.backend.set_many(pending)
+
+    # ConduitCache protocol
+    async def get(self, request: GenerationRequest) -> GenerationResponse | None:
+        key = request.generate_cache_key()
+        if key in self._pending:
+            return _detach(self._pending[key])
+        if key in self._prefetched:
+            cached = self._prefetched[key]
+            return _detach(cached) if cached is not None else None
+        return await self.backend.get(request)
+
+    async def get_all(self) -> list[GenerationResponse]:
+        return await self.backend.get_all()
+
+    async def set(
+        self, request: GenerationRequest, response: GenerationResponse
+    ) -> None:
+        # The Engine re-parents the message into the Conversation before flush()
+        self._pending[request.generate_cache_key()] = _detach(response)
+
+    async def wipe(self) -> None:
+        self._prefetched.clear()
+        self._pending.clear()
+        await self.backend.wipe()
+
+    async def cache_stats(self) -> dict[str, object]:
+        stats = await self.backend.cache_stats()
+        stats["prefetched"] = len(self._prefetched)
+        stats["pending_writes"] = len(self._pending)
+        return stats
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import time
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from conduit.domain.request.request import GenerationRequest
+    from conduit.domain.result.response import GenerationResponse
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+class AsyncMemoryCache:
+    """
+    In-process, size-bounded LRU cache with per-entry TTL.
+    Implements the ConduitCache protocol; nothing survives the process.
+    """
+
+    def __init__(
+        self,
+        project_name: str = "memory",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.project_name = project_name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, response); ordered from least to most recently used
+        self._entries: OrderedDict[str, tuple[float, GenerationResponse]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._start_time = time.time()
+
+    # Key-level access (used by AsyncTieredCache to avoid re-hashing requests)
+    def get_by_key(self, key: str) -> GenerationResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return _detach(response)
+
+    def set_by_key(self, key: str, response: GenerationResponse) -> None:
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else float("inf")
+        )
+        self._entries[key] = (expires_at, _detach(response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # ConduitCache protocol
+    async def get(self, request: GenerationRequest) -> GenerationResponse | None:
+        return self.get_by_key(request.generate_cache_key())
+
+    async def get_all(self) -> list[GenerationResponse]:
+        now = time.monotonic()
+        return [
+            _detach(response)
+            for expires_at, response in self._entries.values()
+            if expires_at >= now
+        ]
+
+    async def set(
+        self, request: GenerationRequest, response: GenerationResponse
+    ) -> None:
+        self.set_by_key(request.generate_cache_key(), response)
+
+    # BatchConduitCache protocol
+    async def get_many(self, keys: list[str]) -> dict[str, GenerationResponse]:
+        hits = {}
+        for key in dict.fromkeys(keys):
+            response = self.get_by_key(key)
+            if response is not None:
+                hits[key] = response
+        return hits
+
+    async def set_many(self, entries: dict[str, GenerationResponse]) -> None:
+        for key, response in entries.items():
+            self.set_by_key(key, response)
+
+    async def wipe(self) -> None:
+        self.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._start_time = time.time()
+
+    async def cache_stats(self) -> dict[str, object]:
+        return {
+            "cache_name": self.project_name,
+            "total_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "uptime_seconds": time.time() - self._start_time,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+
+def _detach(response: GenerationResponse) -> GenerationResponse:
+    """
+    Return a copy that callers may mutate without touching the cached entry.
+    The middleware flips metadata.cache_hit and the Engine re-parents the message
+    into a Conversation, so both are copied; the request (and its potentially
+    large multimodal payloads) is shared read-only.
+    """
+    return response.model_copy(
+        update={
+            "message": response.message.model_copy(),
+            "metadata": response.metadata.model_copy(),
+        }
+    )
@@ -67,6 +67,35 @@ class AsyncPostgresCache:
         payload = json.loads(row["payload"])
         return GenerationResponse.model_validate(payload)
 
+    async def get_many(self, keys: list[str]) -> dict[str, GenerationResponse]:
+        """
+        Resolve many cache keys in one round trip.
+        Returns only the hits, keyed by cache_key.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        pool = await self._ensure_ready()
+        query = """
+            SELECT cache_key, payload
+            FROM conduit_cache_entries
+            WHERE cache_name = $1 AND cache_key = ANY($2::text[])
+        """
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(query, self.project_name, unique_keys)
+
+        hits = {
+            row["cache_key"]: GenerationResponse.model_validate(
+                json.loads(row["payload"])
+            )
+            for row in rows
+        }
+        self._hits += len(hits)
+        self._misses += len(unique_keys) - len(hits)
+        return hits
+
     async def get_all(self) -> list[GenerationResponse]:
         pool = await self._ensure_ready()
 
@@ -105,6 +134,30 @@ class AsyncPostgresCache:
         async with pool.acquire() as conn:
             await conn.execute(query, self.project_name, key, payload)
 
+    async def set_many(self, entries: dict[str, GenerationResponse]) -> None:
+        """
+        Bulk upsert of key -> response pairs as a single statement.
+        """
+        if not entries:
+            return
+
+        pool = await self._ensure_ready()
+        keys = list(entries.keys())
+        payloads = [entries[key].model_dump_json() for key in keys]
+
+        query = """
+            INSERT INTO conduit_cache_entries (cache_name, cache_key, payload)
+            SELECT $1, entry.cache_key, entry.payload
+            FROM unnest($2::text[], $3::jsonb[]) AS entry(cache_key, payload)
+            ON CONFLICT (cache_name, cache_key)
+            DO UPDATE SET
+                payload = EXCLUDED.payload,
+                updated_at = now()
+        """
+
+        async with pool.acquire() as conn:
+            await conn.execute(query, self.project_name, keys, payloads)
+
     async def wipe(self) -> None:
         pool = await self._ensure_ready()
         query = "DELETE FROM conduit_cache_entries WHERE cache_name = $1"
@@ -243,5 +296,57 @@ class AsyncPostgresCache:
             "updated_at": row["updated_at"],
         }
 
+    async def migrate_keys(self) -> tuple[int, int]:
+        """
+        Re-key this cache_name's entries written under the legacy (version 1) key
+        scheme, recomputing both keys from the request stored in each payload.
+        Rows whose stored key doesn't match the recomputed legacy key are left
+        alone: already migrated, or not reproducible (structured responses keyed
+        on a response_model class, which isn't serialized). Rows whose new key
+        already exists are left alone too.
+        Returns (migrated, skipped).
+        """
+        pool = await self._ensure_ready()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT cache_key, payload FROM conduit_cache_entries WHERE cache_name = $1",
+                self.project_name,
+            )
+
+        old_keys: list[str] = []
+        new_keys: list[str] = []
+        for row in rows:
+            try:
+                request = GenerationResponse.model_validate(
+                    json.loads(row["payload"])
+                ).request
+            except Exception as e:
+                logger.debug(f"Skipping unreadable cache entry {row['cache_key']}: {e}")
+                continue
+            if request.generate_legacy_cache_key() != row["cache_key"]:
+                continue
+            old_keys.append(row["cache_key"])
+            new_keys.append(request.generate_cache_key())
+
+        if not old_keys:
+            return 0, len(rows)
+
+        query = """
+            UPDATE conduit_cache_entries AS entry
+            SET cache_key = rekey.new_key
+            FROM unnest($2::text[], $3::text[]) AS rekey(old_key, new_key)
+            WHERE entry.cache_name = $1
+              AND entry.cache_key = rekey.old_key
+              AND NOT EXISTS (
+                  SELECT 1 FROM conduit_cache_entries AS existing
+                  WHERE existing.cache_name = $1
+                    AND existing.cache_key = rekey.new_key
+              )
+        """
+        async with pool.acquire() as conn:
+            result = await conn.execute(query, self.project_name, old_keys, new_keys)
+        migrated = int(result.split()[-1])
+        return migrated, len(rows) - migrated
+
     def _request_to_key(self, request: GenerationRequest) -> str:
         return request.generate_cache_key()
@@ -46,3 +46,23 @@ class ConduitCache(Protocol):
         Return stats like total_entries, size, etc.
         """
         ...
+
+
+@runtime_checkable
+class BatchConduitCache(ConduitCache, Protocol):
+    """
+    Optional extension for caches that can resolve and store many keys at once.
+    ConduitBatchAsync uses it to replace N point lookups with one query.
+    """
+
+    async def get_many(self, keys: list[str]) -> dict[str, GenerationResponse]:
+        """
+        Return the cached Responses for the given cache keys; misses are omitted.
+        """
+        ...
+
+    async def set_many(self, entries: dict[str, GenerationResponse]) -> None:
+        """
+        Store or update many cache_key -> Response pairs in one operation.
+        """
+        ...
@@ -0,0 +1,247 @@
+from __future__ import annotations
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from conduit.storage.cache.memory_cache import DEFAULT_MAX_ENTRIES, _detach
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import numpy as np
+    from conduit.domain.request.request import GenerationRequest
+    from conduit.domain.result.response import GenerationResponse
+    from conduit.embeddings.embedder import Embedder
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+DEFAULT_TOP_K = 5
+_INITIAL_CAPACITY = 64
+
+
+def query_text(request: GenerationRequest) -> str | None:
+    """
+    The text the cache matches on: the final user turn. None if the request
+    doesn't end in a text-only user message (tool results, images, audio),
+    which are never served semantically.
+    """
+    from conduit.domain.message.message import TextContent
+    from conduit.domain.message.role import Role
+
+    if not request.messages or request.messages[-1].role != Role.USER:
+        return None
+    content = request.messages[-1].content
+    if isinstance(content, str):
+        return content.strip() or None
+    if isinstance(content, list) and all(
+        isinstance(part, (str, TextContent)) for part in content
+    ):
+        text = "\n".join(p if isinstance(p, str) else p.text for p in content)
+        return text.strip() or None
+    return None
+
+
+def scope_key(request: GenerationRequest) -> str:
+    """
+    Requests are only matched against entries with the same model, generation
+    params and system prompt.
+    """
+    from conduit.domain.message.digest import canonical_json_bytes, message_digest
+    from conduit.domain.message.role import Role
+
+    system = [message_digest(m) for m in request.messages if m.role == Role.SYSTEM]
+    payload = {"params": request._normalize_params_for_cache(), "system": system}
+    return hashlib.sha256(canonical_json_bytes(payload)).hexdigest()
+
+
+class _ScopeIndex:
+    """
+    Normalized embeddings for one scope, as rows of a preallocated matrix
+    (grown by doubling), with the entries they point at.
+    """
+
+    def __init__(self, dimensions: int):
+        import numpy as np
+
+        self.matrix = np.zeros((_INITIAL_CAPACITY, dimensions), dtype=np.float32)
+        self.entries: list[tuple[str, GenerationResponse]] = []
+        self.rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, vector: np.ndarray, text: str, response: GenerationResponse) -> None:
+        import numpy as np
+
+        count = len(self.entries)
+        if count == len(self.matrix):
+            grown = np.zeros((2 * count, self.matrix.shape[1]), dtype=np.float32)
+            grown[:count] = self.matrix
+            self.matrix = grown
+        self.matrix[count] = vector
+        self.entries.append((text, response))
+        self.rows[text] = count
+
+    def remove(self, row: int) -> None:
+        # Move the last row into the hole so the live rows stay contiguous
+        last = len(self.entries) - 1
+        del self.rows[self.entries[row][0]]
+        if row != last:
+            self.matrix[row] = self.matrix[last]
+            self.entries[row] = self.entries[last]
+            self.rows[self.entries[row][0]] = row
+        self.entries.pop()
+
+    def find(self, text: str) -> int | None:
+        return self.rows.get(text)
+
+    def search(self, vector: np.ndarray, k: int) -> list[tuple[int, float]]:
+        """Top-k (row, cosine similarity), best first."""
+        from conduit.utils.vector import top_k
+
+        scores = self.matrix[: len(self.entries)] @ vector
+        return [(int(row), float(scores[row])) for row in top_k(scores, k)]
+
+
+class SemanticCache:
+    """
+    Embedding-similarity response cache. Implements the ConduitCache protocol.
+
+    Where the exact-match caches key on the whole request, this one embeds the
+    final user turn and serves the stored response of the most similar earlier
+    prompt, if its cosine similarity reaches `threshold`. Entries are scoped by
+    model, generation params and system prompt, so a hit never crosses those.
+    Earlier conversation turns are not compared; only the final user turn is.
+
+    The index is in-process (one NumPy matrix per scope, searched with a single
+    matrix-vector product); entries are evicted oldest-first past max_entries.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        project_name: str = "semantic",
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        top_k: int = DEFAULT_TOP_K,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if not -1.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be a cosine similarity in [-1, 1]")
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.embedder = embedder
+        self.project_name = project_name
+        self.threshold = threshold
+        self.top_k = top_k
+        self.max_entries = max_entries
+        self._scopes: dict[str, _ScopeIndex] = {}
+        # Insertion order across scopes, for eviction: (scope, text)
+        self._order: dict[tuple[str, str], None] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._start_time = time.time()
+
+    async def _embed(self, text: str) -> np.ndarray:
+        from conduit.utils.vector import normalize
+
+        return normalize((await self.embedder.embed([text]))[0])
+
+    async def search(
+        self, request: GenerationRequest, k: int | None = None
+    ) -> list[tuple[float, GenerationResponse]]:
+        """
+        The k nearest cached entries in the request's scope as (similarity,
+        response), best first, regardless of threshold.
+        """
+        text = query_text(request)
+        index = self._scopes.get(scope_key(request)) if text else None
+        if index is None or not len(index):
+            return []
+        vector = await self._embed(text)
+        return [
+            (score, _detach(index.entries[row][1]))
+            for row, score in index.search(vector, k or self.top_k)
+        ]
+
+    # ConduitCache protocol
+    async def get(self, request: GenerationRequest) -> GenerationResponse | None:
+        text = query_text(request)
+        index = self._scopes.get(scope_key(request)) if text else None
+        if index is None or not len(index):
+            self._misses += 1
+            return None
+
+        # Exact repeats don't need an embedding
+        row = index.find(text)
+        if row is not None:
+            self._hits += 1
+            return _detach(index.entries[row][1])
+
+        vector = await self._embed(text)
+        for row, score in index.search(vector, self.top_k):
+            if score < self.threshold:
+                break
+            self._hits += 1
+            logger.debug(f"Semantic cache hit (similarity {score:.3f})")
+            return _detach(index.entries[row][1])
+        self._misses += 1
+        return None
+
+    async def get_all(self) -> list[GenerationResponse]:
+        return [
+            _detach(response)
+            for index in self._scopes.values()
+            for _, response in index.entries
+        ]
+
+    async def set(
+        self, request: GenerationRequest, response: GenerationResponse
+    ) -> None:
+        text = query_text(request)
+        if text is None:
+            return
+        scope = scope_key(request)
+        vector = await self._embed(text)
+
+        index = self._scopes.get(scope)
+        if index is None:
+            index = self._scopes[scope] = _ScopeIndex(len(vector))
+        row = index.find(text)
+        if row is not None:
+            index.remove(row)
+        index.add(vector, text, _detach(response))
+
+        self._order.pop((scope, text), None)
+        self._order[(scope, text)] = None
+        while len(self._order) > self.max_entries:
+            oldest_scope, oldest_text = next(iter(self._order))
+            del self._order[(oldest_scope, oldest_text)]
+            oldest = self._scopes[oldest_scope]
+            oldest.remove(oldest.find(oldest_text))
+            if not len(oldest):
+                del self._scopes[oldest_scope]
+            self._evictions += 1
+
+    async def wipe(self) -> None:
+        self._scopes.clear()
+        self._order.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._start_time = time.time()
+
+    async def cache_stats(self) -> dict[str, object]:
+        return {
+            "cache_name": self.project_name,
+            "total_entries": len(self._order),
+            "scopes": len(self._scopes),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "uptime_seconds": time.time() - self._start_time,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
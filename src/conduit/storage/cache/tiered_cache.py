@@ -0,0 +1,140 @@
+from __future__ import annotations
+import logging
+from typing import TYPE_CHECKING
+from conduit.storage.cache.memory_cache import (
+    AsyncMemoryCache,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from conduit.domain.request.request import GenerationRequest
+    from conduit.domain.result.response import GenerationResponse
+    from conduit.storage.cache.postgres_cache_async import AsyncPostgresCache
+
+
+class AsyncTieredCache:
+    """
+    Two-tier cache: an in-process LRU/TTL tier in front of a persistent backend
+    (normally AsyncPostgresCache).
+
+    - Reads hit memory first and fall through to the backend on a miss;
+      backend hits are promoted into memory.
+    - Writes go to both tiers.
+    - cache_stats() reports the backend stats plus per-tier hit/miss counters.
+    """
+
+    def __init__(
+        self,
+        backend: AsyncPostgresCache,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+    ):
+        self.backend = backend
+        self.memory = AsyncMemoryCache(
+            project_name=backend.project_name,
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+        self._backend_hits = 0
+        self._backend_misses = 0
+
+    @property
+    def project_name(self) -> str:
+        return self.backend.project_name
+
+    @property
+    def db_name(self) -> str:
+        return self.backend.db_name
+
+    # ConduitCache protocol
+    async def get(self, request: GenerationRequest) -> GenerationResponse | None:
+        key = request.generate_cache_key()
+        cached = self.memory.get_by_key(key)
+        if cached is not None:
+            return cached
+
+        cached = await self.backend.get(request)
+        if cached is None:
+            self._backend_misses += 1
+            return None
+
+        self._backend_hits += 1
+        self.memory.set_by_key(key, cached)
+        return cached
+
+    # BatchConduitCache protocol
+    async def get_many(self, keys: list[str]) -> dict[str, GenerationResponse]:
+        hits = await self.memory.get_many(keys)
+        remaining = [key for key in dict.fromkeys(keys) if key not in hits]
+        if not remaining:
+            return hits
+
+        backend_hits = await self.backend.get_many(remaining)
+        self._backend_hits += len(backend_hits)
+        self._backend_misses += len(remaining) - len(backend_hits)
+        await self.memory.set_many(backend_hits)
+        hits.update(backend_hits)
+        return hits
+
+    async def set_many(self, entries: dict[str, GenerationResponse]) -> None:
+        await self.memory.set_many(entries)
+        await self.backend.set_many(entries)
+
+    async def get_all(self) -> list[GenerationResponse]:
+        return await self.backend.get_all()
+
+    async def set(
+        self, request: GenerationRequest, response: GenerationResponse
+    ) -> None:
+        self.memory.set_by_key(request.generate_cache_key(), response)
+        await self.backend.set(request, response)
+
+    async def wipe(self) -> None:
+        await self.memory.wipe()
+        await self.backend.wipe()
+        self._backend_hits = 0
+        self._backend_misses = 0
+
+    async def cache_stats(self) -> dict[str, object]:
+        stats = await self.backend.cache_stats()
+        memory_stats = await self.memory.cache_stats()
+        stats["tiers"] = {
+            "memory": {
+                "hits": memory_stats["hits"],
+                "misses": memory_stats["misses"],
+                "entries": memory_stats["total_entries"],
+                "max_entries": memory_stats["max_entries"],
+                "ttl_seconds": memory_stats["ttl_seconds"],
+                "evictions": memory_stats["evictions"],
+            },
+            "postgres": {
+                "hits": self._backend_hits,
+                "misses": self._backend_misses,
+            },
+        }
+        # Overall counters: a hit in either tier is a hit; only backend misses miss.
+        stats["hits"] = memory_stats["hits"] + self._backend_hits
+        stats["misses"] = self._backend_misses
+        return stats
+
+    # Backend maintenance passthroughs (keep the memory tier consistent)
+    async def ls_all(self) -> list[dict[str, object]]:
+        return await self.backend.ls_all()
+
+    async def inspect_latest(self) -> dict[str, object] | None:
+        return await self.backend.inspect_latest()
+
+    async def delete_older_than(self, pg_interval: str) -> int:
+        self.memory.clear()
+        return await self.backend.delete_older_than(pg_interval)
+
+    async def wipe_all(self) -> int:
+        self.memory.clear()
+        return await self.backend.wipe_all()
+
+    async def migrate_keys(self) -> tuple[int, int]:
+        self.memory.clear()
+        return await self.backend.migrate_keys()
@@ -0,0 +1,232 @@
+"""
+Append-only JSONL write-ahead log for TokenEvents.
+
+Every event is appended to the log as soon as it is emitted, so nothing is lost if
+the process dies before the next flush, and unflushed events don't have to be held
+in memory. The log is split into segments:
+
+- a registry appends to its own segments, {run_id}.{seq}.jsonl, rotating once a
+  segment passes `segment_bytes`;
+- the flusher reads from a cursor (segment, byte offset) in bounded batches, and a
+  segment is deleted once the cursor has moved past it, so disk use stays around
+  one segment plus whatever hasn't been flushed yet;
+- each registry holds an advisory lock on {run_id}.lock while it's alive. Segments
+  whose lock can be taken belong to a process that died, and are replayed.
+
+Replay is idempotent: events carry an event_id and the backend skips IDs it has
+already stored, so replaying a segment that was partly flushed doesn't double count.
+"""
+
+from __future__ import annotations
+import logging
+from contextlib import ExitStack, suppress
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from conduit.storage.odometer.token_event import TokenEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, so every other log counts as orphaned
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True, order=True)
+class Cursor:
+    segment: int
+    offset: int
+
+
+def _try_lock(handle: IO[bytes]) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def read_events(
+    path: Path, offset: int = 0, limit: int | None = None
+) -> tuple[list[TokenEvent], int]:
+    """
+    Read complete lines from path starting at a byte offset.
+    Returns (events, offset after the last line read). A trailing line without a
+    newline is a write in progress (or torn by a crash) and is left unread;
+    corrupt lines are skipped.
+    """
+    events: list[TokenEvent] = []
+    # A missing segment was already committed and deleted
+    with suppress(FileNotFoundError), open(path, "rb") as handle:
+        handle.seek(offset)
+        for raw in handle:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            try:
+                events.append(TokenEvent.model_validate_json(raw))
+            except ValidationError as e:
+                logger.warning(f"Skipping corrupt odometer log line in {path.name}: {e}")
+                continue
+            if limit is not None and len(events) >= limit:
+                break
+    return events, offset
+
+
+class EventLog:
+    """
+    Write-ahead log of TokenEvents for one OdometerRegistry.
+    """
+
+    def __init__(self, directory: Path, segment_bytes: int = SEGMENT_BYTES):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.run_id = uuid.uuid4().hex
+        self.appended = 0
+        self.committed = 0
+        self._lock = threading.Lock()
+        # Handles held open across calls: the lock file for the log's lifetime,
+        # the current segment until rotation
+        self._held = ExitStack()
+        self._segment_files = ExitStack()
+        self._lock_file: IO[bytes] | None = None
+        self._file: IO[bytes] | None = None
+        self._segment = 0
+        self._size = 0
+        self._cursor = Cursor(0, 0)
+
+    @property
+    def pending(self) -> int:
+        """Events appended by this process and not yet committed."""
+        return self.appended - self.committed
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"{self.run_id}.{segment:06d}.jsonl"
+
+    def _open_segment(self) -> None:
+        if self._lock_file is None:
+            # Created lazily: nothing touches disk until the first event
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._lock_file = self._held.enter_context(
+                open(self.directory / f"{self.run_id}.lock", "ab")
+            )
+            _try_lock(self._lock_file)
+        self._file = self._segment_files.enter_context(
+            open(self._segment_path(self._segment), "ab")
+        )
+        self._size = self._file.tell()
+
+    def append(self, event: TokenEvent) -> None:
+        line = event.model_dump_json().encode("utf-8") + b"\n"
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            elif self._size >= self.segment_bytes:
+                self._segment_files.close()
+                self._segment += 1
+                self._open_segment()
+            # One write per event, flushed so a crash loses at most the OS buffer
+            self._file.write(line)
+            self._file.flush()
+            self._size += len(line)
+            self.appended += 1
+
+    def read(self, max_events: int) -> tuple[list[TokenEvent], Cursor]:
+        """
+        Up to max_events past the committed cursor, and the cursor just after them.
+        Nothing is consumed until commit().
+        """
+        with self._lock:
+            if self._file is None:
+                return [], self._cursor
+            current = self._segment
+            cursor = self._cursor
+
+        events: list[TokenEvent] = []
+        while True:
+            batch, offset = read_events(
+                self._segment_path(cursor.segment), cursor.offset, max_events - len(events)
+            )
+            events.extend(batch)
+            cursor = Cursor(cursor.segment, offset)
+            if len(events) >= max_events or cursor.segment >= current:
+                return events, cursor
+            # End of a closed segment: carry on in the next one
+            cursor = Cursor(cursor.segment + 1, 0)
+
+    def commit(self, cursor: Cursor, count: int) -> None:
+        """
+        Mark everything before cursor as stored; fully consumed segments are deleted.
+        """
+        with self._lock:
+            for segment in range(self._cursor.segment, cursor.segment):
+                self._segment_path(segment).unlink(missing_ok=True)
+            self._cursor = max(self._cursor, cursor)
+            self.committed += count
+
+    def close(self) -> None:
+        """
+        Close the log. If everything was committed the files are removed; otherwise
+        they are left (and the lock released) for the next process to replay.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._segment_files.close()
+                self._file = None
+                if self.pending == 0:
+                    for segment in range(self._cursor.segment, self._segment + 1):
+                        self._segment_path(segment).unlink(missing_ok=True)
+            if self._lock_file is not None:
+                self._held.close()
+                if self.pending == 0:
+                    (self.directory / f"{self.run_id}.lock").unlink(missing_ok=True)
+                self._lock_file = None
+
+    def orphans(self) -> Iterator[tuple[list[Path], IO[bytes] | None]]:
+        """
+        Yield (segments, held lock) for each dead process that left events behind,
+        oldest segment first. The caller replays the segments, deletes them, and
+        then calls release_orphan() with the lock.
+        """
+        if not self.directory.exists():
+            return
+
+        by_run: dict[str, list[Path]] = {}
+        for path in self.directory.glob("*.jsonl"):
+            run_id = path.name.split(".", 1)[0]
+            if run_id != self.run_id:
+                by_run.setdefault(run_id, []).append(path)
+        for lock_path in self.directory.glob("*.lock"):
+            if lock_path.stem != self.run_id:
+                by_run.setdefault(lock_path.stem, [])
+
+        for run_id, segments in sorted(by_run.items()):
+            lock_path = self.directory / f"{run_id}.lock"
+            handle: IO[bytes] | None = None
+            if lock_path.exists():
+                with ExitStack() as stack:
+                    handle = stack.enter_context(open(lock_path, "ab"))
+                    if not _try_lock(handle):
+                        continue  # Still alive; the handle is closed on exit
+                    # Locked: hand the handle to the caller (see release_orphan)
+                    stack.pop_all()
+            yield sorted(segments), handle
+
+    def release_orphan(self, handle: IO[bytes] | None) -> None:
+        if handle is None:
+            return
+        Path(handle.name).unlink(missing_ok=True)
+        handle.close()
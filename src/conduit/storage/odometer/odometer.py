@@ -12,8 +12,10 @@ class Odometer(BaseModel):
     In-memory odometer for tracking token usage and derived aggregates.
     """
 
-    # Raw event storage
+    # Raw event storage: the most recent max_events only (the registry's event log
+    # holds everything until it reaches the DB)
     events: list[TokenEvent] = Field(default_factory=list)
+    max_events: int = Field(default=10_000)
 
     # Aggregated totals
     total_input_tokens: int = Field(default=0)
@@ -42,6 +44,9 @@ class Odometer(BaseModel):
         """
         logger.debug(f"Recording TokenEvent: {token_event}")
         self.events.append(token_event)
+        if len(self.events) > 2 * self.max_events:
+            # Trim in bulk so long-running processes stay at constant memory
+            del self.events[: -self.max_events]
 
         # Update Aggregates (Keep running totals in memory)
         self.total_input_tokens += token_event.input_tokens
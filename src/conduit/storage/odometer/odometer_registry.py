@@ -1,8 +1,12 @@
 from conduit.storage.odometer.odometer import Odometer
 from conduit.storage.odometer.token_event import TokenEvent
+from conduit.storage.odometer.event_log import EventLog, read_events
 from conduit.storage.odometer.pgres.postgres_backend_async import AsyncPostgresOdometer
 from conduit.config import settings
+from pathlib import Path
+import asyncio
 import atexit
+import contextlib
 import signal
 import sys
 import json
@@ -11,6 +15,8 @@ from types import FrameType
 
 logger = logging.getLogger(__name__)
 
+EVENT_LOG_DIR = settings.paths["DATA_DIR"] / "odometer_log"
+# Written by older versions on exit; still ingested by recover()
 RESCUE_FILE = settings.paths["DATA_DIR"] / "odometer_rescue.json"
 
 
@@ -19,16 +25,35 @@ class OdometerRegistry:
     Central entry point for tracking token usage.
 
     Architecture:
-    - Hot Path: flush() calls asyncpg to save to DB.
-    - Cold Path: atexit/signal hooks dump to JSON file (Rescue File).
-    - Recovery: On init, checks for Rescue File and ingests it.
+    - Write-ahead: emit_token_event() appends each event to an append-only JSONL
+      log (EventLog) and updates the in-memory aggregates.
+    - Hot Path: a background task flushes the log to the DB in batches of
+      batch_size, whenever batch_size events are pending or every flush_interval
+      seconds. flush() does the same on demand.
+    - Recovery: the flusher first replays logs left behind by dead processes.
+      Events carry IDs and the backend ignores duplicates, so replay is idempotent.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        log_dir: Path = EVENT_LOG_DIR,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+    ):
         self.session_odometer: Odometer = Odometer()
         # We instantiate the backend here. Since it's lazy, it won't connect yet.
         self.async_backend = AsyncPostgresOdometer(db_name="conduit")
+        self.event_log = EventLog(log_dir)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self._saved_on_exit: bool = False
+        self._recovered: bool = False
+
+        # Flusher state is bound to the loop it runs on
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flusher: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
 
         # Register Hooks
         atexit.register(self._save_on_exit)
@@ -36,26 +61,75 @@ class OdometerRegistry:
         signal.signal(signal.SIGTERM, self._signal_handler)
 
     def emit_token_event(self, event: TokenEvent) -> None:
-        """Record an event in the in-memory buffer."""
+        """Append an event to the log and the in-memory aggregates."""
         self.session_odometer.record(event)
+        self.event_log.append(event)
 
-    async def flush(self) -> None:
+        self._ensure_flusher()
+        if self._wakeup is not None and self.event_log.pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _ensure_flusher(self) -> None:
         """
-        HOT PATH: Async flush to database.
-        Call this periodically or at the end of requests.
+        Start the background flusher on the running loop, if there is one.
+        Sync callers run a loop per call (or per batch), so restart it as needed.
         """
-        # 1. Atomic Pop
-        batch = self.session_odometer.pop_events()
-        if not batch:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: events stay in the log until the next flush
+        if self._loop is loop and self._flusher is not None and not self._flusher.done():
             return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher = loop.create_task(self._run_flusher(self._wakeup))
+
+    async def _run_flusher(self, wakeup: asyncio.Event) -> None:
+        if not self._recovered:
+            self._recovered = True
+            await self.recover()
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval)
+            wakeup.clear()
+            if self.event_log.pending:
+                await self.flush()
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._flush_lock is None or self._loop is not loop:
+            self._loop = loop
+            self._flush_lock = asyncio.Lock()
+        return self._flush_lock
 
-        try:
-            # 2. Async Write
-            await self.async_backend.store_events(batch)
-        except Exception as e:
-            logger.error(f"Odometer async flush failed: {e}")
-            # 3. Safety Requeue (so they are saved to disk if app crashes)
-            self.session_odometer.requeue_events(batch)
+    async def flush(self) -> None:
+        """
+        HOT PATH: Async flush of the log to the database, in batches.
+        Runs in the background; call this directly to drain before exiting.
+        """
+        async with self._lock():
+            while True:
+                batch, cursor = self.event_log.read(self.batch_size)
+                if not batch:
+                    return
+                try:
+                    await self.async_backend.store_events(batch)
+                except Exception as e:
+                    # Events stay in the log: retried next flush, or replayed after a crash
+                    logger.error(f"Odometer async flush failed: {e}")
+                    return
+                self.event_log.commit(cursor, len(batch))
+
+    async def stop(self) -> None:
+        """
+        Stop the background flusher and flush what's left.
+        """
+        if self._flusher is not None and self._loop is asyncio.get_running_loop():
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
 
     def _signal_handler(self, signum: int, frame: FrameType | None) -> None:
         """Handle interrupt signals by triggering save_on_exit."""
@@ -64,41 +138,54 @@ class OdometerRegistry:
 
     def _save_on_exit(self) -> None:
         """
-        COLD PATH: Synchronous dump to JSON file.
+        COLD PATH: Close the log. Unflushed events are already on disk and are
+        replayed by the next process; nothing needs rewriting here.
         Executed during interpreter shutdown.
         """
         if self._saved_on_exit:
             return
         self._saved_on_exit = True
 
-        # Grab everything remaining
-        batch = self.session_odometer.pop_events()
-        if not batch:
-            return
-
-        try:
-            # Simple JSON dump
-            data = [e.model_dump() for e in batch]
-
-            # If file exists (rare double crash), append
-            if RESCUE_FILE.exists():
-                try:
-                    existing = json.loads(RESCUE_FILE.read_text())
-                    if isinstance(existing, list):
-                        data = existing + data
-                except (json.JSONDecodeError, OSError):
-                    pass  # Overwrite corrupt file
-
-            RESCUE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            RESCUE_FILE.write_text(json.dumps(data))
+        pending = self.event_log.pending
+        self.event_log.close()
+        if pending:
             # Use print because logging might be dead
-            print(f"[Odometer] Rescued {len(batch)} unsaved events to {RESCUE_FILE}", file=__import__("sys").stderr)
-        except Exception as e:
-            print(f"[Odometer] CRITICAL: Failed to rescue events: {e}", file=__import__("sys").stderr)
+            print(
+                f"[Odometer] {pending} unsaved events kept in {self.event_log.directory}",
+                file=sys.stderr,
+            )
 
     async def recover(self) -> None:
         """
-        Run this on server startup/middleware init to ingest rescued events.
+        Replay events left behind by processes that exited before flushing.
+        Runs automatically when the flusher starts.
+        """
+        for segments, lock in self.event_log.orphans():
+            try:
+                for segment in segments:
+                    await self._replay(segment)
+                    segment.unlink(missing_ok=True)
+            except Exception as e:
+                logger.error(f"Odometer recovery failed: {e}")
+                if lock is not None:
+                    lock.close()
+                return
+            self.event_log.release_orphan(lock)
+
+        await self._recover_rescue_file()
+
+    async def _replay(self, segment: Path) -> None:
+        offset = 0
+        while True:
+            events, offset = read_events(segment, offset, self.batch_size)
+            if not events:
+                return
+            logger.info(f"Recovering {len(events)} events from {segment.name}")
+            await self.async_backend.store_events(events)
+
+    async def _recover_rescue_file(self) -> None:
+        """
+        Ingest the JSON rescue file written by older versions.
         """
         if not RESCUE_FILE.exists():
             return
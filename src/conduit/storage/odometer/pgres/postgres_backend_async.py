@@ -1,7 +1,8 @@
 from __future__ import annotations
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, time
 from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 from conduit.storage.odometer.token_event import TokenEvent
 from conduit.storage.db_manager import db_manager
 
@@ -11,6 +12,66 @@ if TYPE_CHECKING:
     from asyncpg import Pool
 
 
+# Zone that defines "a day" for the daily rollup and for date-range queries.
+# Pinned rather than left to the DB session's TimeZone or the client's local
+# zone, so per-date and date-range reports agree.
+ROLLUP_TIMEZONE = "UTC"
+
+# Rollup tables, keyed by time bucket + provider/model/host and maintained by
+# store_events, so reporting never has to scan token_events.
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_usage_hourly (
+    bucket BIGINT NOT NULL,  -- epoch seconds, truncated to the hour
+    provider VARCHAR(50) NOT NULL,
+    model VARCHAR(200) NOT NULL,
+    host VARCHAR(100) NOT NULL,
+    requests BIGINT NOT NULL,
+    input_tokens BIGINT NOT NULL,
+    output_tokens BIGINT NOT NULL,
+    PRIMARY KEY (bucket, provider, model, host)
+);
+CREATE TABLE IF NOT EXISTS token_usage_daily (
+    day DATE NOT NULL,
+    provider VARCHAR(50) NOT NULL,
+    model VARCHAR(200) NOT NULL,
+    host VARCHAR(100) NOT NULL,
+    requests BIGINT NOT NULL,
+    input_tokens BIGINT NOT NULL,
+    output_tokens BIGINT NOT NULL,
+    PRIMARY KEY (day, provider, model, host)
+);
+"""
+
+# Upserts of one batch of events (the `source` CTE) into both rollups
+ROLLUP_UPSERT = f"""
+hourly AS (
+    INSERT INTO token_usage_hourly AS r
+        (bucket, provider, model, host, requests, input_tokens, output_tokens)
+    SELECT timestamp - timestamp % 3600, provider, model, host,
+           COUNT(*), SUM(input_tokens), SUM(output_tokens)
+    FROM source
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT (bucket, provider, model, host) DO UPDATE SET
+        requests = r.requests + EXCLUDED.requests,
+        input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+        output_tokens = r.output_tokens + EXCLUDED.output_tokens
+)
+INSERT INTO token_usage_daily AS r
+    (day, provider, model, host, requests, input_tokens, output_tokens)
+SELECT DATE(to_timestamp(timestamp) AT TIME ZONE '{ROLLUP_TIMEZONE}'), provider, model, host,
+       COUNT(*), SUM(input_tokens), SUM(output_tokens)
+FROM source
+GROUP BY 1, 2, 3, 4
+ON CONFLICT (day, provider, model, host) DO UPDATE SET
+    requests = r.requests + EXCLUDED.requests,
+    input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+    output_tokens = r.output_tokens + EXCLUDED.output_tokens
+"""
+
+# Writers take this advisory lock shared; the one-off backfill takes it exclusive
+ROLLUP_LOCK = "hashtext('conduit.token_usage_rollups')"
+
+
 class AsyncPostgresOdometer:
     """
     Async Postgres backend for Odometer.
@@ -40,40 +101,93 @@ class AsyncPostgresOdometer:
             host VARCHAR(100) NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
+        ALTER TABLE token_events ADD COLUMN IF NOT EXISTS event_id TEXT;
+        ALTER TABLE token_events ADD COLUMN IF NOT EXISTS cache_read_tokens INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE token_events ADD COLUMN IF NOT EXISTS cache_write_tokens INTEGER NOT NULL DEFAULT 0;
+        CREATE UNIQUE INDEX IF NOT EXISTS token_events_event_id_idx
+            ON token_events (event_id);
+        CREATE INDEX IF NOT EXISTS token_events_timestamp_idx
+            ON token_events (timestamp);
         """
         async with pool.acquire() as conn:
             await conn.execute(create_sql)
+            await conn.execute(ROLLUP_SCHEMA)
+            await self._backfill_rollups(conn)
+
+    async def _backfill_rollups(self, conn) -> None:
+        """
+        One-off: build the rollups from token_events written before they existed.
+        """
+        async with conn.transaction():
+            await conn.execute(f"SELECT pg_advisory_xact_lock({ROLLUP_LOCK})")
+            needs_backfill = await conn.fetchval("""
+                SELECT NOT EXISTS (SELECT 1 FROM token_usage_daily)
+                   AND EXISTS (SELECT 1 FROM token_events)
+            """)
+            if not needs_backfill:
+                return
+            logger.info("Building odometer rollups from existing token_events")
+            await conn.execute(f"""
+                WITH source AS (
+                    SELECT provider, model, host, timestamp, input_tokens, output_tokens
+                    FROM token_events
+                ),
+                {ROLLUP_UPSERT}
+            """)
 
     async def store_events(self, events: list[TokenEvent]) -> None:
+        """
+        Insert events, skipping any event_id already stored (so replays are safe),
+        and add the newly inserted ones to the rollups, in one statement.
+        """
         if not events:
             return
 
         pool = await self._ensure_ready()
-        insert_sql = """
-        INSERT INTO token_events (provider, model, input_tokens, output_tokens, timestamp, host)
-        VALUES ($1, $2, $3, $4, $5, $6)
+        insert_sql = f"""
+        WITH source AS (
+            INSERT INTO token_events
+                (event_id, provider, model, input_tokens, output_tokens, timestamp, host,
+                 cache_read_tokens, cache_write_tokens)
+            SELECT * FROM unnest(
+                $1::text[], $2::text[], $3::text[], $4::int[], $5::int[], $6::bigint[], $7::text[],
+                $8::int[], $9::int[]
+            )
+            ON CONFLICT (event_id) DO NOTHING
+            RETURNING provider, model, host, timestamp, input_tokens, output_tokens
+        ),
+        {ROLLUP_UPSERT}
         """
-        records = [
-            (e.provider, e.model, e.input_tokens, e.output_tokens, e.timestamp, e.host)
-            for e in events
-        ]
+        columns = (
+            [e.event_id for e in events],
+            [e.provider for e in events],
+            [e.model for e in events],
+            [e.input_tokens for e in events],
+            [e.output_tokens for e in events],
+            [e.timestamp for e in events],
+            [e.host for e in events],
+            [e.cache_read_tokens for e in events],
+            [e.cache_write_tokens for e in events],
+        )
         async with pool.acquire() as conn:
-            await conn.executemany(insert_sql, records)
+            async with conn.transaction():
+                await conn.execute(f"SELECT pg_advisory_xact_lock_shared({ROLLUP_LOCK})")
+                await conn.execute(insert_sql, *columns)
             logger.debug(f"Async Odometer flush: stored {len(events)} events")
 
-    # --- Read Methods for Reporting ---
+    # --- Read Methods for Reporting (served from the rollups) ---
 
     async def get_overall_stats(self) -> dict:
         """Get overall statistics."""
         pool = await self._ensure_ready()
         query = """
         SELECT
-            COUNT(*) as requests,
-            SUM(input_tokens) as total_input,
-            SUM(output_tokens) as total_output,
+            SUM(requests)::bigint as requests,
+            SUM(input_tokens)::bigint as total_input,
+            SUM(output_tokens)::bigint as total_output,
             COUNT(DISTINCT provider) as unique_providers,
             COUNT(DISTINCT model) as unique_models
-        FROM token_events
+        FROM token_usage_daily
         """
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query)
@@ -98,7 +212,12 @@ class AsyncPostgresOdometer:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> dict[str, dict[str, int]]:
-        """Get aggregated statistics."""
+        """
+        Get aggregated statistics.
+        Date ranges are answered from the hourly rollup (day boundaries in
+        ROLLUP_TIMEZONE fall on hour buckets); all-time and per-date queries from
+        the daily rollup. Both paths use ROLLUP_TIMEZONE days.
+        """
         pool = await self._ensure_ready()
 
         valid_groups = ["provider", "model", "host", "date"]
@@ -109,35 +228,44 @@ class AsyncPostgresOdometer:
         params = []
         param_idx = 1
 
-        if start_date:
-            start_ts = int(
-                datetime.combine(start_date, datetime.min.time()).timestamp()
-            )
-            where_conditions.append(f"timestamp >= ${param_idx}")
-            params.append(start_ts)
-            param_idx += 1
-
-        if end_date:
-            end_ts = int(datetime.combine(end_date, datetime.max.time()).timestamp())
-            where_conditions.append(f"timestamp <= ${param_idx}")
-            params.append(end_ts)
-            param_idx += 1
-
-        if group_by == "date":
-            group_clause = "DATE(to_timestamp(timestamp))"
-            select_clause = f"{group_clause} as group_key"
+        if group_by == "date" or (start_date is None and end_date is None):
+            table = "token_usage_daily"
+            if start_date:
+                where_conditions.append(f"day >= ${param_idx}")
+                params.append(start_date)
+                param_idx += 1
+            if end_date:
+                where_conditions.append(f"day <= ${param_idx}")
+                params.append(end_date)
+                param_idx += 1
         else:
-            group_clause = group_by
-            select_clause = f"{group_by} as group_key"
+            table = "token_usage_hourly"
+            zone = ZoneInfo(ROLLUP_TIMEZONE)
+            if start_date:
+                start_ts = int(
+                    datetime.combine(start_date, time.min, tzinfo=zone).timestamp()
+                )
+                where_conditions.append(f"bucket >= ${param_idx}")
+                params.append(start_ts)
+                param_idx += 1
+            if end_date:
+                end_ts = int(
+                    datetime.combine(end_date, time.max, tzinfo=zone).timestamp()
+                )
+                where_conditions.append(f"bucket <= ${param_idx}")
+                params.append(end_ts)
+                param_idx += 1
+
+        group_clause = "day" if group_by == "date" else group_by
 
         base_query = f"""
         SELECT
-            {select_clause},
-            SUM(input_tokens) as total_input,
-            SUM(output_tokens) as total_output,
-            SUM(input_tokens + output_tokens) as total_tokens,
-            COUNT(*) as event_count
-        FROM token_events
+            {group_clause} as group_key,
+            SUM(input_tokens)::bigint as total_input,
+            SUM(output_tokens)::bigint as total_output,
+            SUM(input_tokens + output_tokens)::bigint as total_tokens,
+            SUM(requests)::bigint as event_count
+        FROM {table}
         """
 
         if where_conditions:
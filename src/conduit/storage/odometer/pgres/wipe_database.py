@@ -33,6 +33,9 @@ def wipe_token_events_database(confirm: bool = False) -> bool:
                 cursor.execute("DELETE FROM token_events")
                 deleted_count = cursor.rowcount
 
+                # The rollups are derived from token_events (they may not exist yet)
+                cursor.execute("DROP TABLE IF EXISTS token_usage_hourly, token_usage_daily")
+
                 # Reset the sequence for the ID column
                 cursor.execute("ALTER SEQUENCE token_events_id_seq RESTART WITH 1")
 
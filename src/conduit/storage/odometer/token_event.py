@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, model_validator
 from conduit.core.model.models.provider import Provider
 from typing import Any
+import uuid
 
 
 class TokenEvent(BaseModel):
@@ -14,8 +15,18 @@ class TokenEvent(BaseModel):
     output_tokens: int = Field(
         ..., description="Output tokens as defined and provided in API response."
     )
+    cache_read_tokens: int = Field(
+        default=0, description="Prompt tokens read from the provider's prefix cache."
+    )
+    cache_write_tokens: int = Field(
+        default=0, description="Prompt tokens written to the provider's prefix cache."
+    )
 
     # Generated fields (optional on input, filled automatically if missing/None)
+    event_id: str = Field(
+        default_factory=lambda: uuid.uuid4().hex,
+        description="Unique ID; makes replaying the event log idempotent.",
+    )
     timestamp: int | None = Field(
         default=None, description="Unix epoch time in seconds."
     )
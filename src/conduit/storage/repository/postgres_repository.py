@@ -1,6 +1,7 @@
 from __future__ import annotations
 import json
 import logging
+from collections import OrderedDict, deque
 from typing import Any
 from pydantic import TypeAdapter
 
@@ -16,11 +17,100 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Deltas at least this large are COPYed into a staging table instead of executemany
+COPY_THRESHOLD = 200
+# Sessions whose persisted message IDs are remembered (least recently saved evicted)
+TRACKED_SESSIONS = 128
+
+# Fills path/depth/root_id from the predecessor's row on insert. Rows inserted
+# earlier in the same statement are visible, so parents must come first.
+ANCESTRY_TRIGGER = """
+CREATE OR REPLACE FUNCTION conduit_messages_ancestry() RETURNS trigger AS $$
+DECLARE
+    parent RECORD;
+BEGIN
+    IF NEW.predecessor_id IS NULL THEN
+        NEW.path := ARRAY[NEW.message_id];
+        NEW.depth := 0;
+        NEW.root_id := NEW.message_id;
+    ELSE
+        SELECT path, depth, root_id INTO parent
+        FROM conduit_messages WHERE message_id = NEW.predecessor_id;
+        IF FOUND AND parent.path IS NOT NULL THEN
+            NEW.path := parent.path || NEW.message_id;
+            NEW.depth := parent.depth + 1;
+            NEW.root_id := parent.root_id;
+        END IF;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER conduit_messages_ancestry
+    BEFORE INSERT ON conduit_messages
+    FOR EACH ROW EXECUTE FUNCTION conduit_messages_ancestry();
+"""
+
+MESSAGE_COLUMNS = (
+    "message_id",
+    "session_id",
+    "predecessor_id",
+    "role",
+    "content",
+    "created_at",
+    "metadata",
+    "tool_calls",
+    "images",
+    "audio",
+    "parsed",
+)
+
+# Storage-only columns (ancestry, search vector) are never read back
+MESSAGE_SELECT = ", ".join(f"m.{column}" for column in MESSAGE_COLUMNS)
+
+# Searchable text of a message: string content, or the text parts of list content
+SEARCH_SCHEMA = """
+CREATE OR REPLACE FUNCTION conduit_message_text(content JSONB) RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE jsonb_typeof(content)
+        WHEN 'string' THEN content #>> '{}'
+        WHEN 'array' THEN (
+            SELECT string_agg(COALESCE(part ->> 'text', part #>> '{}'), ' ')
+            FROM jsonb_array_elements(content) AS part
+            WHERE jsonb_typeof(part) = 'string' OR part ? 'text'
+        )
+        ELSE ''
+    END
+$$;
+
+-- Generated, so every writer keeps it current
+ALTER TABLE conduit_messages ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', COALESCE(conduit_message_text(content), ''))
+    ) STORED;
+CREATE INDEX IF NOT EXISTS idx_messages_search ON conduit_messages USING GIN (search_vector);
+"""
+
+# Substring / fuzzy matches for identifiers, paths and typos that FTS stems away
+TRIGRAM_SCHEMA = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_messages_trgm
+    ON conduit_messages USING GIN (conduit_message_text(content) gin_trgm_ops);
+"""
+
+# ts_headline markers; mapped to terminal styling by the CLI
+SNIPPET_START = "\x02"
+SNIPPET_STOP = "\x03"
+
 
 class AsyncPostgresSessionRepository:
     """
     Async Project-Scoped Session Repository (DAG Architecture).
     Uses the shared DatabaseManager pool.
+
+    Messages are immutable once persisted (inserts are ON CONFLICT DO NOTHING), so
+    the repository remembers which message IDs each session already has in the DB
+    (saved or loaded through this instance) and save_session only writes the rest.
     """
 
     def __init__(self, project_name: str, db_name: str = "conduit"):
@@ -28,6 +118,8 @@ class AsyncPostgresSessionRepository:
         self.db_name = db_name
         self._message_adapter = TypeAdapter(MessageUnion)
         self._schema_initialized = False
+        self._persisted: OrderedDict[str, set[str]] = OrderedDict()
+        self._trigram = False
 
     async def _ensure_ready(self) -> Pool:
         if not self._schema_initialized:
@@ -38,7 +130,9 @@ class AsyncPostgresSessionRepository:
     async def initialize(self) -> None:
         """Idempotent schema creation."""
         pool = await db_manager.get_pool(self.db_name)
-        async with pool.acquire() as conn:
+        async with pool.acquire() as conn, conn.transaction():
+            # Serialize concurrent initializers (CREATE OR REPLACE is not concurrency-safe)
+            await conn.execute("SELECT pg_advisory_xact_lock(hashtext('conduit_messages_schema'))")
             await conn.execute("""
                 -- 1. Scoped Sessions
                 CREATE TABLE IF NOT EXISTS conduit_sessions (
@@ -71,29 +165,79 @@ class AsyncPostgresSessionRepository:
                 );
                 CREATE INDEX IF NOT EXISTS idx_messages_session ON conduit_messages(session_id);
                 CREATE INDEX IF NOT EXISTS idx_messages_predecessor ON conduit_messages(predecessor_id);
+
+                -- 3. Materialized ancestry: root..self message IDs, depth from the root
+                ALTER TABLE conduit_messages
+                    ADD COLUMN IF NOT EXISTS path TEXT[],
+                    ADD COLUMN IF NOT EXISTS depth INTEGER,
+                    ADD COLUMN IF NOT EXISTS root_id TEXT;
+                CREATE INDEX IF NOT EXISTS idx_messages_root ON conduit_messages(root_id);
+                CREATE INDEX IF NOT EXISTS idx_messages_unmaterialized
+                    ON conduit_messages(message_id) WHERE path IS NULL;
             """)
+            await conn.execute(ANCESTRY_TRIGGER)
+            await self._backfill_ancestry(conn)
+            await conn.execute(SEARCH_SCHEMA)
+            try:
+                async with conn.transaction():  # Savepoint: may lack CREATE privilege
+                    await conn.execute(TRIGRAM_SCHEMA)
+                self._trigram = True
+            except Exception as e:
+                logger.info(f"pg_trgm unavailable, fuzzy search disabled: {e}")
+                self._trigram = False
+
+    async def _backfill_ancestry(self, conn: Any) -> None:
+        """
+        One-off: materialize ancestry for messages stored before the trigger existed.
+        """
+        pending = await conn.fetchval(
+            "SELECT EXISTS (SELECT 1 FROM conduit_messages WHERE path IS NULL)"
+        )
+        if not pending:
+            return
+        logger.info("Materializing message ancestry for existing conversations")
+        await conn.execute("""
+            WITH RECURSIVE tree AS (
+                SELECT message_id, ARRAY[message_id] AS path, 0 AS depth, message_id AS root_id
+                FROM conduit_messages
+                WHERE predecessor_id IS NULL
+
+                UNION ALL
+
+                SELECT c.message_id, t.path || c.message_id, t.depth + 1, t.root_id
+                FROM conduit_messages c
+                JOIN tree t ON c.predecessor_id = t.message_id
+            )
+            UPDATE conduit_messages m
+            SET path = tree.path, depth = tree.depth, root_id = tree.root_id
+            FROM tree
+            WHERE m.message_id = tree.message_id AND m.path IS NULL
+        """)
 
     @property
     async def last(self) -> Conversation | None:
         """
-        Fetches the most recently updated session.
+        Fetches the active branch (root to leaf) of the most recently updated session,
+        in one query over the leaf's materialized path.
         """
         pool = await self._ensure_ready()
-        query = """
-            SELECT session_id
-            FROM conduit_sessions
-            WHERE project_name = $1
-            ORDER BY last_updated DESC
-            LIMIT 1
+        query = f"""
+            SELECT {MESSAGE_SELECT}
+            FROM (
+                SELECT leaf_message_id
+                FROM conduit_sessions
+                WHERE project_name = $1
+                ORDER BY last_updated DESC
+                LIMIT 1
+            ) s
+            JOIN conduit_messages leaf ON leaf.message_id = s.leaf_message_id
+            JOIN conduit_messages m ON m.message_id = ANY(leaf.path)
+            ORDER BY m.depth
         """
         async with pool.acquire() as conn:
-            session_id = await conn.fetchval(query, self.project_name)
-
-        if not session_id:
-            return None
+            rows = await conn.fetch(query, self.project_name)
 
-        session = await self.get_session(session_id)
-        return session.conversation if session else None
+        return self._rows_to_conversation(rows)
 
     # --- Read Operations ---
 
@@ -104,8 +248,8 @@ class AsyncPostgresSessionRepository:
             FROM conduit_sessions
             WHERE session_id = $1 AND project_name = $2
         """
-        q_messages = """
-            SELECT * FROM conduit_messages WHERE session_id = $1
+        q_messages = f"""
+            SELECT {MESSAGE_SELECT} FROM conduit_messages m WHERE m.session_id = $1
         """
 
         async with pool.acquire() as conn:
@@ -129,39 +273,29 @@ class AsyncPostgresSessionRepository:
             created_at=row["created_at"],
             message_dict=message_dict,
         )
+        self._mark_persisted(session_id, message_dict)
         return session
 
     async def get_conversation(self, leaf_message_id: str) -> Conversation | None:
         pool = await self._ensure_ready()
-        query = """
-        WITH RECURSIVE conversation_tree AS (
-            SELECT m.*, 1 as depth
-            FROM conduit_messages m
-            JOIN conduit_sessions s ON m.session_id = s.session_id
-            WHERE m.message_id = $1 AND s.project_name = $2
-
-            UNION ALL
-
-            SELECT p.*, ct.depth + 1
-            FROM conduit_messages p
-            INNER JOIN conversation_tree ct ON p.message_id = ct.predecessor_id
-        )
-        SELECT * FROM conversation_tree ORDER BY depth DESC;
+        query = f"""
+            SELECT {MESSAGE_SELECT}
+            FROM conduit_messages leaf
+            JOIN conduit_sessions s ON leaf.session_id = s.session_id
+            JOIN conduit_messages m ON m.message_id = ANY(leaf.path)
+            WHERE leaf.message_id = $1 AND s.project_name = $2
+            ORDER BY m.depth
         """
 
         async with pool.acquire() as conn:
             rows = await conn.fetch(query, leaf_message_id, self.project_name)
 
-        if not rows:
-            return None
-
-        messages = [self._row_to_message(r) for r in rows]
-        return Conversation(messages=messages)
+        return self._rows_to_conversation(rows)
 
     async def get_message(self, message_id: str) -> Message | None:
         pool = await self._ensure_ready()
-        query = """
-            SELECT m.*
+        query = f"""
+            SELECT {MESSAGE_SELECT}
             FROM conduit_messages m
             JOIN conduit_sessions s ON m.session_id = s.session_id
             WHERE m.message_id = $1 AND s.project_name = $2
@@ -197,40 +331,99 @@ class AsyncPostgresSessionRepository:
                 for r in rows
             ]
 
+    async def search(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> list[dict[str, Any]]:
+        """
+        Ranked full-text search over this project's messages.
+        Falls back to trigram (substring / fuzzy) matching when full-text search
+        matches nothing at all, if pg_trgm is available; limit and offset page
+        through whichever mode applies. Each hit has session_id, title,
+        message_id, role, created_at, rank and a snippet with matches wrapped in
+        SNIPPET_START / SNIPPET_STOP.
+        """
+        pool = await self._ensure_ready()
+        headline_options = (
+            f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, "
+            "MaxWords=30, MinWords=10, MaxFragments=2"
+        )
+        fts_query = """
+            SELECT m.session_id, s.title, m.message_id, m.role, m.created_at,
+                   ts_rank_cd(m.search_vector, q) AS rank,
+                   ts_headline('english', conduit_message_text(m.content), q, $5) AS snippet
+            FROM conduit_messages m
+            JOIN conduit_sessions s ON m.session_id = s.session_id,
+                 websearch_to_tsquery('english', $1) AS q
+            WHERE m.search_vector @@ q AND s.project_name = $2
+            ORDER BY rank DESC, m.created_at DESC
+            LIMIT $3 OFFSET $4
+        """
+        fts_exists_query = """
+            SELECT EXISTS (
+                SELECT 1
+                FROM conduit_messages m
+                JOIN conduit_sessions s ON m.session_id = s.session_id
+                WHERE m.search_vector @@ websearch_to_tsquery('english', $1)
+                  AND s.project_name = $2
+            )
+        """
+        trigram_query = """
+            SELECT m.session_id, s.title, m.message_id, m.role, m.created_at,
+                   word_similarity($1, conduit_message_text(m.content)) AS rank,
+                   conduit_message_text(m.content) AS snippet
+            FROM conduit_messages m
+            JOIN conduit_sessions s ON m.session_id = s.session_id
+            WHERE $1 <% conduit_message_text(m.content) AND s.project_name = $2
+            ORDER BY rank DESC, m.created_at DESC
+            LIMIT $3 OFFSET $4
+        """
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                fts_query, query, self.project_name, limit, offset, headline_options
+            )
+            # Pick the mode from whether any full-text match exists, not from
+            # this page, so later pages of a fuzzy search stay fuzzy
+            trigram = (
+                not rows
+                and self._trigram
+                and (
+                    offset == 0
+                    or not await conn.fetchval(fts_exists_query, query, self.project_name)
+                )
+            )
+            if trigram:
+                rows = await conn.fetch(
+                    trigram_query, query, self.project_name, limit, offset
+                )
+
+        hits = []
+        for r in rows:
+            snippet = r["snippet"] or ""
+            if trigram:
+                snippet = _window(snippet, query)
+            hits.append(
+                {
+                    "session_id": r["session_id"],
+                    "title": r["title"] or "Untitled Session",
+                    "message_id": r["message_id"],
+                    "role": r["role"],
+                    "created_at": r["created_at"],
+                    "rank": float(r["rank"]),
+                    "snippet": snippet,
+                }
+            )
+        return hits
+
     # --- Write Operations ---
 
     async def save_session(self, session: Session, name: str | None = None) -> None:
         pool = await self._ensure_ready()
 
-        # 1. Topological Sort
-        sorted_msgs = self._topological_sort(session.message_dict)
-
-        # 2. Serialize
-        msg_records = []
-        for msg in sorted_msgs:
-            d = msg.model_dump(mode="json")
-            # ToolMessage fields tool_call_id and name have no dedicated column;
-            # stash them in metadata so they survive the round-trip.
-            metadata = dict(d.get("metadata") or {})
-            if d.get("tool_call_id"):
-                metadata["_tool_call_id"] = d["tool_call_id"]
-            if d.get("name") and d.get("role") == "tool":
-                metadata["_tool_name"] = d["name"]
-            msg_records.append(
-                (
-                    d["message_id"],
-                    d["session_id"],
-                    d.get("predecessor_id"),
-                    d["role"],
-                    json.dumps(d.get("content")),
-                    d["created_at"],
-                    json.dumps(metadata),
-                    json.dumps(d.get("tool_calls")),
-                    json.dumps(d.get("images")),
-                    json.dumps(d.get("audio")),
-                    json.dumps(d.get("parsed")),
-                )
-            )
+        # 1. Delta: only messages not already in the DB
+        persisted = self._persisted.get(session.session_id, set())
+        new_ids = session.message_dict.keys() - persisted
+        delta = {mid: session.message_dict[mid] for mid in new_ids}
 
         upsert_session_sql = """
             INSERT INTO conduit_sessions (session_id, project_name, leaf_message_id, title, created_at, last_updated)
@@ -253,6 +446,23 @@ class AsyncPostgresSessionRepository:
 
         async with pool.acquire() as conn:
             async with conn.transaction():
+                # Another process may have deleted the session since we tracked it
+                # (conduit wipe, delete_session); then write it in full again
+                if persisted and not await self._delta_anchored(conn, session, delta):
+                    logger.info(
+                        f"Session {session.session_id} is missing stored messages; saving in full."
+                    )
+                    self._persisted.pop(session.session_id, None)
+                    new_ids = set(session.message_dict)
+                    delta = dict(session.message_dict)
+
+                # 2. Topological sort and serialize (predecessors outside the
+                # delta are already stored)
+                msg_records = [
+                    self._message_to_record(msg)
+                    for msg in self._topological_sort(delta)
+                ]
+
                 await conn.execute(
                     upsert_session_sql,
                     session.session_id,
@@ -262,13 +472,73 @@ class AsyncPostgresSessionRepository:
                     session.created_at,
                 )
 
-                if msg_records:
+                if len(msg_records) >= COPY_THRESHOLD:
+                    await self._copy_messages(conn, msg_records)
+                elif msg_records:
                     await conn.executemany(upsert_message_sql, msg_records)
 
+        # Only after commit: a failed save must be retried in full
+        self._mark_persisted(session.session_id, new_ids)
+
+    @staticmethod
+    async def _delta_anchored(
+        conn: Any, session: Session, delta: dict[str, Message]
+    ) -> bool:
+        """
+        Whether the messages the delta builds on (its predecessors outside the
+        delta, and the leaf if it isn't new) are still in conduit_messages.
+        """
+        anchors = {
+            msg.predecessor_id
+            for msg in delta.values()
+            if msg.predecessor_id and msg.predecessor_id not in delta
+        }
+        if session.leaf and session.leaf not in delta:
+            anchors.add(session.leaf)
+        if not anchors:
+            return True
+        found = await conn.fetchval(
+            "SELECT count(*) FROM conduit_messages WHERE message_id = ANY($1::text[])",
+            list(anchors),
+        )
+        return found == len(anchors)
+
+    async def _copy_messages(self, conn: Any, msg_records: list[tuple]) -> None:
+        """
+        Bulk path: COPY into a transaction-scoped staging table, then one
+        INSERT ... SELECT in the same (topological) order.
+        """
+        await conn.execute("""
+            CREATE TEMP TABLE conduit_messages_staging
+                (LIKE conduit_messages INCLUDING DEFAULTS, ord INTEGER)
+                ON COMMIT DROP
+        """)
+        await conn.copy_records_to_table(
+            "conduit_messages_staging",
+            records=[(*record, ord) for ord, record in enumerate(msg_records)],
+            columns=(*MESSAGE_COLUMNS, "ord"),
+        )
+        columns = ", ".join(MESSAGE_COLUMNS)
+        # Keep topological order: the ancestry trigger reads each parent's row
+        await conn.execute(f"""
+            INSERT INTO conduit_messages ({columns})
+            SELECT {columns} FROM conduit_messages_staging
+            ORDER BY ord
+            ON CONFLICT (message_id) DO NOTHING
+        """)
+
+    def _mark_persisted(self, session_id: str, message_ids) -> None:
+        persisted = self._persisted.pop(session_id, None) or set()
+        persisted.update(message_ids)
+        self._persisted[session_id] = persisted
+        while len(self._persisted) > TRACKED_SESSIONS:
+            self._persisted.popitem(last=False)
+
     # --- Maintenance Operations ---
 
     async def delete_session(self, session_id: str) -> None:
         pool = await self._ensure_ready()
+        self._persisted.pop(session_id, None)
         async with pool.acquire() as conn:
             await conn.execute(
                 "DELETE FROM conduit_sessions WHERE session_id = $1 AND project_name = $2",
@@ -278,6 +548,7 @@ class AsyncPostgresSessionRepository:
 
     async def wipe(self) -> None:
         pool = await self._ensure_ready()
+        self._persisted.clear()
         async with pool.acquire() as conn:
             await conn.execute(
                 "DELETE FROM conduit_sessions WHERE project_name = $1",
@@ -286,6 +557,40 @@ class AsyncPostgresSessionRepository:
 
     # --- Helpers ---
 
+    def _rows_to_conversation(self, rows: list[Any]) -> Conversation | None:
+        if not rows:
+            return None
+
+        messages = [self._row_to_message(r) for r in rows]
+        for message in messages:
+            self._mark_persisted(message.session_id, [message.message_id])
+        return Conversation(messages=messages)
+
+    @staticmethod
+    def _message_to_record(msg: Message) -> tuple:
+        """Row tuple in MESSAGE_COLUMNS order."""
+        d = msg.model_dump(mode="json")
+        # ToolMessage fields tool_call_id and name have no dedicated column;
+        # stash them in metadata so they survive the round-trip.
+        metadata = dict(d.get("metadata") or {})
+        if d.get("tool_call_id"):
+            metadata["_tool_call_id"] = d["tool_call_id"]
+        if d.get("name") and d.get("role") == "tool":
+            metadata["_tool_name"] = d["name"]
+        return (
+            d["message_id"],
+            d["session_id"],
+            d.get("predecessor_id"),
+            d["role"],
+            json.dumps(d.get("content")),
+            d["created_at"],
+            json.dumps(metadata),
+            json.dumps(d.get("tool_calls")),
+            json.dumps(d.get("images")),
+            json.dumps(d.get("audio")),
+            json.dumps(d.get("parsed")),
+        )
+
     def _row_to_message(self, row: Any) -> Message:
         msg_data = dict(row)
         for field in ["content", "tool_calls", "images", "audio", "parsed", "metadata"]:
@@ -321,10 +626,10 @@ class AsyncPostgresSessionRepository:
                 roots.append(mid)
 
         sorted_list = []
-        queue = roots[:]
+        queue = deque(roots)
 
         while queue:
-            current_id = queue.pop(0)
+            current_id = queue.popleft()
             if current_id in message_dict:
                 sorted_list.append(message_dict[current_id])
                 queue.extend(children_map.get(current_id, []))
@@ -338,6 +643,26 @@ class AsyncPostgresSessionRepository:
         return sorted_list
 
 
+def _window(text: str, query: str, width: int = 160) -> str:
+    """
+    Snippet around the first case-insensitive occurrence of query (trigram hits
+    have no ts_headline), with the match marked like a headline.
+    """
+    at = text.lower().find(query.lower())
+    if at < 0:
+        return text[:width]
+    start = max(at - width // 2, 0)
+    end = at + len(query)
+    return (
+        ("..." if start else "")
+        + text[start:at]
+        + SNIPPET_START
+        + text[at:end]
+        + SNIPPET_STOP
+        + text[end : end + width // 2]
+    )
+
+
 # Factory function becomes synchronous (just instantiates the lazy object)
 def get_async_repository(project_name: str) -> AsyncPostgresSessionRepository:
     """
@@ -46,6 +46,12 @@ class AsyncSessionRepository(Protocol):
         """Returns lightweight metadata for recent sessions."""
         ...
 
+    async def search(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> list[dict[str, Any]]:
+        """Ranked full-text search over persisted messages, with snippets."""
+        ...
+
     async def delete_session(self, session_id: str) -> None:
         """Hard deletes a session."""
         ...
@@ -4,8 +4,8 @@ from typing import override
 from pydantic import BaseModel, ConfigDict
 from conduit.strategies.summarize.strategy import ChunkingStrategy
 from conduit.core.workflow.step import step, add_metadata
+from conduit.core.model.models.tokens import token_counter
 import semchunk
-import tiktoken
 import statistics
 
 
@@ -24,13 +24,14 @@ class Chunker(ChunkingStrategy):
     async def __call__(self, text: str, config: dict) -> list[str]:
         cfg = self.Config(**config)
 
-        try:
-            tokenizer = tiktoken.encoding_for_model(cfg.tokenizer_model)
-        except KeyError:
-            tokenizer = tiktoken.get_encoding("o200k_base")
+        # semchunk probes many throwaway substrings: encode them with the shared
+        # encoder directly rather than through the count LRU
+        encode = token_counter.encoding_for_model(
+            cfg.tokenizer_model, fallback="o200k_base"
+        ).encode_ordinary
 
         def count_tokens(t: str) -> int:
-            return len(tokenizer.encode(t))
+            return len(encode(t))
 
         chunks = semchunk.chunk(
             text,
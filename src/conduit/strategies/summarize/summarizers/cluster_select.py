@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import math
 import logging
 from typing import override, Any
 from pydantic import BaseModel, ConfigDict
@@ -12,20 +11,13 @@ from conduit.strategies.summarize.summarizers.one_shot import OneShotSummarizer
 logger = logging.getLogger(__name__)
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    return dot / (norm_a * norm_b + 1e-8)
-
-
 class ClusterSelectSummarizer(SummarizationStrategy):
     """
     K-Means cluster-based chunk selection summarizer.
 
     Workflow:
     1. Chunk the text.
-    2. Embed all chunks via HeadwaterAsyncClient.
+    2. Embed all chunks via the shared EmbeddingService (cached, batched).
     3. Run K-Means clustering to find K semantic clusters.
     4. For each cluster, select the chunk closest to the centroid (cosine similarity).
     5. Pass the K selected chunks in original document order to OneShotSummarizer.
@@ -52,10 +44,9 @@ class ClusterSelectSummarizer(SummarizationStrategy):
         cfg = self.Config(**config)
         text = input.data
 
-        from headwater_client.client.headwater_client_async import HeadwaterAsyncClient
-        from headwater_api.classes import EmbeddingsRequest, ChromaBatch
+        from conduit.embeddings.service import embedding_service
+        from conduit.utils.vector import closest_to_centroids
         from sklearn.cluster import KMeans
-        import numpy as np
 
         chunker = Chunker()
         chunks = await chunker(text, config)
@@ -70,33 +61,14 @@ class ClusterSelectSummarizer(SummarizationStrategy):
         k = cfg.k if cfg.k is not None else min(10, total_chunks)
         k = min(k, total_chunks)
 
-        request = EmbeddingsRequest(
-            model=cfg.embedding_model,
-            batch=ChromaBatch(
-                ids=[str(i) for i in range(total_chunks)],
-                documents=chunks,
-            ),
-        )
-        async with HeadwaterAsyncClient() as client:
-            response = await client.embeddings.generate_embeddings(request)
-        embeddings = response.embeddings
+        embedding_matrix = await embedding_service(cfg.embedding_model).embed(chunks)
 
-        embedding_matrix = np.array(embeddings)
         kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
         labels = kmeans.fit_predict(embedding_matrix)
-        centroids = kmeans.cluster_centers_
 
         # For each cluster, select the chunk closest to the centroid
-        selected_indices: list[int] = []
-        for cluster_id in range(k):
-            member_indices = [i for i, label in enumerate(labels) if label == cluster_id]
-            if not member_indices:
-                continue
-            centroid = centroids[cluster_id].tolist()
-            best = max(member_indices, key=lambda i: _cosine_similarity(embeddings[i], centroid))
-            selected_indices.append(best)
-
-        selected_indices.sort()  # preserve original document order
+        selected = closest_to_centroids(embedding_matrix, kmeans.cluster_centers_, labels)
+        selected_indices = sorted(int(i) for i in selected)  # preserve original document order
 
         add_metadata("num_chunks", total_chunks)
         add_metadata("k", k)
@@ -1,28 +1,35 @@
 from __future__ import annotations
 
-import math
 import logging
-from typing import override, Any
-from pydantic import BaseModel, ConfigDict
+from typing import TYPE_CHECKING, override, Any
+from pydantic import BaseModel, ConfigDict, Field
 from conduit.core.workflow.step import step, add_metadata
 from conduit.strategies.summarize.strategy import SummarizationStrategy, _TextInput
 from conduit.strategies.summarize.summarizers.one_shot import OneShotSummarizer
 from conduit.strategies.summarize.summarizers.chunker import Chunker
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    import numpy as np
 
+logger = logging.getLogger(__name__)
 
-def _centroid(embeddings: list[list[float]]) -> list[float]:
-    n = len(embeddings)
-    dim = len(embeddings[0])
-    return [sum(embeddings[i][d] for i in range(n)) / n for d in range(dim)]
 
+def select_chunks(
+    embeddings: np.ndarray, keep_n: int, mmr_lambda: float | None = None
+) -> list[int]:
+    """
+    Indices of the keep_n chunks closest to the document centroid, in document
+    order. With mmr_lambda, chunks are picked by maximal marginal relevance
+    against the centroid instead, trading centrality for coverage.
+    """
+    from conduit.utils.vector import centroid, cosine_similarity, mmr, top_k
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    return dot / (norm_a * norm_b + 1e-8)
+    center = centroid(embeddings)
+    if mmr_lambda is None:
+        selected = top_k(cosine_similarity(embeddings, center), keep_n)
+    else:
+        selected = mmr(embeddings, center, keep_n, lambda_=mmr_lambda)
+    return sorted(int(i) for i in selected)
 
 
 class ExtractivePreFilterSummarizer(SummarizationStrategy):
@@ -31,7 +38,7 @@ class ExtractivePreFilterSummarizer(SummarizationStrategy):
 
     Workflow:
     1. Chunk the text.
-    2. Embed all chunks via HeadwaterClient.
+    2. Embed all chunks via the shared EmbeddingService (cached, batched).
     3. Compute the document centroid (mean of all chunk embeddings).
     4. Score each chunk by cosine similarity to the centroid.
     5. Retain the top `keep_ratio` fraction in original document order.
@@ -45,12 +52,14 @@ class ExtractivePreFilterSummarizer(SummarizationStrategy):
     Config params:
         keep_ratio:      fraction of chunks to retain (default: 0.3)
         embedding_model: Headwater embedding model (default: all-MiniLM-L6-v2)
+        mmr_lambda:      if set, select by MMR (1.0 = pure centrality, lower = more diverse)
     """
 
     class Config(BaseModel):
         model_config = ConfigDict(extra="ignore")
         model: str = "gpt-oss:latest"
         keep_ratio: float = 0.3
+        mmr_lambda: float | None = Field(default=None, ge=0.0, le=1.0)
         embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
         chunk_size: int = 12000
         overlap: int = 500
@@ -63,8 +72,7 @@ class ExtractivePreFilterSummarizer(SummarizationStrategy):
         cfg = self.Config(**config)
         text = input.data
 
-        from headwater_client.client.headwater_client_async import HeadwaterAsyncClient
-        from headwater_api.classes import EmbeddingsRequest, ChromaBatch
+        from conduit.embeddings.service import embedding_service
 
         chunker = Chunker()
         chunks = await chunker(text, config)
@@ -78,23 +86,10 @@ class ExtractivePreFilterSummarizer(SummarizationStrategy):
             logger.info("Single chunk — skipping filter, delegating to OneShotSummarizer")
             return await OneShotSummarizer()(_TextInput(chunks[0]), config)
 
-        request = EmbeddingsRequest(
-            model=cfg.embedding_model,
-            batch=ChromaBatch(
-                ids=[str(i) for i in range(total_chunks)],
-                documents=chunks,
-            ),
-        )
-        async with HeadwaterAsyncClient() as client:
-            response = await client.embeddings.generate_embeddings(request)
-        embeddings = response.embeddings
-
-        centroid = _centroid(embeddings)
-        scores = [_cosine_similarity(emb, centroid) for emb in embeddings]
+        embeddings = await embedding_service(cfg.embedding_model).embed(chunks)
 
         keep_n = max(1, int(total_chunks * cfg.keep_ratio))
-        ranked = sorted(range(total_chunks), key=lambda i: scores[i], reverse=True)
-        selected_indices = sorted(ranked[:keep_n])
+        selected_indices = select_chunks(embeddings, keep_n, cfg.mmr_lambda)
 
         logger.info(f"Kept {keep_n}/{total_chunks} chunks after extractive filter")
         add_metadata("num_chunks_after_filter", keep_n)
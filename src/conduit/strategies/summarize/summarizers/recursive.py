@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import tiktoken
 from typing import override, Any
 from pydantic import BaseModel, ConfigDict
 from conduit.core.workflow.step import step, add_metadata
@@ -9,6 +8,7 @@ from conduit.strategies.summarize.strategy import SummarizationStrategy, _TextIn
 from conduit.strategies.summarize.summarizers.one_shot import OneShotSummarizer
 from conduit.strategies.summarize.summarizers.map_reduce import MapReduceSummarizer
 from conduit.core.model.models.modelstore import ModelStore
+from conduit.core.model.models.tokens import token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,6 @@ class RecursiveSummarizer(SummarizationStrategy):
 
     def __init__(self):
         self.model_store = ModelStore()
-        self._tokenizer = tiktoken.get_encoding("cl100k_base")
 
     @step
     @override
@@ -35,7 +34,7 @@ class RecursiveSummarizer(SummarizationStrategy):
 
         allocated_window = ModelStore.get_num_ctx(cfg.model)
         effective_threshold = int(allocated_window * cfg.effective_context_window_ratio)
-        text_token_size = len(self._tokenizer.encode(text))
+        text_token_size = token_counter.count(text, encoding="cl100k_base")
 
         add_metadata("num_ctx_allocated", allocated_window)
         add_metadata("effective_chunk_size", effective_threshold)
@@ -1,6 +1,5 @@
 import logging
 import os
-from rich.logging import RichHandler
 
 
 class PackagePathFilter(logging.Filter):
@@ -18,11 +17,43 @@ class PackagePathFilter(logging.Filter):
         return True
 
 
+class LazyRichHandler(logging.Handler):
+    """
+    Stands in for a RichHandler until the first record is emitted, so that
+    `import conduit` doesn't pay for importing rich.
+    """
+
+    def __init__(self, level: int = logging.NOTSET, **kwargs):
+        super().__init__(level)
+        self._kwargs = kwargs
+        self._handler: logging.Handler | None = None
+
+    @property
+    def handler(self) -> logging.Handler:
+        if self._handler is None:
+            from rich.logging import RichHandler
+
+            handler = RichHandler(**self._kwargs)
+            handler.setLevel(self.level)
+            handler.setFormatter(self.formatter)
+            self._handler = handler
+        return self._handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Filters already ran in handle(); the inner handler's emit skips them
+        self.handler.emit(record)
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        super().setFormatter(fmt)
+        if self._handler is not None:
+            self._handler.setFormatter(fmt)
+
+
 # --- Setup ---
 log_level = int(os.getenv("PYTHON_LOG_LEVEL", "1"))  # Default to WARNING
 levels = {1: logging.WARNING, 2: logging.INFO, 3: logging.DEBUG}
 
-rich_handler = RichHandler(rich_tracebacks=True, markup=True)
+rich_handler = LazyRichHandler(rich_tracebacks=True, markup=True)
 rich_handler.addFilter(PackagePathFilter())
 
 logging.basicConfig(
@@ -0,0 +1,115 @@
+"""
+NumPy kernels for embedding similarity and selection.
+
+Embeddings are handled as 2D float32 matrices (one row per item). Normalize
+once, then every cosine similarity is a single matrix product; selections use
+argpartition rather than a full sort.
+"""
+
+from __future__ import annotations
+from typing import Any
+
+import numpy as np
+
+EPSILON = 1e-8
+
+
+def as_matrix(embeddings: Any) -> np.ndarray:
+    """Embeddings (lists of floats or an array) as a 2D float32 array."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2D embedding matrix, got shape {matrix.shape}")
+    return matrix
+
+
+def normalize(vectors: Any) -> np.ndarray:
+    """
+    Scale vectors (a 1D vector or the rows of a matrix) to unit length.
+    Zero vectors stay zero.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, EPSILON)
+
+
+def centroid(matrix: Any) -> np.ndarray:
+    """Mean of the rows."""
+    return as_matrix(matrix).mean(axis=0)
+
+
+def cosine_similarity(a: Any, b: Any) -> np.ndarray:
+    """
+    Cosine similarity between the rows of a (n, d) and the rows of b (m, d):
+    an (n, m) matrix, or (n,) when b is a single vector.
+    """
+    a = normalize(as_matrix(a))
+    b = np.asarray(b, dtype=np.float32)
+    if b.ndim == 1:
+        return a @ normalize(b)
+    return a @ normalize(b).T
+
+
+def top_k(scores: Any, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    scores = np.asarray(scores)
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def mmr(matrix: Any, query: Any, k: int, lambda_: float = 0.5) -> np.ndarray:
+    """
+    Maximal marginal relevance: pick k rows, each maximizing
+    lambda_ * sim(row, query) - (1 - lambda_) * max sim(row, already picked).
+    lambda_=1 is plain top-k by relevance; lower values favour diversity.
+    Returns indices in selection order. O(k * n * d).
+    """
+    if not 0.0 <= lambda_ <= 1.0:
+        raise ValueError("lambda_ must be between 0 and 1")
+    rows = normalize(as_matrix(matrix))
+    k = min(k, len(rows))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    relevance = rows @ normalize(query)
+    redundancy = np.full(len(rows), -np.inf, dtype=np.float32)
+    available = np.ones(len(rows), dtype=bool)
+    selected = np.empty(k, dtype=np.intp)
+    for step in range(k):
+        if step == 0:
+            scores = relevance.copy()
+        else:
+            scores = lambda_ * relevance - (1.0 - lambda_) * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected[step] = best
+        available[best] = False
+        redundancy = np.maximum(redundancy, rows @ rows[best])
+    return selected
+
+
+def closest_to_centroids(matrix: Any, centroids: Any, labels: Any) -> np.ndarray:
+    """
+    For each cluster, the index of its member with the highest cosine similarity
+    to the cluster's centroid. Empty clusters are skipped; result is sorted by
+    cluster id.
+    """
+    matrix = as_matrix(matrix)
+    centroids = as_matrix(centroids)
+    labels = np.asarray(labels)
+    # Each row against its own cluster's centroid, in one pass
+    scores = np.einsum(
+        "ij,ij->i", normalize(matrix), normalize(centroids)[labels]
+    )
+    # Sort by (label, -score); the first row of each label group is its best member
+    order = np.lexsort((-scores, labels))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = labels[order][1:] != labels[order][:-1]
+    return order[first]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import json
+import click
 from unittest.mock import MagicMock, patch
 import pytest
 from conduit.apps.cli.handlers.batch_handlers import BatchHandlers
@@ -23,7 +24,10 @@ def mock_batch_run():
         _make_mock_conversation("Response B"),
     ]
     mock_instance = MagicMock()
-    mock_instance.run.return_value = conversations
+    # run_iter yields in completion order; later prompts finish first
+    mock_instance.run_iter.side_effect = lambda prompt_strings_list, **_: reversed(
+        list(enumerate(conversations[: len(prompt_strings_list)]))
+    )
     with patch(
         "conduit.apps.cli.handlers.batch_handlers.ConduitBatchSync"
     ) as mock_cls:
@@ -49,7 +53,7 @@ def test_handle_batch_calls_batch_sync(mock_batch_run):
     mock_cls.create.assert_called_once()
     call_kwargs = mock_cls.create.call_args.kwargs
     assert call_kwargs["model"] == "gpt-4o"
-    mock_instance.run.assert_called_once_with(
+    mock_instance.run_iter.assert_called_once_with(
         prompt_strings_list=PROMPTS, max_concurrent=None
     )
 
@@ -84,9 +88,7 @@ def test_handle_batch_raw_mode(mock_batch_run, capsys):
         printer=printer,
     )
     captured = capsys.readouterr()
-    assert "Response A" in captured.out
-    assert "Response B" in captured.out
-    assert "---" in captured.out
+    assert captured.out == "Response A\n---\nResponse B\n"
     # Pretty mode should NOT have been called
     printer.print_pretty.assert_not_called()
 
@@ -141,6 +143,30 @@ def test_handle_batch_max_concurrent_forwarded(mock_batch_run):
         as_json=False,
         printer=printer,
     )
-    mock_instance.run.assert_called_once_with(
+    mock_instance.run_iter.assert_called_once_with(
         prompt_strings_list=["Q"], max_concurrent=3
     )
+
+
+def test_handle_batch_reports_failures_without_dropping_results(capsys):
+    mock_instance = MagicMock()
+    mock_instance.run_iter.return_value = iter(
+        [(1, RuntimeError("boom")), (0, _make_mock_conversation("Response A"))]
+    )
+    with patch(
+        "conduit.apps.cli.handlers.batch_handlers.ConduitBatchSync"
+    ) as mock_cls:
+        mock_cls.create.return_value = mock_instance
+        with pytest.raises(click.ClickException, match="1 of 2 prompts failed"):
+            BatchHandlers.handle_batch(
+                prompts=PROMPTS,
+                model="gpt-4o",
+                temperature=None,
+                max_concurrent=None,
+                raw=False,
+                as_json=True,
+                printer=_make_printer(),
+            )
+    data = json.loads(capsys.readouterr().out)
+    assert data[0]["response"] == "Response A"
+    assert data[1]["error"] == "RuntimeError: boom"
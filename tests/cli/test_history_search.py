@@ -0,0 +1,49 @@
+from __future__ import annotations
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from conduit.apps.cli.handlers.base_handlers import BaseHandlers
+
+
+def make_repository(hits: list[dict]) -> MagicMock:
+    repository = MagicMock()
+    repository.search = AsyncMock(return_value=hits)
+    return repository
+
+
+def test_handle_search_pages_through_results():
+    repository = make_repository([])
+    printer = MagicMock()
+    loop = asyncio.new_event_loop()
+    try:
+        BaseHandlers.handle_search(repository, "docker", printer, loop, limit=10, page=3)
+    finally:
+        loop.close()
+
+    repository.search.assert_awaited_once_with("docker", limit=10, offset=20)
+    assert "No messages match" in printer.print_pretty.call_args[0][0]
+
+
+def test_handle_search_highlights_matches_and_escapes_markup():
+    hit = {
+        "session_id": "abcdef123456",
+        "title": "[notes]",
+        "message_id": "m1",
+        "role": "user",
+        "created_at": 1_700_000_000_000,
+        "rank": 1.0,
+        "snippet": "run \x02docker\x03 [compose]",
+    }
+    printer = MagicMock()
+    loop = asyncio.new_event_loop()
+    try:
+        BaseHandlers.handle_search(make_repository([hit]), "docker", printer, loop, limit=1)
+    finally:
+        loop.close()
+
+    table = printer.print_pretty.call_args_list[0][0][0]
+    cells = [column._cells[0] for column in table.columns]
+    assert cells[3] == r"run [bold yellow]docker[/bold yellow] \[compose]"
+    assert cells[0].startswith(r"\[notes]")
+    # A full page suggests the next one
+    assert "--page 2" in printer.print_pretty.call_args_list[1][0][0]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message.message import (
+    AssistantMessage,
+    ImageContent,
+    SystemMessage,
+    TextContent,
+    UserMessage,
+)
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.embeddings.embedder import Embedder, HashingEmbedder
+from conduit.storage.cache.protocol import ConduitCache
+from conduit.storage.cache.semantic_cache import SemanticCache
+
+
+# Fixtures
+# ---
+
+def make_request(
+    prompt: str | list = "How do I reset my password?",
+    system: str | None = "You are a support bot.",
+    model: str = "gpt-4o",
+    temperature: float | None = None,
+) -> GenerationRequest:
+    messages = [SystemMessage(content=system)] if system else []
+    messages.append(UserMessage(content=prompt))
+    return GenerationRequest(
+        messages=messages,
+        params=GenerationParams(model=model, temperature=temperature),
+        options=ConduitOptions(project_name="test", console=None),
+    )
+
+
+def make_response(request: GenerationRequest, content: str = "Use the reset link.") -> GenerationResponse:
+    return GenerationResponse(
+        message=AssistantMessage(content=content),
+        request=request,
+        metadata=ResponseMetadata(
+            duration=1.0,
+            model_slug="gpt-4o",
+            input_tokens=3,
+            output_tokens=1,
+            stop_reason="stop",
+        ),
+    )
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.calls: list[list[str]] = []
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return await super().embed(texts)
+
+
+@pytest.fixture
+def embedder() -> CountingEmbedder:
+    return CountingEmbedder()
+
+
+@pytest.fixture
+async def cache(embedder) -> SemanticCache:
+    cache = SemanticCache(embedder, threshold=0.6)
+    request = make_request()
+    await cache.set(request, make_response(request))
+    return cache
+
+
+# Tests
+# ---
+
+def test_implements_protocols():
+    assert isinstance(SemanticCache(HashingEmbedder()), ConduitCache)
+    assert isinstance(HashingEmbedder(), Embedder)
+
+
+async def test_hashing_embedder_is_deterministic():
+    first = await HashingEmbedder().embed(["same text", "other"])
+    second = await HashingEmbedder().embed(["same text", "other"])
+
+    assert first.shape == (2, 256) and first.dtype == np.float32
+    assert np.array_equal(first, second)
+
+
+async def test_rephrased_prompt_is_served(cache):
+    hit = await cache.get(make_request("how can I reset my password"))
+
+    assert hit is not None and hit.message.content == "Use the reset link."
+    assert (await cache.cache_stats())["hits"] == 1
+
+
+async def test_unrelated_prompt_misses(cache):
+    assert await cache.get(make_request("What are your opening hours on Sunday?")) is None
+
+
+async def test_exact_repeat_skips_the_embedder(cache, embedder):
+    embedder.calls.clear()
+
+    assert await cache.get(make_request()) is not None
+    assert embedder.calls == []
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        make_request(system="You are a pirate."),
+        make_request(system=None),
+        make_request(model="claude-sonnet-4-5"),
+        make_request(temperature=1.5),
+    ],
+)
+async def test_scope_is_model_params_and_system_prompt(cache, request_):
+    assert await cache.get(request_) is None
+
+
+async def test_non_text_turns_are_not_cached(embedder):
+    cache = SemanticCache(embedder)
+    image = ImageContent.from_bytes(b"\x89PNG" * 10)
+    request = make_request([TextContent(text="what is this?"), image])
+
+    await cache.set(request, make_response(request))
+
+    assert (await cache.cache_stats())["total_entries"] == 0
+    assert await cache.get(request) is None
+
+
+async def test_search_returns_top_k_best_first(embedder):
+    cache = SemanticCache(embedder)
+    for prompt in ["reset my password", "change my password", "cancel my order", "track my parcel"]:
+        request = make_request(prompt)
+        await cache.set(request, make_response(request, content=prompt))
+
+    results = await cache.search(make_request("reset password"), k=2)
+
+    assert [r.message.content for _, r in results] == ["reset my password", "change my password"]
+    assert results[0][0] >= results[1][0]
+
+
+async def test_oldest_entries_are_evicted(embedder):
+    cache = SemanticCache(embedder, max_entries=2)
+    for prompt in ["first question", "second question", "third question"]:
+        request = make_request(prompt)
+        await cache.set(request, make_response(request, content=prompt))
+
+    remaining = {r.message.content for r in await cache.get_all()}
+    assert remaining == {"second question", "third question"}
+    assert (await cache.cache_stats())["evictions"] == 1
+
+
+async def test_index_grows_past_initial_capacity(embedder):
+    cache = SemanticCache(embedder, threshold=0.99)
+    for n in range(200):
+        request = make_request(f"question number {n} about topic {n * 7}")
+        await cache.set(request, make_response(request, content=str(n)))
+
+    hit = await cache.get(make_request("question number 150 about topic 1050"))
+    assert hit is not None and hit.message.content == "150"
+
+
+async def test_served_responses_are_copies(cache):
+    hit = await cache.get(make_request())
+    hit.metadata.cache_hit = True
+
+    again = await cache.get(make_request())
+    assert again.metadata.cache_hit is False
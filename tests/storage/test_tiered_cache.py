@@ -0,0 +1,166 @@
+from __future__ import annotations
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message.message import AssistantMessage, UserMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.storage.cache.memory_cache import AsyncMemoryCache
+from conduit.storage.cache.protocol import ConduitCache
+from conduit.storage.cache.tiered_cache import AsyncTieredCache
+
+
+# Fixtures
+# ---
+
+def make_request(prompt: str = "hello") -> GenerationRequest:
+    return GenerationRequest(
+        messages=[UserMessage(content=prompt)],
+        params=GenerationParams(model="gpt-4o"),
+        options=ConduitOptions(project_name="test", console=None),
+    )
+
+
+def make_response(request: GenerationRequest, content: str = "hi") -> GenerationResponse:
+    return GenerationResponse(
+        message=AssistantMessage(content=content),
+        request=request,
+        metadata=ResponseMetadata(
+            duration=1.0,
+            model_slug="gpt-4o",
+            input_tokens=3,
+            output_tokens=1,
+            stop_reason="stop",
+        ),
+    )
+
+
+def make_backend(stored: GenerationResponse | None = None) -> MagicMock:
+    backend = MagicMock()
+    backend.project_name = "test"
+    backend.db_name = "conduit"
+    backend.get = AsyncMock(return_value=stored)
+    backend.set = AsyncMock()
+    backend.wipe = AsyncMock()
+    backend.cache_stats = AsyncMock(return_value={"cache_name": "test", "total_entries": 1})
+    return backend
+
+
+# Memory tier
+# ---
+
+def test_memory_cache_implements_protocol():
+    assert isinstance(AsyncMemoryCache(), ConduitCache)
+    assert isinstance(AsyncTieredCache(make_backend()), ConduitCache)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_roundtrip_and_counters():
+    cache = AsyncMemoryCache()
+    request = make_request()
+    assert await cache.get(request) is None
+
+    await cache.set(request, make_response(request))
+    cached = await cache.get(request)
+
+    assert cached is not None
+    assert cached.message.content == "hi"
+    stats = await cache.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_returns_detached_copies():
+    cache = AsyncMemoryCache()
+    request = make_request()
+    await cache.set(request, make_response(request))
+
+    first = await cache.get(request)
+    first.metadata.cache_hit = True
+    first.message.predecessor_id = "someone-else"
+
+    second = await cache.get(request)
+    assert second.metadata.cache_hit is False
+    assert second.message.predecessor_id is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    cache = AsyncMemoryCache(max_entries=2)
+    a, b, c = make_request("a"), make_request("b"), make_request("c")
+    await cache.set(a, make_response(a))
+    await cache.set(b, make_response(b))
+    await cache.get(a)  # a is now most recently used
+    await cache.set(c, make_response(c))
+
+    assert await cache.get(b) is None
+    assert await cache.get(a) is not None
+    assert await cache.get(c) is not None
+    assert (await cache.cache_stats())["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries():
+    cache = AsyncMemoryCache(ttl_seconds=10)
+    request = make_request()
+    with patch("conduit.storage.cache.memory_cache.time.monotonic", return_value=100.0):
+        await cache.set(request, make_response(request))
+    with patch("conduit.storage.cache.memory_cache.time.monotonic", return_value=111.0):
+        assert await cache.get(request) is None
+    assert (await cache.cache_stats())["total_entries"] == 0
+
+
+# Tiered cache
+# ---
+
+@pytest.mark.asyncio
+async def test_tiered_cache_falls_through_and_promotes():
+    request = make_request()
+    backend = make_backend(stored=make_response(request))
+    cache = AsyncTieredCache(backend)
+
+    first = await cache.get(request)
+    second = await cache.get(request)
+
+    assert first.message.content == "hi"
+    assert second.message.content == "hi"
+    backend.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_writes_through_to_backend():
+    request = make_request()
+    backend = make_backend()
+    cache = AsyncTieredCache(backend)
+
+    await cache.set(request, make_response(request))
+    assert await cache.get(request) is not None
+
+    backend.set.assert_awaited_once()
+    backend.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_stats_report_each_tier():
+    hit_request, miss_request = make_request("hit"), make_request("miss")
+    backend = make_backend(stored=make_response(hit_request))
+    cache = AsyncTieredCache(backend)
+
+    await cache.get(hit_request)  # memory miss, backend hit
+    await cache.get(hit_request)  # memory hit
+    backend.get.return_value = None
+    await cache.get(miss_request)  # memory miss, backend miss
+
+    stats = await cache.cache_stats()
+    assert stats["tiers"]["memory"]["hits"] == 1
+    assert stats["tiers"]["memory"]["misses"] == 2
+    assert stats["tiers"]["postgres"]["hits"] == 1
+    assert stats["tiers"]["postgres"]["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["total_entries"] == 1
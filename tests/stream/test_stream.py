@@ -15,11 +15,11 @@ import pytest
 from collections.abc import AsyncIterator
 
 # DUT (Device Under Test)
-from conduit.parser.stream.parsers import XMLStreamParser
-from conduit.parser.stream.parsers import JSONStreamParser
+from conduit.core.parser.stream.parsers import XMLStreamParser
+from conduit.core.parser.stream.parsers import JSONStreamParser
 
 # Dependencies
-from conduit.parser.stream.protocol import StreamChunk
+from conduit.core.parser.stream.protocol import StreamChunk
 from fixtures import MockChunk, MockStream, MockUsage
 
 # Import raw chunk lists
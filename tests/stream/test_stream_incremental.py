@@ -0,0 +1,98 @@
+"""
+Incremental parsing: results must not depend on how the stream is chunked,
+and the total work must grow linearly with stream length.
+"""
+
+import json
+import random
+
+import pytest
+
+from conduit.core.parser.stream.parsers import JSONStreamParser, XMLStreamParser
+from fixtures import MockChunk, MockStream
+
+
+# Fixtures
+# ---
+
+XML_TEXT = (
+    "Intro <function_calls><invoke name='a'><function_calls>nested</function_calls>"
+    "</invoke></function_calls> trailing <function_calls>second</function_calls>"
+)
+JSON_TEXT = (
+    'Not json: {oops} then {"a": "has } and \\" inside", "b": [1, {"c": 2}]} tail {"x": 1}'
+)
+
+
+def chunked(text: str, seed: int) -> list[MockChunk]:
+    rng = random.Random(seed)
+    chunks, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 7)
+        chunks.append(MockChunk(content=text[i : i + size]))
+        i += size
+    return chunks
+
+
+def prose_then_object(n_chars: int, chunk_size: int = 8) -> list[MockChunk]:
+    filler = ("lorem ipsum dolor sit amet " * (n_chars // 27 + 1))[:n_chars]
+    text = filler + json.dumps({"done": True})
+    return [
+        MockChunk(content=text[i : i + chunk_size]) for i in range(0, len(text), chunk_size)
+    ]
+
+
+class CountingJSONStreamParser(JSONStreamParser):
+    """Counts the characters handed to the scanner, re-scans included."""
+
+    def _reset_scanner(self) -> None:
+        super()._reset_scanner()
+        self.scanned_chars = 0
+
+    def _scan(self, text):
+        self.scanned_chars += len(text)
+        return super()._scan(text)
+
+
+# Tests
+# ---
+
+@pytest.mark.parametrize("seed", range(20))
+def test_xml_result_independent_of_chunking(seed):
+    text, obj, buffer = XMLStreamParser(MockStream(chunked(XML_TEXT, seed))).parse(
+        close_on_match=False
+    )
+    expected = XMLStreamParser(MockStream([]))._parse_buffer(XML_TEXT)
+
+    assert (text, obj) == (
+        "Intro  trailing <function_calls>second</function_calls>",
+        expected[1],
+    )
+    assert obj.endswith("</invoke></function_calls>")
+    assert buffer == XML_TEXT
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_json_result_independent_of_chunking(seed):
+    text, obj, buffer = JSONStreamParser(MockStream(chunked(JSON_TEXT, seed))).parse(
+        close_on_match=True
+    )
+
+    assert obj == {"a": 'has } and " inside', "b": [1, {"c": 2}]}
+    assert text == "Not json: {oops} then "
+    assert buffer.startswith(JSON_TEXT[: len(text)])
+
+
+@pytest.mark.parametrize("n_chars", [50_000, 200_000])
+def test_each_character_is_scanned_once(n_chars):
+    """
+    Re-parsing the whole buffer on every chunk is O(n^2): a 200k-char stream in
+    8-char chunks would scan ~2.5 billion characters. Incremental scanning
+    touches each character once.
+    """
+    parser = CountingJSONStreamParser(MockStream(prose_then_object(n_chars)))
+
+    _, obj, buffer = parser.parse(close_on_match=True)
+
+    assert obj == {"done": True}
+    assert parser.scanned_chars == len(buffer)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from conduit.core.conduit.batch.conduit_batch_async import ConduitBatchAsync
+from conduit.core.conduit.conduit_async import ConduitAsync
+from conduit.core.model.models.modelstore import ModelStore
+from conduit.core.prompt.prompt import Prompt
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message.message import AssistantMessage, UserMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.storage.cache.batch_cache import AsyncBatchCache
+from conduit.storage.cache.memory_cache import AsyncMemoryCache
+from conduit.utils.progress.verbosity import Verbosity
+
+
+# Fixtures
+# ---
+
+class RecordingCache(AsyncMemoryCache):
+    """Memory cache that records how it was accessed."""
+
+    def __init__(self):
+        super().__init__(project_name="batch-test")
+        self.point_gets = 0
+        self.point_sets = 0
+        self.get_many_calls: list[list[str]] = []
+        self.set_many_calls: list[int] = []
+
+    async def get(self, request):
+        self.point_gets += 1
+        return await super().get(request)
+
+    async def set(self, request, response):
+        self.point_sets += 1
+        await super().set(request, response)
+
+    async def get_many(self, keys):
+        self.get_many_calls.append(list(keys))
+        return await super().get_many(keys)
+
+    async def set_many(self, entries):
+        self.set_many_calls.append(len(entries))
+        await super().set_many(entries)
+
+
+class EchoClient:
+    """Stand-in provider client that echoes the last user message."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def query(self, request):
+        self.calls += 1
+        return GenerationResponse(
+            message=AssistantMessage(content=f"echo: {request.messages[-1].content}"),
+            request=request,
+            metadata=ResponseMetadata(
+                duration=1.0,
+                model_slug="gpt-4o",
+                input_tokens=1,
+                output_tokens=0,
+                stop_reason="stop",
+            ),
+        )
+
+
+@pytest.fixture
+def client():
+    echo = EchoClient()
+    with (
+        patch.object(ModelStore, "get_client", return_value=echo),
+        patch(
+            "conduit.storage.db_manager.db_manager.get_pool", new_callable=AsyncMock
+        ),
+        patch(
+            "conduit.storage.odometer.odometer_registry.OdometerRegistry.flush",
+            new_callable=AsyncMock,
+        ),
+    ):
+        yield echo
+
+
+def make_options(cache) -> ConduitOptions:
+    return ConduitOptions(
+        project_name="batch-test",
+        cache=cache,
+        console=None,
+        verbosity=Verbosity.SILENT,
+    )
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_batch_resolves_cache_in_one_query_and_bulk_writes_misses(client):
+    cache = RecordingCache()
+    params = GenerationParams(model="gpt-4o")
+    batch = ConduitBatchAsync()
+    prompts = ["one", "two", "three"]
+
+    first = await batch.run(None, prompts, params, make_options(cache))
+
+    assert [c.content for c in first] == ["echo: one", "echo: two", "echo: three"]
+    assert client.calls == 3
+    assert len(cache.get_many_calls) == 1
+    assert len(cache.get_many_calls[0]) == 3
+    assert cache.set_many_calls == [3]
+    assert cache.point_gets == 0
+    assert cache.point_sets == 0
+
+    # Re-run with one new prompt: only the miss reaches the provider
+    second = await batch.run(None, [*prompts, "four"], params, make_options(cache))
+
+    assert [c.content for c in second][-1] == "echo: four"
+    assert client.calls == 4
+    assert cache.set_many_calls == [3, 1]
+    assert cache.point_gets == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_template_mode_prefetches_rendered_prompts(client):
+    cache = RecordingCache()
+    params = GenerationParams(model="gpt-4o")
+    batch = ConduitBatchAsync(Prompt("Say {{ word }}"))
+    inputs = [{"word": "hi"}, {"word": "bye"}, {"word": "ciao"}]
+
+    await batch.run(inputs, None, params, make_options(cache))
+    conversations = await batch.run(inputs, None, params, make_options(cache))
+
+    assert [c.content for c in conversations] == [
+        "echo: Say hi",
+        "echo: Say bye",
+        "echo: Say ciao",
+    ]
+    assert client.calls == 3
+    assert len(cache.get_many_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_renders_and_prepares_each_item_once(client):
+    cache = RecordingCache()
+    prompt = Prompt("Say {{ word }}")
+    batch = ConduitBatchAsync(prompt)
+    inputs = [{"word": "hi"}, {"word": "bye"}, {"word": "ciao"}]
+    render = Prompt.render
+    renders: list[dict] = []
+
+    def counting_render(self, input_variables):
+        renders.append(input_variables)
+        return render(self, input_variables=input_variables)
+
+    with (
+        patch.object(Prompt, "render", counting_render),
+        patch.object(
+            ConduitAsync,
+            "_prepare_conversation",
+            autospec=True,
+            side_effect=ConduitAsync._prepare_conversation,
+        ) as prepare,
+    ):
+        await batch.run(inputs, None, GenerationParams(model="gpt-4o"), make_options(cache))
+
+    assert renders == inputs
+    assert prepare.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_buffered_writes_are_detached_from_the_live_response():
+    backend = RecordingCache()
+    batch_cache = AsyncBatchCache(backend)
+    options = make_options(None)
+    request = GenerationRequest(
+        messages=[UserMessage(content="hello")],
+        params=GenerationParams(model="gpt-4o"),
+        options=options,
+    )
+    response = await EchoClient().query(request)
+
+    await batch_cache.set(request, response)
+    # What Conversation.add does to the message before the batch flushes
+    response.message.predecessor_id = "parent"
+    response.message.session_id = "live-session"
+    await batch_cache.flush()
+
+    cached = await backend.get(request)
+    assert cached.message.predecessor_id is None
+    assert cached.message.session_id != "live-session"
@@ -0,0 +1,141 @@
+from __future__ import annotations
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from conduit.core.conduit.batch.conduit_batch_async import ConduitBatchAsync
+from conduit.core.model.models.modelstore import ModelStore
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message.message import AssistantMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.utils.progress.verbosity import Verbosity
+
+
+# Fixtures
+# ---
+
+class SlowClient:
+    """
+    Replies after `delay:<seconds>` (taken from the prompt), fails on `fail`,
+    and tracks how many calls run at once.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.started = 0
+
+    async def query(self, request):
+        prompt = request.messages[-1].content
+        self.started += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if prompt == "fail":
+                raise RuntimeError("provider exploded")
+            delay = float(prompt.split(":")[1]) if prompt.startswith("delay:") else 0.0
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        return GenerationResponse(
+            message=AssistantMessage(content=f"echo: {prompt}"),
+            request=request,
+            metadata=ResponseMetadata(
+                duration=1.0,
+                model_slug="gpt-4o",
+                input_tokens=1,
+                output_tokens=0,
+                stop_reason="stop",
+            ),
+        )
+
+
+@pytest.fixture
+def client():
+    slow = SlowClient()
+    with (
+        patch.object(ModelStore, "get_client", return_value=slow),
+        patch(
+            "conduit.storage.db_manager.db_manager.get_pool", new_callable=AsyncMock
+        ),
+        patch(
+            "conduit.storage.odometer.odometer_registry.OdometerRegistry.flush",
+            new_callable=AsyncMock,
+        ),
+    ):
+        yield slow
+
+
+def make_options() -> ConduitOptions:
+    return ConduitOptions(
+        project_name="batch-test", console=None, verbosity=Verbosity.SILENT
+    )
+
+
+PARAMS = GenerationParams(model="gpt-4o")
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_run_iter_yields_in_completion_order_and_keeps_going_after_failures(client):
+    prompts = ["delay:0.1", "fail", "delay:0.0"]
+
+    results = [
+        item
+        async for item in ConduitBatchAsync().run_iter(
+            None, prompts, PARAMS, make_options()
+        )
+    ]
+
+    assert [index for index, _ in results] == [1, 2, 0]
+    assert isinstance(results[0][1], RuntimeError)
+    assert results[1][1].content == "echo: delay:0.0"
+    assert results[2][1].content == "echo: delay:0.1"
+
+
+@pytest.mark.asyncio
+async def test_partial_run_returns_errors_in_place(client):
+    results = await ConduitBatchAsync().run(
+        None, ["ok", "fail", "fine"], PARAMS, make_options(), partial=True
+    )
+
+    assert results[0].content == "echo: ok"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2].content == "echo: fine"
+
+
+@pytest.mark.asyncio
+async def test_run_raises_first_failure_by_default(client):
+    with pytest.raises(RuntimeError, match="provider exploded"):
+        await ConduitBatchAsync().run(None, ["ok", "fail"], PARAMS, make_options())
+
+
+@pytest.mark.asyncio
+async def test_window_bounds_items_in_flight(client):
+    prompts = [f"delay:0.01 #{i}" for i in range(50)]
+
+    count = 0
+    async for _ in ConduitBatchAsync().run_iter(
+        None, prompts, PARAMS, make_options(), window=5
+    ):
+        count += 1
+
+    assert count == 50
+    assert client.peak <= 5
+
+
+@pytest.mark.asyncio
+async def test_closing_iterator_cancels_remaining_items(client):
+    prompts = ["delay:0.0"] + ["delay:5"] * 3
+    stream = ConduitBatchAsync().run_iter(None, prompts, PARAMS, make_options())
+
+    index, _ = await anext(stream)
+    await stream.aclose()
+
+    assert index == 0
+    assert client.in_flight == 0
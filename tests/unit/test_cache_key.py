@@ -0,0 +1,200 @@
+from __future__ import annotations
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message import digest
+from conduit.domain.message.message import (
+    AssistantMessage,
+    AudioContent,
+    ImageContent,
+    SystemMessage,
+    TextContent,
+    UserMessage,
+)
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.storage.cache.postgres_cache_async import AsyncPostgresCache
+from conduit.utils.progress.verbosity import Verbosity
+
+
+# Fixtures
+# ---
+
+OPTIONS = ConduitOptions(project_name="cache-key", console=None, verbosity=Verbosity.SILENT)
+PARAMS = GenerationParams(model="gpt-4o")
+
+
+def image(seed: int, size: int = 2_000_000) -> ImageContent:
+    return ImageContent.from_bytes(bytes([seed % 256]) * size)
+
+
+def make_request(messages, params: GenerationParams = PARAMS) -> GenerationRequest:
+    return GenerationRequest(messages=messages, params=params, options=OPTIONS)
+
+
+def multimodal_conversation(turns: int = 20):
+    messages = [SystemMessage(content="You are helpful.")]
+    for turn in range(turns):
+        messages.append(
+            UserMessage(content=[TextContent(text=f"What is in image {turn}?"), image(turn)])
+        )
+        messages.append(AssistantMessage(content=f"A picture of {turn}."))
+    messages.append(
+        UserMessage(
+            content=[
+                "And this recording?",
+                AudioContent.from_bytes(b"\x01" * 1_000_000),
+            ]
+        )
+    )
+    return messages
+
+
+class FakeConnection:
+    def __init__(self, rows: dict[str, str]):
+        self.rows = rows
+
+    async def fetch(self, query, cache_name):
+        return [
+            {"cache_key": key, "payload": payload} for key, payload in self.rows.items()
+        ]
+
+    async def execute(self, query, cache_name, old_keys, new_keys):
+        moved = 0
+        for old, new in zip(old_keys, new_keys):
+            if old in self.rows and new not in self.rows:
+                self.rows[new] = self.rows.pop(old)
+                moved += 1
+        return f"UPDATE {moved}"
+
+
+class FakePool:
+    def __init__(self, rows: dict[str, str]):
+        self.connection = FakeConnection(rows)
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.connection
+
+
+# Tests
+# ---
+
+def test_key_depends_only_on_role_content_and_params():
+    first = make_request([UserMessage(content="hello")])
+    # Fresh ids and timestamps don't matter
+    assert make_request([UserMessage(content="hello")]).generate_cache_key() == (
+        first.generate_cache_key()
+    )
+    assert make_request([UserMessage(content="hello!")]).generate_cache_key() != (
+        first.generate_cache_key()
+    )
+    assert make_request([AssistantMessage(content="hello")]).generate_cache_key() != (
+        first.generate_cache_key()
+    )
+    assert make_request(
+        [UserMessage(content="hello")], GenerationParams(model="gpt-4o", temperature=0.2)
+    ).generate_cache_key() != first.generate_cache_key()
+
+
+def test_key_distinguishes_blob_content_and_detail():
+    base = make_request([UserMessage(content=["look", image(1, 64)])])
+    other_bytes = make_request([UserMessage(content=["look", image(2, 64)])])
+    other_detail = make_request(
+        [UserMessage(content=["look", image(1, 64).model_copy(update={"detail": "high"})])]
+    )
+    text_part = make_request([UserMessage(content=[TextContent(text="look"), image(1, 64)])])
+
+    keys = {
+        base.generate_cache_key(),
+        other_bytes.generate_cache_key(),
+        other_detail.generate_cache_key(),
+        text_part.generate_cache_key(),
+    }
+    assert len(keys) == 4
+
+
+def test_reassigning_a_field_invalidates_the_memo():
+    message = UserMessage(content="before")
+    request = make_request([message])
+    before = request.generate_cache_key()
+
+    message.content = "after"
+
+    assert request.generate_cache_key() == make_request(
+        [UserMessage(content="after")]
+    ).generate_cache_key()
+    assert request.generate_cache_key() != before
+
+
+def test_digests_do_not_affect_message_equality():
+    message = UserMessage(content="same", message_id="m", session_id="s", created_at=1)
+    twin = message.model_copy()
+    digest.message_digest(message)
+    assert message == twin
+
+
+def test_memo_is_released_with_the_object():
+    part = image(7, 64)
+    digest.part_digest(part)
+    key = id(part)
+    assert key in digest._memo
+
+    del part
+
+    assert key not in digest._memo
+
+
+def test_blobs_are_hashed_once(monkeypatch):
+    messages = multimodal_conversation(turns=3)
+    make_request(messages).generate_cache_key()
+
+    calls = []
+    real_sha256 = digest.hashlib.sha256
+    monkeypatch.setattr(
+        digest.hashlib, "sha256", lambda data=b"": calls.append(len(data)) or real_sha256(data)
+    )
+
+    # Same messages, one more turn: only the new message is hashed
+    messages.append(AssistantMessage(content="Static."))
+    make_request(messages).generate_cache_key()
+
+    assert max(calls) < 1_000
+
+
+@pytest.mark.asyncio
+async def test_migrate_keys_rekeys_legacy_entries(monkeypatch):
+    request = make_request([UserMessage(content=["look", image(3, 64)])])
+    response = GenerationResponse(
+        message=AssistantMessage(content="a picture"),
+        request=request,
+        metadata=ResponseMetadata(
+            duration=1.0,
+            model_slug="gpt-4o",
+            input_tokens=1,
+            output_tokens=1,
+            stop_reason="stop",
+        ),
+    )
+    payload = response.model_dump_json()
+    legacy_key = request.generate_legacy_cache_key()
+    rows = {legacy_key: payload, "unrecognized": payload}
+
+    cache = AsyncPostgresCache(project_name="cache-key")
+
+    async def ready():
+        return FakePool(rows)
+
+    monkeypatch.setattr(cache, "_ensure_ready", ready)
+
+    assert await cache.migrate_keys() == (1, 1)
+    assert set(rows) == {request.generate_cache_key(), "unrecognized"}
+    assert json.loads(rows[request.generate_cache_key()])["message"]["content"] == "a picture"
+    # Running it again is a no-op
+    assert await cache.migrate_keys() == (0, 2)
+
@@ -0,0 +1,89 @@
+from __future__ import annotations
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from conduit.core.clients.client_base import Client
+from conduit.core.clients.client_pool import ClientPool
+from conduit.core.clients.openai.client import OpenAIClient
+from conduit.core.model.models.modelstore import ModelStore
+
+
+# Fixtures
+# ---
+
+class DummyClient(Client):
+    provider = "dummy"
+    base_url = "http://dummy.local/v1"
+    api_key_env = "DUMMY_API_KEY"
+
+    def __init__(self):
+        self._raw_client = AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def api_keys(monkeypatch):
+    monkeypatch.setenv("DUMMY_API_KEY", "key-one")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_within_loop():
+    pool = ClientPool()
+    assert pool.get(DummyClient) is pool.get(DummyClient)
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_keys_on_api_key(monkeypatch):
+    pool = ClientPool()
+    first = pool.get(DummyClient)
+    monkeypatch.setenv("DUMMY_API_KEY", "key-two")
+    second = pool.get(DummyClient)
+
+    assert first is not second
+    assert len(pool) == 2
+    assert "key-two" not in repr(DummyClient.pool_key())
+
+
+def test_pool_rebuilds_when_loop_changes():
+    pool = ClientPool()
+
+    async def fetch():
+        return pool.get(DummyClient)
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    assert first is not second
+    assert len(pool) == 1
+
+
+def test_pool_does_not_cache_outside_a_loop():
+    pool = ClientPool()
+    assert pool.get(DummyClient) is not pool.get(DummyClient)
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_shutdown_closes_sdk_clients():
+    pool = ClientPool()
+    client = pool.get(DummyClient)
+
+    await pool.shutdown()
+
+    client._raw_client.close.assert_awaited_once()
+    assert len(pool) == 0
+    assert pool.get(DummyClient) is not client
+
+
+@pytest.mark.asyncio
+async def test_model_store_get_client_uses_pool():
+    first = ModelStore.get_client("gpt-5", "sdk")
+    second = ModelStore.get_client("gpt-5", "sdk")
+
+    assert isinstance(first, OpenAIClient)
+    assert first is second
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import pytest
+
+from conduit.core.model.models.modelstore import ModelStore
+from conduit.core.model.models.tokens import TokenCounter
+from conduit.domain.conversation import context_window
+from conduit.domain.conversation.context_window import ContextWindow, token_budget
+from conduit.domain.conversation.conversation import Conversation
+from conduit.domain.message.message import (
+    AssistantMessage,
+    SystemMessage,
+    ToolCall,
+    ToolMessage,
+    UserMessage,
+)
+
+
+# Fixtures
+# ---
+
+class WordEncoding:
+    """One token per word; records what it encodes."""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return [0] * len(text.split())
+
+
+@pytest.fixture
+def encoding(monkeypatch) -> WordEncoding:
+    encoding = WordEncoding()
+    counter = TokenCounter(cache_size=0, loader=lambda name: encoding)
+    monkeypatch.setattr(context_window, "token_counter", counter)
+    return encoding
+
+
+def words(n: int) -> str:
+    return " ".join(["word"] * n)
+
+
+def chat(turns: int, size: int = 10) -> Conversation:
+    conversation = Conversation()
+    conversation.ensure_system_message("be brief")
+    for _ in range(turns):
+        conversation.add(UserMessage(content=words(size)))
+        conversation.add(AssistantMessage(content=words(size)))
+    return conversation
+
+
+# Tests
+# ---
+
+def test_budget_reserves_room_for_the_response():
+    assert token_budget(10_000, max_output_tokens=2_000) == 7_200
+    assert token_budget(10_000) == int(7_500 * 0.9)
+
+
+def test_only_new_messages_are_tokenized(encoding):
+    conversation = chat(20)
+    conversation.tokens("gpt-4o")
+    first = len(encoding.encoded)
+
+    conversation.add(UserMessage(content="one more question"))
+    total = conversation.tokens("gpt-4o")
+
+    # The new message's role and content; nothing else is re-encoded
+    assert encoding.encoded[first:] == ["user", "one more question"]
+    assert total == conversation.tokens("gpt-4o")
+
+
+def test_reassigned_content_is_recounted(encoding):
+    message = UserMessage(content="two words")
+    assert context_window.message_tokens(message, "gpt-4o") == 3 + 1 + 2
+
+    message.content = "now three words"
+    assert context_window.message_tokens(message, "gpt-4o") == 3 + 1 + 3
+
+
+@pytest.mark.asyncio
+async def test_fit_drops_oldest_turns_and_keeps_system(encoding):
+    conversation = chat(10)
+    conversation.add(UserMessage(content="latest"))
+    window = ContextWindow("gpt-4o", budget=100)
+
+    dropped = await window.fit(conversation)
+
+    assert dropped and window.tokens(conversation.messages) <= 100
+    assert conversation.messages[0].role.value == "system"
+    assert conversation.messages[1].role.value == "user"
+    assert conversation.messages[-1].content == "latest"
+    # The session still has everything
+    assert len(conversation.session.message_dict) == 22
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_and_results_stay_together(encoding):
+    conversation = chat(1)
+    conversation.add(UserMessage(content="look these up"))
+    call = AssistantMessage(
+        tool_calls=[ToolCall(id=f"c{i}", function_name="lookup", arguments={"q": i}) for i in range(2)]
+    )
+    conversation.add(call)
+    for i in range(2):
+        conversation.add(ToolMessage(content=words(30), tool_call_id=f"c{i}"))
+    conversation.add(AssistantMessage(content="done"))
+    conversation.add(UserMessage(content="thanks"))
+
+    # Room for the last turns, but not for the whole tool exchange
+    total = conversation.tokens("gpt-4o")
+    await ContextWindow("gpt-4o", budget=total - 20).fit(conversation)
+
+    kept = conversation.messages
+    has_results = any(m.role.value == "tool" for m in kept)
+    assert (call in kept) == has_results
+    # Never starts on an orphaned assistant or tool message
+    assert kept[1].role.value == "user"
+
+
+@pytest.mark.asyncio
+async def test_fit_can_summarize_dropped_turns(encoding):
+    conversation = chat(10)
+    conversation.add(UserMessage(content="latest"))
+    seen = []
+
+    async def summarize(messages):
+        seen.extend(messages)
+        return "they talked about words"
+
+    dropped = await ContextWindow("gpt-4o", budget=120).fit(conversation, summarize=summarize)
+
+    assert seen == dropped[: len(seen)] and seen
+    system = conversation.messages[0]
+    assert isinstance(system, SystemMessage)
+    assert system.content.startswith("be brief")
+    assert system.content.endswith("they talked about words")
+    assert conversation.messages[-1].content == "latest"
+
+
+@pytest.mark.asyncio
+async def test_max_messages_caps_history(encoding):
+    conversation = chat(10)
+    conversation.add(UserMessage(content="latest"))
+
+    await ContextWindow("gpt-4o", budget=10_000, max_messages=5).fit(conversation)
+
+    assert len(conversation.messages) <= 6
+    assert conversation.messages[-1].content == "latest"
+
+
+@pytest.mark.asyncio
+async def test_unknown_context_window_caps_messages_and_is_retried_later(
+    encoding, monkeypatch
+):
+    lookups: list[str] = []
+
+    def get_model(model):
+        lookups.append(model)
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(ModelStore, "get_model", staticmethod(get_model))
+    monkeypatch.setattr(context_window, "_context_windows", {})
+    monkeypatch.setattr(context_window, "_failed_lookups", {})
+
+    window = await ContextWindow.for_model("some-200k-model")
+    await ContextWindow.for_model("some-200k-model")
+
+    assert window.budget is None
+    assert window.max_messages == context_window.FALLBACK_MAX_MESSAGES
+    # The failure is remembered briefly, then retried
+    assert lookups == ["some-200k-model"]
+    monkeypatch.setattr(context_window, "FAILED_LOOKUP_TTL_SECONDS", 0.0)
+    context_window._failed_lookups.clear()
+    await ContextWindow.for_model("some-200k-model")
+    await ContextWindow.for_model("some-200k-model")
+    assert len(lookups) == 3
+
+    conversation = chat(30, size=1_000)
+    conversation.add(UserMessage(content="latest"))
+    await window.fit(conversation)
+
+    non_system = [m for m in conversation.messages if m.role.value != "system"]
+    assert len(non_system) <= context_window.FALLBACK_MAX_MESSAGES
+    assert conversation.messages[-1].content == "latest"
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from conduit.core.engine.generate import generate
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.conversation.conversation import Conversation
+from conduit.domain.message.message import AssistantMessage, UserMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+
+
+# Fixtures
+# ---
+
+def make_conversation(turns: int = 3) -> Conversation:
+    conversation = Conversation()
+    for i in range(turns):
+        conversation.add(UserMessage(content=f"question {i} " + "x" * 1000))
+        conversation.add(AssistantMessage(content=f"answer {i}"))
+    conversation.add(UserMessage(content="final question"))
+    return conversation
+
+
+# Tests
+# ---
+
+def test_fork_shares_messages_without_copying():
+    conversation = make_conversation()
+    fork = conversation.fork()
+
+    assert fork.messages == conversation.messages
+    assert all(a is b for a, b in zip(fork.messages, conversation.messages))
+    assert fork.session.session_id == conversation.session.session_id
+    assert fork.leaf == conversation.leaf
+
+
+def test_appending_to_fork_leaves_original_untouched():
+    conversation = make_conversation()
+    original_ids = [m.message_id for m in conversation.messages]
+    original_leaf = conversation.leaf
+
+    fork = conversation.fork()
+    reply = AssistantMessage(content="branch reply")
+    fork.add(reply)
+
+    assert [m.message_id for m in conversation.messages] == original_ids
+    assert conversation.leaf == original_leaf
+    assert reply.message_id not in conversation.session.message_dict
+    assert reply.predecessor_id == original_leaf
+    assert fork.session.message_dict[reply.message_id] is reply
+
+
+@pytest.mark.asyncio
+async def test_generate_branches_without_deep_copy():
+    conversation = make_conversation()
+    params = GenerationParams(model="gpt-4o")
+    options = ConduitOptions(project_name="test", console=None)
+    response = GenerationResponse(
+        message=AssistantMessage(content="done"),
+        request=GenerationRequest(
+            messages=conversation.messages, params=params, options=options
+        ),
+        metadata=ResponseMetadata(
+            duration=1.0,
+            model_slug="gpt-4o",
+            input_tokens=1,
+            output_tokens=1,
+            stop_reason="stop",
+        ),
+    )
+
+    with patch("conduit.core.engine.generate.ModelAsync") as model_cls:
+        model_cls.return_value.pipe = AsyncMock(return_value=response)
+        result = await generate(conversation, params, options)
+
+    assert result is not conversation
+    assert result.content == "done"
+    assert conversation.content == "final question"
+    assert all(a is b for a, b in zip(result.messages, conversation.messages))
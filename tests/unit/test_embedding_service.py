@@ -0,0 +1,164 @@
+from __future__ import annotations
+import asyncio
+
+import numpy as np
+import pytest
+
+from conduit.embeddings.embedder import Embedder, HashingEmbedder
+from conduit.embeddings.service import EmbeddingService
+from conduit.embeddings.store import MemoryEmbeddingStore, SQLiteEmbeddingStore
+
+
+# Fixtures
+# ---
+
+class RecordingEmbedder(HashingEmbedder):
+    """Deterministic embedder that records every batch it is sent."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        super().__init__(dimensions=16)
+        self.batches: list[list[str]] = []
+        self.delay = delay
+        self.fail = fail
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def embed(self, texts):
+        self.batches.append(list(texts))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.fail:
+            raise ConnectionError("embedding server unavailable")
+        return await super().embed(texts)
+
+
+@pytest.fixture
+def embedder() -> RecordingEmbedder:
+    return RecordingEmbedder()
+
+
+def make_service(embedder, store=None, **kwargs) -> EmbeddingService:
+    if store is None:
+        store = MemoryEmbeddingStore()
+    return EmbeddingService("test-model", embedder=embedder, store=store, **kwargs)
+
+
+# Tests
+# ---
+
+async def test_returns_rows_in_input_order(embedder):
+    service = make_service(embedder)
+
+    matrix = await service.embed(["alpha", "beta", "alpha"])
+
+    expected = await HashingEmbedder(dimensions=16).embed(["alpha", "beta", "alpha"])
+    assert isinstance(service, Embedder)
+    assert matrix.dtype == np.float32 and matrix.shape == (3, 16)
+    assert np.array_equal(matrix, expected)
+    # Duplicates within a call are sent once
+    assert embedder.batches == [["alpha", "beta"]]
+
+
+async def test_concurrent_callers_share_batches_and_inflight_texts(embedder):
+    service = make_service(embedder, batch_window=0.01)
+
+    results = await asyncio.gather(
+        service.embed(["one", "two"]),
+        service.embed(["two", "three"]),
+        service.embed(["three", "four"]),
+    )
+
+    assert [len(r) for r in results] == [2, 2, 2]
+    assert embedder.batches == [["one", "two", "three", "four"]]
+    assert np.array_equal(results[0][1], results[1][0])
+
+
+async def test_batches_are_capped_at_max_size(embedder):
+    service = make_service(embedder, max_batch_size=3)
+
+    await service.embed([f"text {i}" for i in range(8)])
+
+    assert [len(b) for b in embedder.batches] == [3, 3, 2]
+
+
+async def test_concurrent_batches_are_bounded():
+    embedder = RecordingEmbedder(delay=0.01)
+    service = make_service(embedder, max_batch_size=2, max_concurrent_batches=3)
+
+    matrix = await service.embed([f"text {i}" for i in range(20)])
+
+    assert matrix.shape == (20, 16)
+    assert len(embedder.batches) == 10
+    assert embedder.max_in_flight == 3
+
+
+async def test_texts_in_flight_are_not_resent():
+    embedder = RecordingEmbedder(delay=0.05)
+    service = make_service(embedder, batch_window=0.0)
+
+    first = asyncio.ensure_future(service.embed(["slow text"]))
+    await asyncio.sleep(0.01)  # the first batch has been sent
+    second = await service.embed(["slow text"])
+
+    assert np.array_equal((await first)[0], second[0])
+    assert embedder.batches == [["slow text"]]
+
+
+async def test_persistent_store_survives_a_new_service(tmp_path, embedder):
+    path = tmp_path / "embeddings.sqlite"
+    chunks = [f"chunk {i}" for i in range(5)]
+    first = await make_service(embedder, store=SQLiteEmbeddingStore(path)).embed(chunks)
+
+    rerun = RecordingEmbedder()
+    service = make_service(rerun, store=SQLiteEmbeddingStore(path))
+    second = await service.embed(chunks + ["new chunk"])
+
+    assert np.array_equal(first, second[:5])
+    assert rerun.batches == [["new chunk"]]
+    assert service.stats()["store_hits"] == 5
+
+
+async def test_store_is_keyed_by_model(embedder):
+    store = MemoryEmbeddingStore()
+    await make_service(embedder, store=store).embed(["shared text"])
+
+    other = EmbeddingService("other-model", embedder=embedder, store=store)
+    await other.embed(["shared text"])
+
+    assert embedder.batches == [["shared text"], ["shared text"]]
+    assert len(store) == 2
+
+
+async def test_failures_reach_every_caller_and_are_not_cached():
+    embedder = RecordingEmbedder(fail=True)
+    service = make_service(embedder)
+
+    results = await asyncio.gather(
+        service.embed(["a"]), service.embed(["a", "b"]), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    embedder.fail = False
+    assert (await service.embed(["a"])).shape == (1, 16)
+
+
+def test_shared_service_recovers_when_its_loop_closes_mid_batch(embedder):
+    service = make_service(embedder, batch_window=0.5)
+
+    async def interrupted():
+        # The loop closes before the flush timer fires
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(service.embed(["alpha"]), timeout=0.01)
+
+    async def later():
+        return await asyncio.wait_for(service.embed(["alpha", "beta"]), timeout=2)
+
+    asyncio.run(interrupted())
+    matrix = asyncio.run(later())
+
+    assert matrix.shape == (2, 16)
+    assert embedder.batches == [["alpha", "beta"]]
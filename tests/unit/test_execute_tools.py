@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from typing import Annotated
+
+import pytest
+
+from conduit.capabilities.tools.registry import ToolRegistry
+from conduit.core.engine.execute import execute
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.conversation.conversation import Conversation
+from conduit.domain.exceptions.exceptions import ToolError
+from conduit.domain.message.message import AssistantMessage, ToolCall, UserMessage
+from conduit.domain.request.generation_params import GenerationParams
+
+
+# Fixtures
+# ---
+
+in_flight = 0
+peak_in_flight = 0
+# Every crunch() call must reach this before any returns, proving they overlap
+crunch_barrier: threading.Barrier | None = None
+
+
+async def fetch_url(url: Annotated[str, "URL to fetch."]) -> str:
+    """Pretend to fetch a URL."""
+    global in_flight, peak_in_flight
+    in_flight += 1
+    peak_in_flight = max(peak_in_flight, in_flight)
+    await asyncio.sleep(0.05)
+    in_flight -= 1
+    return f"contents of {url}"
+
+
+def crunch(n: Annotated[int, "Number to square."]) -> int:
+    """Blocking, CPU-style tool."""
+    if crunch_barrier is not None:
+        crunch_barrier.wait(timeout=2)
+    return n * n
+
+
+async def hang(seconds: Annotated[float, "How long to hang."]) -> str:
+    """Never finishes in time."""
+    await asyncio.sleep(seconds)
+    return "too late"
+
+
+async def explode(reason: Annotated[str, "Why."]) -> str:
+    """Crashes."""
+    raise RuntimeError(reason)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    global in_flight, peak_in_flight, crunch_barrier
+    in_flight = peak_in_flight = 0
+    crunch_barrier = None
+
+
+def make_registry() -> ToolRegistry:
+    registry = ToolRegistry()
+    registry.register_functions([fetch_url, crunch, hang, explode])
+    return registry
+
+
+def make_conversation(tool_calls: list[ToolCall]) -> Conversation:
+    conversation = Conversation()
+    conversation.add(UserMessage(content="go"))
+    conversation.add(AssistantMessage(content="", tool_calls=tool_calls))
+    return conversation
+
+
+def make_options(**kwargs) -> ConduitOptions:
+    return ConduitOptions(
+        project_name="test", console=None, tool_registry=make_registry(), **kwargs
+    )
+
+
+def fetch_calls(n: int) -> list[ToolCall]:
+    return [
+        ToolCall(function_name="fetch_url", arguments={"url": f"https://example.com/{i}"})
+        for i in range(n)
+    ]
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_and_keep_order():
+    tool_calls = fetch_calls(5)
+    conversation = make_conversation(tool_calls)
+
+    result = await execute(conversation, GenerationParams(model="gpt-4o"), make_options())
+
+    tool_messages = result.messages[-5:]
+    assert [m.tool_call_id for m in tool_messages] == [c.id for c in tool_calls]
+    assert [m.content for m in tool_messages] == [
+        f"contents of https://example.com/{i}" for i in range(5)
+    ]
+    assert peak_in_flight == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected():
+    conversation = make_conversation(fetch_calls(6))
+    await execute(
+        conversation, GenerationParams(model="gpt-4o"), make_options(max_concurrent_tools=2)
+    )
+    assert peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_when_parallel_tool_calls_disabled():
+    conversation = make_conversation(fetch_calls(3))
+    await execute(
+        conversation, GenerationParams(model="gpt-4o"), make_options(parallel_tool_calls=False)
+    )
+    assert peak_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_tools_run_on_thread_pool():
+    global crunch_barrier
+    # Run one at a time, the first call would time out on the barrier and fail
+    crunch_barrier = threading.Barrier(4)
+    tool_calls = [ToolCall(function_name="crunch", arguments={"n": i}) for i in range(4)]
+    conversation = make_conversation(tool_calls)
+
+    result = await execute(conversation, GenerationParams(model="gpt-4o"), make_options())
+
+    assert [m.content for m in result.messages[-4:]] == ["0", "1", "4", "9"]
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_is_reported_to_the_llm():
+    tool_calls = [
+        ToolCall(function_name="hang", arguments={"seconds": 5}),
+        ToolCall(function_name="fetch_url", arguments={"url": "https://example.com"}),
+    ]
+    conversation = make_conversation(tool_calls)
+
+    result = await execute(
+        conversation, GenerationParams(model="gpt-4o"), make_options(tool_timeout=0.1)
+    )
+
+    timed_out, fetched = result.messages[-2:]
+    assert "timed out" in timed_out.content
+    assert fetched.content == "contents of https://example.com"
+
+
+@pytest.mark.asyncio
+async def test_crashing_tool_propagates():
+    tool_calls = [
+        ToolCall(function_name="explode", arguments={"reason": "boom"}),
+        *fetch_calls(2),
+    ]
+    conversation = make_conversation(tool_calls)
+
+    with pytest.raises(ToolError):
+        await execute(conversation, GenerationParams(model="gpt-4o"), make_options())
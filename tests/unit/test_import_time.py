@@ -0,0 +1,82 @@
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+# Shell scripts call the CLI hundreds of times per job, so nothing on this list
+# should load just to parse a command line
+HEAVY_MODULES = [
+    "conduit.core.conduit.conduit_base",
+    "conduit.batch",
+    "conduit.core.model.models.modelstore",
+    "conduit.storage.odometer.odometer_registry",
+    "jinja2",
+    "pydantic",
+]
+
+
+# Fixtures
+# ---
+
+@pytest.fixture
+def configured_env(tmp_path) -> dict[str, str]:
+    """
+    Environment with a populated ~/.config/conduit, as on a configured machine:
+    loading settings there renders the jinja system prompt.
+    """
+    config_dir = tmp_path / "conduit"
+    config_dir.mkdir()
+    (config_dir / "system_message.jinja2").write_text("Today is {{ current_date }}.")
+    (config_dir / "settings.toml").write_text(
+        '[settings]\npreferred_model = "gpt-4o"\nverbosity = "progress"\n'
+    )
+    return {**os.environ, "XDG_CONFIG_HOME": str(tmp_path)}
+
+
+def modules_after_import(module: str, env: dict[str, str] | None = None) -> set[str]:
+    """Import module in a fresh interpreter; return the modules it loaded."""
+    code = f"import json, sys\nimport {module}\nprint(json.dumps(sorted(sys.modules)))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    return set(json.loads(result.stdout))
+
+
+# Tests
+# ---
+
+def test_import_conduit_is_cheap(configured_env):
+    loaded = modules_after_import("conduit", env=configured_env)
+
+    assert "rich" not in loaded
+    assert "conduit.config" not in loaded
+
+
+def test_cli_entry_point_skips_heavy_modules(configured_env):
+    loaded = modules_after_import("conduit.apps.scripts.conduit_cli", env=configured_env)
+
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+
+def test_lazy_commands_load_on_invocation(monkeypatch):
+    from conduit.apps.cli.cli_class import ConduitCLI
+    from conduit.apps.scripts.conduit_cli import LAZY_COMMANDS
+
+    monkeypatch.setattr(ConduitCLI, "_get_stdin", lambda self: "")
+    cli_app = ConduitCLI()
+    for name, import_path in LAZY_COMMANDS.items():
+        cli_app.attach_lazy(name, import_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli_app.cli, ["batch", "--help"])
+
+    assert result.exit_code == 0
+    assert "batch" in cli_app.cli.commands
+    assert "cache" not in cli_app.cli.commands
+    # Listing still shows every command
+    result = runner.invoke(cli_app.cli, ["--help"])
+    assert all(name in result.output for name in LAZY_COMMANDS)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import json
+import os
+import time
+
+import pytest
+
+from conduit.config import settings
+from conduit.core.model.models import modelstore
+from conduit.core.model.models.modelstore import ModelStore, _ModelRegistry
+
+
+# conftest patches ModelStore.validate_model per test; keep the real one
+validate_model = ModelStore.validate_model
+
+
+# Fixtures
+# ---
+
+@pytest.fixture
+def registry_files(tmp_path, monkeypatch):
+    """Point ModelStore at temporary models/aliases/ollama files."""
+    models_path = tmp_path / "models.json"
+    aliases_path = tmp_path / "aliases.json"
+    ollama_path = tmp_path / "ollama_models.json"
+    models_path.write_text(
+        json.dumps({"openai": ["gpt-test"], "anthropic": ["claude-test"], "ollama": []})
+    )
+    aliases_path.write_text(json.dumps({"fast": "gpt-test"}))
+
+    monkeypatch.setattr(modelstore, "MODELS_PATH", models_path)
+    monkeypatch.setattr(modelstore, "ALIASES_PATH", aliases_path)
+    monkeypatch.setitem(settings.paths, "OLLAMA_MODELS_PATH", ollama_path)
+    monkeypatch.setattr(ModelStore, "_registry_snapshot", None)
+    return models_path, aliases_path, ollama_path
+
+
+def bump_mtime(path) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# Tests
+# ---
+
+def test_registry_lookups(registry_files):
+    assert ModelStore.identify_provider("claude-test") == "anthropic"
+    assert ModelStore.identify_provider("unknown-model") == "ollama"
+    assert ModelStore.is_supported("fast")
+    assert ModelStore.is_cloud_model("gpt-test")
+    assert ModelStore.list_models() == ["gpt-test", "claude-test"]
+
+
+def test_validate_model_resolves_aliases(registry_files):
+    assert validate_model("fast") == "gpt-test"
+    assert validate_model("claude-test") == "claude-test"
+    with pytest.raises(ValueError):
+        validate_model("unknown-model")
+
+
+def test_registry_is_loaded_once(registry_files, monkeypatch):
+    calls = []
+    original = _ModelRegistry.load.__func__
+
+    def counting_load(cls, *args):
+        calls.append(args)
+        return original(cls, *args)
+
+    monkeypatch.setattr(_ModelRegistry, "load", classmethod(counting_load))
+    for _ in range(100):
+        ModelStore.identify_provider("gpt-test")
+        ModelStore.is_supported("fast")
+
+    assert len(calls) == 1
+
+
+def test_registry_reloads_when_files_change(registry_files):
+    models_path, aliases_path, ollama_path = registry_files
+    assert ModelStore.identify_provider("llama-test") == "ollama"
+    assert not ModelStore.is_supported("llama-test")
+
+    ollama_path.write_text(json.dumps({"ollama": ["llama-test"]}))
+    assert ModelStore.is_supported("llama-test")
+
+    aliases_path.write_text(json.dumps({"smart": "claude-test"}))
+    bump_mtime(aliases_path)
+    assert ModelStore.aliases() == {"smart": "claude-test"}
+
+
+def test_models_returns_a_copy(registry_files):
+    ModelStore.models()["openai"].append("mutated")
+    assert not ModelStore.is_supported("mutated")
+
+
+# Benchmark
+# ---
+
+@pytest.mark.benchmark
+def test_benchmark_registry_lookup_overhead(registry_files):
+    """
+    Per-request lookup overhead: parsing the files on every call (old behaviour)
+    versus the memoized registry (mtime checks plus dict lookups).
+    """
+    _, _, ollama_path = registry_files
+    iterations = 2000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _ModelRegistry.load(ollama_path, ()).provider_by_model.get("claude-test")
+    uncached = (time.perf_counter() - start) / iterations
+
+    ModelStore._registry()  # warm
+    start = time.perf_counter()
+    for _ in range(iterations):
+        ModelStore.identify_provider("claude-test")
+    cached = (time.perf_counter() - start) / iterations
+
+    assert cached < uncached
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import asyncio
+import atexit
+import signal
+
+import pytest
+
+from conduit.storage.odometer.event_log import EventLog, read_events
+from conduit.storage.odometer.odometer import Odometer
+from conduit.storage.odometer.odometer_registry import OdometerRegistry
+from conduit.storage.odometer.token_event import TokenEvent
+
+
+# Fixtures
+# ---
+
+class FakeBackend:
+    """Stores events by event_id, like the ON CONFLICT DO NOTHING insert."""
+
+    def __init__(self):
+        self.rows: dict[str, TokenEvent] = {}
+        self.batches: list[int] = []
+        self.fail = False
+
+    async def store_events(self, events):
+        if self.fail:
+            raise ConnectionError("db down")
+        self.batches.append(len(events))
+        for event in events:
+            self.rows.setdefault(event.event_id, event)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch, tmp_path_factory):
+    monkeypatch.setattr(atexit, "register", lambda *args: None)
+    monkeypatch.setattr(signal, "signal", lambda *args: None)
+    monkeypatch.setattr(
+        "conduit.storage.odometer.odometer_registry.RESCUE_FILE",
+        tmp_path_factory.mktemp("rescue") / "odometer_rescue.json",
+    )
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+def make_registry(tmp_path, backend, **kwargs) -> OdometerRegistry:
+    registry = OdometerRegistry(log_dir=tmp_path, **kwargs)
+    registry.async_backend = backend
+    return registry
+
+
+def event(n: int = 0) -> TokenEvent:
+    return TokenEvent(model="gpt-4o", input_tokens=n, output_tokens=1, host="test")
+
+
+# Tests
+# ---
+
+def test_log_reads_in_bounded_batches_across_segments(tmp_path):
+    log = EventLog(tmp_path, segment_bytes=500)
+    for n in range(20):
+        log.append(event(n))
+    assert len(list(tmp_path.glob("*.jsonl"))) > 1
+
+    seen = []
+    while True:
+        batch, cursor = log.read(6)
+        if not batch:
+            break
+        assert len(batch) <= 6
+        seen.extend(e.input_tokens for e in batch)
+        log.commit(cursor, len(batch))
+
+    assert seen == list(range(20))
+    assert log.pending == 0
+    # Consumed segments are gone; only the one being written remains
+    assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+
+def test_torn_and_corrupt_lines_are_skipped(tmp_path):
+    path = tmp_path / "run.000000.jsonl"
+    good = event(1).model_dump_json()
+    path.write_text(f"{good}\nnot json\n{good}\n{good[:10]}")
+
+    events, offset = read_events(path)
+
+    assert len(events) == 2
+    assert offset == len(f"{good}\nnot json\n{good}\n")
+
+
+def test_odometer_keeps_a_bounded_window():
+    odometer = Odometer(max_events=10)
+    for n in range(100):
+        odometer.record(event(n))
+
+    assert len(odometer.events) <= 20
+    assert odometer.events[-1].input_tokens == 99
+    assert odometer.total_input_tokens == sum(range(100))
+
+
+@pytest.mark.asyncio
+async def test_flush_drains_log_in_batches(tmp_path, backend):
+    registry = make_registry(tmp_path, backend, batch_size=4)
+    for n in range(10):
+        registry.emit_token_event(event(n))
+
+    await registry.stop()
+
+    assert backend.batches == [4, 4, 2]
+    assert registry.event_log.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_events_for_the_next_one(tmp_path, backend):
+    registry = make_registry(tmp_path, backend)
+    registry.emit_token_event(event())
+    backend.fail = True
+
+    await registry.flush()
+    assert registry.event_log.pending == 1
+
+    backend.fail = False
+    await registry.stop()
+    assert len(backend.rows) == 1
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_triggers_on_batch_size(tmp_path, backend):
+    registry = make_registry(tmp_path, backend, batch_size=3, flush_interval=60)
+    for n in range(3):
+        registry.emit_token_event(event(n))
+
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if backend.rows:
+            break
+
+    assert len(backend.rows) == 3
+    await registry.stop()
+
+
+@pytest.mark.asyncio
+async def test_crashed_process_is_replayed_idempotently(tmp_path, backend):
+    crashed = make_registry(tmp_path, backend, batch_size=2)
+    for n in range(5):
+        crashed.emit_token_event(event(n))
+    # Part of the log reached the DB before the "crash"
+    batch, cursor = crashed.event_log.read(2)
+    await backend.store_events(batch)
+    crashed.event_log._lock_file.close()  # Process died: its lock is released
+
+    survivor = make_registry(tmp_path, backend)
+    await survivor.recover()
+
+    assert sorted(e.input_tokens for e in backend.rows.values()) == [0, 1, 2, 3, 4]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_live_process_logs_are_left_alone(tmp_path, backend):
+    alive = make_registry(tmp_path, backend)
+    alive.emit_token_event(event())
+
+    await make_registry(tmp_path, backend).recover()
+
+    assert backend.rows == {}
+    assert alive.event_log.pending == 1
+    alive.event_log.close()
+
+
+def test_clean_exit_removes_the_log(tmp_path, backend):
+    registry = make_registry(tmp_path, backend)
+    registry.emit_token_event(event())
+    batch, cursor = registry.event_log.read(10)
+    registry.event_log.commit(cursor, len(batch))
+
+    registry._save_on_exit()
+
+    assert list(tmp_path.iterdir()) == []
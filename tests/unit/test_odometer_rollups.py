@@ -0,0 +1,117 @@
+from __future__ import annotations
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from conduit.storage.odometer.pgres.postgres_backend_async import (
+    ROLLUP_TIMEZONE,
+    ROLLUP_UPSERT,
+    AsyncPostgresOdometer,
+)
+from conduit.storage.odometer.token_event import TokenEvent
+
+
+# Fixtures
+# ---
+
+class RecordingConnection:
+    """Records SQL; returns canned rows for reporting queries."""
+
+    def __init__(self):
+        self.executed: list[tuple[str, tuple]] = []
+        self.fetched: list[tuple[str, tuple]] = []
+
+    async def execute(self, query, *args):
+        self.executed.append((query, args))
+
+    async def fetch(self, query, *args):
+        self.fetched.append((query, args))
+        return [
+            {
+                "group_key": "gpt-4o",
+                "total_input": 10,
+                "total_output": 5,
+                "total_tokens": 15,
+                "event_count": 2,
+            }
+        ]
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class RecordingPool:
+    def __init__(self):
+        self.connection = RecordingConnection()
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.connection
+
+
+@pytest.fixture
+def backend():
+    odometer = AsyncPostgresOdometer()
+    pool = RecordingPool()
+
+    async def ready():
+        return pool
+
+    odometer._ensure_ready = ready
+    return odometer, pool.connection
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_store_events_inserts_and_rolls_up_in_one_statement(backend):
+    odometer, conn = backend
+    events = [
+        TokenEvent(model="gpt-4o", input_tokens=n, output_tokens=1, host="h")
+        for n in range(3)
+    ]
+
+    await odometer.store_events(events)
+
+    lock, (insert, args) = conn.executed
+    assert "pg_advisory_xact_lock_shared" in lock[0]
+    assert "ON CONFLICT (event_id) DO NOTHING" in insert
+    # Only rows actually inserted feed the rollups, so replays don't double count
+    assert "RETURNING" in insert
+    assert "token_usage_hourly" in insert and "token_usage_daily" in insert
+    assert args[0] == [e.event_id for e in events]
+    assert args[3] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_reports_read_rollups_not_raw_events(backend):
+    odometer, conn = backend
+
+    all_time = await odometer.get_aggregates("model")
+    await odometer.get_aggregates("model", start_date=date.today(), end_date=date.today())
+    await odometer.get_aggregates("date", start_date=date(2026, 1, 1))
+
+    daily, hourly, by_date = (query for query, _ in conn.fetched)
+    assert "FROM token_usage_daily" in daily
+    assert "FROM token_usage_hourly" in hourly and "bucket >=" in hourly
+    assert "FROM token_usage_daily" in by_date and "day >=" in by_date
+    assert all("token_events" not in query for query, _ in conn.fetched)
+    assert all_time == {"gpt-4o": {"input": 10, "output": 5, "total": 15, "events": 2}}
+
+
+@pytest.mark.asyncio
+async def test_date_range_and_daily_rollup_share_one_timezone(backend):
+    odometer, conn = backend
+
+    await odometer.get_aggregates(
+        "model", start_date=date(2026, 3, 1), end_date=date(2026, 3, 1)
+    )
+
+    ((_, params),) = conn.fetched
+    start = datetime(2026, 3, 1, tzinfo=ZoneInfo(ROLLUP_TIMEZONE))
+    assert params == (int(start.timestamp()), int(start.timestamp()) + 86399)
+    assert f"AT TIME ZONE '{ROLLUP_TIMEZONE}'" in ROLLUP_UPSERT
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from conduit.core.prompt import prompt as prompt_module
+from conduit.core.prompt.prompt import Prompt, compile_template, env
+
+
+# Fixtures
+# ---
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    compile_template.cache_clear()
+    yield
+    compile_template.cache_clear()
+
+
+# Tests
+# ---
+
+def test_templates_compile_once_per_distinct_string(monkeypatch):
+    calls = []
+    from_string = env.from_string
+    monkeypatch.setattr(env, "from_string", lambda s: calls.append(s) or from_string(s))
+
+    prompts = [Prompt("Summarize: {{ chunk }}") for _ in range(100)]
+
+    assert len(calls) == 1
+    assert prompts[0].template is prompts[-1].template
+    assert prompts[-1].render({"chunk": "x"}) == "Summarize: x"
+
+
+def test_input_schema_is_per_instance():
+    first = Prompt("{{ a }} {{ b }}")
+    first.input_schema.add("c")
+
+    assert Prompt("{{ a }} {{ b }}").input_schema == {"a", "b"}
+
+
+@pytest.mark.parametrize("text", ["plain question", "trailing\n", "two\n\n", "", "a }} b"])
+def test_plain_strings_skip_jinja_but_render_identically(text):
+    prompt = Prompt(text)
+
+    assert prompt.input_schema == set()
+    assert prompt.render({}) == env.from_string(text).render()
+    assert compile_template.cache_info().currsize == 0
+
+
+def test_cache_is_bounded():
+    for n in range(prompt_module.TEMPLATE_CACHE_SIZE + 10):
+        Prompt(f"{{{{ x }}}} {n}")
+
+    assert compile_template.cache_info().currsize == prompt_module.TEMPLATE_CACHE_SIZE
+
+
+def test_missing_variables_still_raise():
+    with pytest.raises(ValueError, match="missing"):
+        Prompt("Hello {{ name }}").validate_input_variables({})
@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace as NS
+from typing import Annotated
+
+from conduit.capabilities.tools.registry import ToolRegistry
+from conduit.core.clients.anthropic.client import AnthropicClient, cache_usage
+from conduit.core.clients.openai.cache_adapter import cached_prompt_tokens
+from conduit.core.clients.openai.client import OpenAIClient
+from conduit.core.parser.stream.accumulator import StreamAccumulator
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.config.prompt_caching import PromptCaching
+from conduit.domain.message.message import AssistantMessage, SystemMessage, UserMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.utils.progress.verbosity import Verbosity
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+# Fixtures
+# ---
+
+async def lookup(query: Annotated[str, "What to look up."]) -> str:
+    """Look something up."""
+    return query
+
+
+def make_request(model: str, prompt_caching=None) -> GenerationRequest:
+    registry = ToolRegistry()
+    registry.register_function(lookup)
+    options = ConduitOptions(
+        project_name="prompt-caching",
+        console=None,
+        verbosity=Verbosity.SILENT,
+        tool_registry=registry,
+        prompt_caching=prompt_caching,
+    )
+    messages = [
+        SystemMessage(content="You are a careful research assistant."),
+        UserMessage(content="What is prefix caching?"),
+        AssistantMessage(content="Reusing the computed prefix of a prompt."),
+        UserMessage(content="And when does it help?"),
+    ]
+    return GenerationRequest(
+        messages=messages, params=GenerationParams(model=model), options=options
+    )
+
+
+def fixture(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text())
+
+
+# Tests
+# ---
+
+def test_anthropic_payload_matches_recorded_fixture():
+    request = make_request("claude-sonnet-4-5", prompt_caching=True)
+
+    payload = AnthropicClient()._convert_request(request).model_dump(exclude_none=True)
+
+    assert payload == fixture("anthropic_prompt_caching.json")
+
+
+def test_anthropic_payload_unchanged_without_caching():
+    payload = AnthropicClient()._convert_request(make_request("claude-sonnet-4-5"))
+
+    assert payload.system == "You are a careful research assistant."
+    assert "cache_control" not in json.dumps(payload.model_dump(exclude_none=True))
+
+
+def test_anthropic_policy_controls_breakpoints():
+    policy = PromptCaching(tools=False, history=False, ttl="1h")
+    payload = AnthropicClient()._convert_request(make_request("claude-sonnet-4-5", policy))
+
+    assert payload.system[0]["cache_control"] == {"type": "ephemeral", "ttl": "1h"}
+    dumped = json.dumps([payload.tools, payload.messages])
+    assert "cache_control" not in dumped
+
+
+def test_openai_prompt_cache_key_is_stable_across_turns():
+    first = OpenAIClient()._convert_request(make_request("gpt-4o", prompt_caching=True))
+    request = make_request("gpt-4o", prompt_caching=True)
+    request.messages.append(UserMessage(content="One more."))
+    second = OpenAIClient()._convert_request(request)
+
+    assert first.prompt_cache_key == second.prompt_cache_key
+    assert first.prompt_cache_key.startswith("conduit-")
+    plain = OpenAIClient()._convert_request(make_request("gpt-4o"))
+    assert "prompt_cache_key" not in plain.model_dump(exclude_none=True)
+
+
+def test_cached_tokens_are_read_from_usage():
+    anthropic_usage = NS(
+        input_tokens=20, cache_read_input_tokens=1800, cache_creation_input_tokens=40
+    )
+    openai_usage = NS(prompt_tokens=2000, prompt_tokens_details=NS(cached_tokens=1792))
+
+    assert cache_usage(anthropic_usage) == {"cache_read_tokens": 1800, "cache_write_tokens": 40}
+    assert cache_usage(NS(input_tokens=20)) == {"cache_read_tokens": 0, "cache_write_tokens": 0}
+    assert cached_prompt_tokens(openai_usage) == 1792
+    assert cached_prompt_tokens(NS(prompt_tokens=10, prompt_tokens_details=None)) == 0
+
+
+def test_stream_accumulator_reports_anthropic_cache_usage():
+    accumulator = StreamAccumulator(provider="anthropic")
+    usage = NS(input_tokens=12, cache_read_input_tokens=900, cache_creation_input_tokens=0)
+    accumulator.feed(NS(type="message_start", message=NS(model="claude-test", usage=usage)))
+
+    assert accumulator.cache_read_tokens == 900
+    assert accumulator.input_tokens == 12
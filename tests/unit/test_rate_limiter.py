@@ -0,0 +1,254 @@
+from __future__ import annotations
+import asyncio
+from types import SimpleNamespace as NS
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from conduit.core.conduit.batch import rate_limiter
+from conduit.core.conduit.batch.conduit_batch_async import ConduitBatchAsync
+from conduit.core.conduit.batch.rate_limiter import (
+    AdaptiveLimiter,
+    RateLimit,
+    RateLimitScheduler,
+    _SlidingWindow,
+    retry_after,
+)
+from conduit.core.model.models.modelstore import ModelStore
+from conduit.core.model.models.tokens import TokenCounter
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message.message import AssistantMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.utils.progress.verbosity import Verbosity
+
+
+# Fixtures
+# ---
+
+class RateLimitError(Exception):
+    """Shaped like the provider SDKs' 429 errors."""
+
+    status_code = 429
+
+    def __init__(self, retry_after: str = "0.01"):
+        super().__init__("rate limited")
+        self.response = NS(headers={"retry-after": retry_after})
+
+
+class SaturatingProvider:
+    """Accepts at most `capacity` concurrent calls and 429s the rest."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.rejections = 0
+        self.completed = 0
+
+    async def call(self) -> str:
+        if self.in_flight >= self.capacity:
+            self.rejections += 1
+            raise RateLimitError()
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(0.005)
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+        return "ok"
+
+
+class WordEncoding:
+    """One token per word; records each batch it encodes."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def encode_ordinary_batch(self, texts: list[str], *, num_threads: int) -> list[list[int]]:
+        self.batches.append(list(texts))
+        return [[0] * len(text.split()) for text in texts]
+
+
+class TokenizingClient:
+    """Echo client that records tokenize() calls, which batches must not make."""
+
+    def __init__(self):
+        self.tokenized: list[str] = []
+
+    async def tokenize(self, model, payload):
+        self.tokenized.append(payload)
+        return len(payload.split())
+
+    async def query(self, request):
+        return GenerationResponse(
+            message=AssistantMessage(content=f"echo: {request.messages[-1].content}"),
+            request=request,
+            metadata=ResponseMetadata(
+                duration=1.0,
+                model_slug="gpt-4o",
+                input_tokens=1,
+                output_tokens=0,
+                stop_reason="stop",
+            ),
+        )
+
+
+@pytest.fixture
+def encoding(monkeypatch) -> WordEncoding:
+    encoding = WordEncoding()
+    counter = TokenCounter(cache_size=0, loader=lambda name: encoding)
+    monkeypatch.setattr(rate_limiter, "token_counter", counter)
+    return encoding
+
+
+@pytest.fixture
+def client():
+    tokenizing = TokenizingClient()
+    with (
+        patch.object(ModelStore, "get_client", return_value=tokenizing),
+        patch(
+            "conduit.storage.db_manager.db_manager.get_pool", new_callable=AsyncMock
+        ),
+        patch(
+            "conduit.storage.odometer.odometer_registry.OdometerRegistry.flush",
+            new_callable=AsyncMock,
+        ),
+    ):
+        yield tokenizing
+
+
+# Tests
+# ---
+
+def test_sliding_window_waits_for_oldest_usage_to_expire():
+    window = _SlidingWindow(capacity=100)
+    window.record(60, now=0.0)
+    window.record(30, now=5.0)
+
+    assert window.wait_time(10, now=10.0) == 0.0
+    # 50 tokens only fit once the first 60 age out of the 60s window
+    assert window.wait_time(50, now=10.0) == 50.0
+    assert window.wait_time(50, now=61.0) == 0.0
+
+
+def test_oversized_request_is_admitted_into_an_empty_window():
+    window = _SlidingWindow(capacity=10)
+    assert window.wait_time(500, now=0.0) == 0.0
+
+
+def test_retry_after_reads_status_and_cause_chain():
+    assert retry_after(RateLimitError("2")) == 2.0
+    overloaded = RuntimeError("overloaded")
+    overloaded.status_code = 529  # type: ignore[attr-defined]
+    assert retry_after(overloaded) == 0.0
+
+    try:
+        try:
+            raise RateLimitError("0.5")
+        except RateLimitError as e:
+            raise RuntimeError("wrapped") from e
+    except RuntimeError as wrapped:
+        assert retry_after(wrapped) == 0.5
+
+    assert retry_after(ValueError("boom")) is None
+
+
+@pytest.mark.asyncio
+async def test_additive_increase_on_success():
+    limiter = AdaptiveLimiter("openai/gpt-4o", RateLimit(), initial_concurrency=4)
+    for _ in range(20):
+        await limiter.acquire()
+        await limiter.release()
+    assert limiter.concurrency > 7
+
+
+@pytest.mark.asyncio
+async def test_aimd_backs_off_to_provider_capacity_and_retries():
+    provider = SaturatingProvider(capacity=4)
+    scheduler = RateLimitScheduler(initial_concurrency=32, max_retries=20)
+
+    results = await asyncio.gather(
+        *(scheduler.submit("gpt-4o", provider.call) for _ in range(60))
+    )
+
+    limiter = scheduler.limiter("gpt-4o")
+    assert results == ["ok"] * 60
+    assert provider.rejections > 0
+    # Halved from 32 at least once; hovering near the real capacity
+    assert limiter.concurrency < 16
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rpm_budget_delays_excess_requests(monkeypatch):
+    monkeypatch.setattr("conduit.core.conduit.batch.rate_limiter.WINDOW_SECONDS", 0.2)
+    scheduler = RateLimitScheduler({"openai": RateLimit(rpm=2)})
+    loop = asyncio.get_running_loop()
+    started: list[float] = []
+
+    async def call():
+        started.append(loop.time())
+
+    await asyncio.gather(*(scheduler.submit("gpt-4o", call) for _ in range(4)))
+
+    # Third and fourth requests had to wait for the window to roll over
+    assert started[2] - started[0] >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried():
+    scheduler = RateLimitScheduler()
+    call = AsyncMock(side_effect=ValueError("bad request"))
+
+    with pytest.raises(ValueError):
+        await scheduler.submit("gpt-4o", call)
+    assert call.await_count == 1
+    assert scheduler.limiter("gpt-4o").in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_estimates_tokens_locally(client, encoding):
+    scheduler = RateLimitScheduler({"gpt-4o": RateLimit(tpm=10_000)})
+    options = ConduitOptions(
+        project_name="batch-test", console=None, verbosity=Verbosity.SILENT
+    )
+    prompts = ["one two", "three four five"]
+
+    conversations = await ConduitBatchAsync().run(
+        None,
+        prompts,
+        GenerationParams(model="gpt-4o", max_tokens=100),
+        options,
+        scheduler=scheduler,
+    )
+
+    assert [c.content for c in conversations] == ["echo: one two", "echo: three four five"]
+    assert client.tokenized == []
+    assert [sorted(batch) for batch in encoding.batches] == [sorted(prompts)]
+    tokens_window = scheduler.limiter("gpt-4o")._tokens
+    assert tokens_window._total == (2 + 100) + (3 + 100)
+
+
+@pytest.mark.asyncio
+async def test_batch_counts_tokens_once_per_window(client, encoding):
+    options = ConduitOptions(
+        project_name="batch-test", console=None, verbosity=Verbosity.SILENT
+    )
+    prompts = [f"prompt number {i}" for i in range(10)]
+
+    results = [
+        result
+        async for result in ConduitBatchAsync().run_iter(
+            None,
+            prompts,
+            GenerationParams(model="gpt-4o"),
+            options,
+            scheduler=RateLimitScheduler(),
+            window=4,
+        )
+    ]
+
+    assert len(results) == 10
+    assert client.tokenized == []
+    assert [len(batch) for batch in encoding.batches] == [4, 4, 2]
@@ -0,0 +1,267 @@
+from __future__ import annotations
+from contextlib import asynccontextmanager
+
+import pytest
+
+from conduit.domain.conversation.session import Session
+from conduit.domain.message.message import AssistantMessage, UserMessage
+from conduit.storage.repository import postgres_repository
+from conduit.storage.repository.postgres_repository import AsyncPostgresSessionRepository
+
+
+# Fixtures
+# ---
+
+class RecordingConnection:
+    def __init__(self):
+        self.executemany_rows: list[list[tuple]] = []
+        self.copied: list[list[tuple]] = []
+        self.fetched: list[str] = []
+        self.fetch_args: list[tuple] = []
+        self.rows: list[dict] = []
+        self.trigram_rows: list[dict] = []
+        # message_ids written so far, as the database would see them
+        self.stored: set[str] = set()
+        self.fail = False
+
+    async def fetch(self, query, *args):
+        self.fetched.append(query)
+        self.fetch_args.append(args)
+        if "word_similarity" in query:
+            return self.trigram_rows
+        return self.rows
+
+    async def fetchval(self, query, *args):
+        assert "conduit_messages" in query
+        if "search_vector" in query:
+            # Does any full-text match exist?
+            return bool(self.rows)
+        return len(set(args[0]) & self.stored)
+
+    async def execute(self, query, *args):
+        if self.fail and "conduit_sessions" in query:
+            raise ConnectionError("db down")
+
+    async def executemany(self, query, records):
+        self.executemany_rows.append(list(records))
+        self.stored.update(record[0] for record in records)
+
+    async def copy_records_to_table(self, table, records, columns):
+        assert table == "conduit_messages_staging"
+        self.copied.append(list(records))
+        self.stored.update(record[0] for record in records)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class RecordingPool:
+    def __init__(self):
+        self.connection = RecordingConnection()
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.connection
+
+
+@pytest.fixture
+def repo():
+    repository = AsyncPostgresSessionRepository(project_name="persistence-test")
+    pool = RecordingPool()
+
+    async def ready():
+        return pool
+
+    repository._ensure_ready = ready
+    return repository, pool.connection
+
+
+def grow(session: Session, turns: int) -> None:
+    for turn in range(turns):
+        for cls in (UserMessage, AssistantMessage):
+            message = cls(
+                content=f"turn {turn}",
+                session_id=session.session_id,
+                predecessor_id=session.leaf or None,
+            )
+            session.register(message)
+
+
+def new_session() -> Session:
+    return Session(session_id="s1", message_dict={}, leaf="")
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_each_save_writes_only_new_messages(repo):
+    repository, conn = repo
+    session = new_session()
+
+    grow(session, 3)
+    await repository.save_session(session)
+    grow(session, 1)
+    await repository.save_session(session)
+    await repository.save_session(session)
+
+    assert [len(rows) for rows in conn.executemany_rows] == [6, 2]
+    first_ids = [row[0] for row in conn.executemany_rows[0]]
+    # Parents are inserted before children
+    assert first_ids == [m.message_id for m in list(session.message_dict.values())[:6]]
+
+
+@pytest.mark.asyncio
+async def test_large_delta_is_copied_through_staging(repo, monkeypatch):
+    monkeypatch.setattr(postgres_repository, "COPY_THRESHOLD", 10)
+    repository, conn = repo
+    session = new_session()
+
+    grow(session, 10)
+    await repository.save_session(session)
+
+    assert conn.executemany_rows == []
+    assert len(conn.copied[0]) == 20
+    # Staging rows carry their topological position for the INSERT ... SELECT
+    assert [row[-1] for row in conn.copied[0]] == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_failed_save_is_retried_in_full(repo):
+    repository, conn = repo
+    session = new_session()
+    grow(session, 2)
+
+    conn.fail = True
+    with pytest.raises(ConnectionError):
+        await repository.save_session(session)
+    conn.fail = False
+    await repository.save_session(session)
+
+    assert [len(rows) for rows in conn.executemany_rows] == [4]
+
+
+@pytest.mark.asyncio
+async def test_deleted_sessions_are_forgotten(repo):
+    repository, conn = repo
+    session = new_session()
+    grow(session, 1)
+
+    await repository.save_session(session)
+    await repository.delete_session("s1")
+    await repository.save_session(session)
+
+    assert [len(rows) for rows in conn.executemany_rows] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_session_deleted_by_another_process_is_saved_in_full(repo):
+    repository, conn = repo
+    session = new_session()
+    grow(session, 2)
+    await repository.save_session(session)
+
+    # e.g. `conduit wipe` in another process: this instance's tracking is stale
+    conn.stored.clear()
+    grow(session, 1)
+    await repository.save_session(session)
+
+    assert [len(rows) for rows in conn.executemany_rows] == [4, 6]
+    assert conn.stored == set(session.message_dict)
+
+
+@pytest.mark.asyncio
+async def test_last_loads_the_leaf_path_in_one_query(repo):
+    repository, conn = repo
+    session = new_session()
+    grow(session, 2)
+    conn.rows = [
+        {
+            **dict(zip(postgres_repository.MESSAGE_COLUMNS, record)),
+            "path": [],
+            "depth": depth,
+            "root_id": "root",
+        }
+        for depth, record in enumerate(
+            repository._message_to_record(m) for m in session.message_dict.values()
+        )
+    ]
+
+    conn.stored = set(session.message_dict)
+    conversation = await repository.last
+
+    assert len(conn.fetched) == 1 and "ANY(leaf.path)" in conn.fetched[0]
+    assert [m.content for m in conversation.messages] == ["turn 0"] * 2 + ["turn 1"] * 2
+    # Loaded messages count as persisted: saving again only writes new ones
+    await repository.save_session(conversation.session)
+    assert conn.executemany_rows == []
+
+
+def hit(snippet: str) -> dict:
+    return {
+        "session_id": "s1",
+        "title": None,
+        "message_id": "m1",
+        "role": "user",
+        "created_at": 0,
+        "rank": 0.5,
+        "snippet": snippet,
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_uses_full_text_index(repo):
+    repository, conn = repo
+    conn.rows = [hit("a \x02kubernetes\x03 question")]
+
+    hits = await repository.search("kubernetes", limit=5, offset=10)
+
+    assert len(conn.fetched) == 1
+    assert "search_vector @@" in conn.fetched[0]
+    assert hits[0]["title"] == "Untitled Session"
+    assert hits[0]["snippet"] == "a \x02kubernetes\x03 question"
+
+
+@pytest.mark.asyncio
+async def test_search_falls_back_to_trigrams(repo):
+    repository, conn = repo
+    repository._trigram = True
+    conn.trigram_rows = [hit("see get_session_by_id in the repo")]
+
+    hits = await repository.search("session_by")
+
+    assert len(conn.fetched) == 2
+    assert hits[0]["snippet"] == "see get_\x02session_by\x03_id in the repo"
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_results_page_past_the_first_page(repo):
+    repository, conn = repo
+    repository._trigram = True
+    # No full-text match anywhere; page 2 of the fuzzy results
+    conn.trigram_rows = [hit("see get_session_by_id in the repo")]
+
+    hits = await repository.search("session_by", limit=5, offset=5)
+
+    assert "word_similarity" in conn.fetched[-1]
+    assert conn.fetch_args[-1][2:4] == (5, 5)
+    assert len(hits) == 1
+
+
+@pytest.mark.asyncio
+async def test_full_text_pages_do_not_switch_to_trigrams(repo):
+    repository, conn = repo
+    repository._trigram = True
+    conn.trigram_rows = [hit("fuzzy")]
+
+    # Past the end of the full-text results: an empty page, not fuzzy matches
+    async def fetch(query, *args):
+        conn.fetched.append(query)
+        return [] if args[3] else [hit("a \x02match\x03")]
+
+    conn.fetch = fetch
+    conn.rows = [hit("a \x02match\x03")]
+
+    assert await repository.search("match", limit=5, offset=5) == []
+    assert all("word_similarity" not in q for q in conn.fetched)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conduit.config import settings
+from conduit.core.model.model_async import ModelAsync
+from conduit.core.model.models.modelstore import ModelStore
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.message.message import AssistantMessage, UserMessage
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response import GenerationResponse
+from conduit.domain.result.response_metadata import ResponseMetadata
+from conduit.middleware.single_flight import SingleFlight, single_flight
+from conduit.storage.cache.memory_cache import AsyncMemoryCache
+from conduit.utils.progress.verbosity import Verbosity
+
+
+# Fixtures
+# ---
+
+class SlowClient:
+    """Provider stand-in that takes a while and counts calls."""
+
+    provider = "openai"
+
+    def __init__(self, error: Exception | None = None):
+        self.calls = 0
+        self.cancelled = 0
+        self.error = error
+
+    async def query(self, request):
+        self.calls += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return GenerationResponse(
+            message=AssistantMessage(content="answer"),
+            request=request,
+            metadata=ResponseMetadata(
+                duration=50.0,
+                model_slug="gpt-4o",
+                input_tokens=10,
+                output_tokens=5,
+                stop_reason="stop",
+            ),
+        )
+
+
+@pytest.fixture
+def telemetry():
+    registry = MagicMock()
+    with patch.object(settings, "odometer_registry", return_value=registry):
+        yield registry
+
+
+def make_request(cache=None, prompt: str = "same question") -> GenerationRequest:
+    options = ConduitOptions(
+        project_name="single-flight", console=None, verbosity=Verbosity.SILENT, cache=cache
+    )
+    return GenerationRequest(
+        messages=[UserMessage(content=prompt)],
+        params=GenerationParams(model="gpt-4o"),
+        options=options,
+    )
+
+
+async def pipe(client, request):
+    with patch.object(ModelStore, "get_client", return_value=client):
+        return await ModelAsync("gpt-4o").pipe(request)
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_provider_call(telemetry):
+    client = SlowClient()
+    cache = AsyncMemoryCache()
+
+    responses = await asyncio.gather(*(pipe(client, make_request(cache)) for _ in range(5)))
+
+    assert client.calls == 1
+    assert [r.message.content for r in responses] == ["answer"] * 5
+    assert sorted(r.metadata.cache_hit for r in responses) == [False] + [True] * 4
+    # Followers get their own copies
+    assert len({id(r.message) for r in responses}) == 5
+    # Spend is metered and cached once
+    assert telemetry.emit_token_event.call_count == 1
+    assert (await cache.cache_stats())["total_entries"] == 1
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced(telemetry):
+    client = SlowClient()
+    cache = AsyncMemoryCache()
+
+    await asyncio.gather(
+        pipe(client, make_request(cache, "one")), pipe(client, make_request(cache, "two"))
+    )
+
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_no_coalescing_without_cache(telemetry):
+    client = SlowClient()
+
+    await asyncio.gather(*(pipe(client, make_request()) for _ in range(3)))
+
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller(telemetry):
+    client = SlowClient(error=RuntimeError("provider down"))
+    cache = AsyncMemoryCache()
+
+    results = await asyncio.gather(
+        *(pipe(client, make_request(cache)) for _ in range(3)), return_exceptions=True
+    )
+
+    assert client.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_hands_cache_write_and_telemetry_to_a_follower(telemetry):
+    client = SlowClient()
+    cache = AsyncMemoryCache()
+
+    owner = asyncio.create_task(pipe(client, make_request(cache)))
+    await asyncio.sleep(0.01)
+    followers = [asyncio.create_task(pipe(client, make_request(cache))) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    owner.cancel()
+    responses = await asyncio.gather(*followers)
+
+    assert owner.cancelled()
+    assert client.calls == 1 and client.cancelled == 0
+    assert sorted(r.metadata.cache_hit for r in responses) == [False, True]
+    assert telemetry.emit_token_event.call_count == 1
+    assert (await cache.cache_stats())["total_entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_cancel_followers():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("key", call))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    # The surviving follower takes over as owner
+    assert await follower == ("done", False)
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_once_every_caller_is_gone():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    callers = [asyncio.create_task(flight.do("key", call)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert len(flight) == 0
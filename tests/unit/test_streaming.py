@@ -0,0 +1,261 @@
+from types import SimpleNamespace as NS
+from typing import Annotated
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from conduit.capabilities.tools.registry import ToolRegistry
+from conduit.config import settings
+from conduit.core.conduit.conduit_async import ConduitAsync
+from conduit.core.model.models.modelstore import ModelStore
+from conduit.core.parser.stream.accumulator import StreamAccumulator
+from conduit.core.prompt.prompt import Prompt
+from conduit.domain.config.conduit_options import ConduitOptions
+from conduit.domain.request.generation_params import GenerationParams
+from conduit.domain.request.request import GenerationRequest
+from conduit.domain.result.response_metadata import StopReason
+from conduit.domain.result.stream_events import (
+    ConversationComplete,
+    ResponseComplete,
+    TextDelta,
+    ToolCallDelta,
+    ToolResult,
+)
+from conduit.storage.cache.memory_cache import AsyncMemoryCache
+from conduit.utils.progress.verbosity import Verbosity
+
+
+# Fixtures
+# ---
+
+def text_chunk(text: str, finish_reason: str | None = None):
+    delta = NS(content=text, tool_calls=None)
+    return NS(model="gpt-test", usage=None, choices=[NS(delta=delta, finish_reason=finish_reason)])
+
+
+def tool_chunk(index: int, id=None, name=None, arguments=None, finish_reason=None):
+    tool_delta = NS(index=index, id=id, function=NS(name=name, arguments=arguments))
+    delta = NS(content=None, tool_calls=[tool_delta])
+    return NS(model="gpt-test", usage=None, choices=[NS(delta=delta, finish_reason=finish_reason)])
+
+
+def usage_chunk(prompt_tokens: int, completion_tokens: int):
+    usage = NS(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+    return NS(model="gpt-test", usage=usage, choices=[])
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+class StreamingClient:
+    provider = "openai"
+
+    def __init__(self, *streams):
+        self.streams = list(streams)
+        self.requests: list[GenerationRequest] = []
+
+    async def query(self, request):
+        self.requests.append(request)
+        return FakeStream(self.streams.pop(0))
+
+
+async def get_weather(city: Annotated[str, "City name."]) -> str:
+    """Look up the weather."""
+    return f"sunny in {city}"
+
+
+class MemoryRepository:
+    """Minimal AsyncSessionRepository that records saves."""
+
+    def __init__(self):
+        self.save_session = AsyncMock()
+
+    async def initialize(self):
+        pass
+
+    @property
+    async def last(self):
+        return None
+
+    async def get_session(self, session_id):
+        return None
+
+    async def get_conversation(self, leaf_message_id):
+        return None
+
+    async def get_message(self, message_id):
+        return None
+
+    async def list_sessions(self, limit=20):
+        return []
+
+    async def search(self, query, limit=20, offset=0):
+        return []
+
+    async def delete_session(self, session_id):
+        pass
+
+    async def wipe(self):
+        pass
+
+
+@pytest.fixture
+def telemetry():
+    registry = MagicMock()
+    with patch.object(settings, "odometer_registry", return_value=registry):
+        yield registry
+
+
+def make_options(**kwargs) -> ConduitOptions:
+    return ConduitOptions(
+        project_name="stream-test", console=None, verbosity=Verbosity.SILENT, **kwargs
+    )
+
+
+async def collect(conduit: ConduitAsync, options: ConduitOptions) -> list:
+    return [
+        event
+        async for event in conduit.stream(None, GenerationParams(model="gpt-4o"), options)
+    ]
+
+
+# Tests
+# ---
+
+@pytest.mark.asyncio
+async def test_stream_yields_deltas_then_caches_and_meters(telemetry):
+    client = StreamingClient(
+        [text_chunk("Hel"), text_chunk("lo"), text_chunk("!", "stop"), usage_chunk(5, 3)]
+    )
+    cache = AsyncMemoryCache()
+    options = make_options(cache=cache)
+
+    with patch.object(ModelStore, "get_client", return_value=client):
+        events = await collect(ConduitAsync(Prompt("hi")), options)
+
+    assert [e.text for e in events if isinstance(e, TextDelta)] == ["Hel", "lo", "!"]
+    assert isinstance(events[-2], ResponseComplete)
+    assert isinstance(events[-1], ConversationComplete)
+    assert events[-1].conversation.content == "Hello!"
+    assert client.requests[0].params.stream is True
+
+    # Telemetry and cache ran on the assembled response
+    token_event = telemetry.emit_token_event.call_args.args[0]
+    assert (token_event.input_tokens, token_event.output_tokens) == (5, 3)
+    assert (await cache.cache_stats())["total_entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_cache_hits(telemetry):
+    cache = AsyncMemoryCache()
+    options = make_options(cache=cache)
+    client = StreamingClient([text_chunk("cached answer", "stop"), usage_chunk(1, 2)])
+
+    with patch.object(ModelStore, "get_client", return_value=client):
+        await collect(ConduitAsync(Prompt("hi")), options)
+        events = await collect(ConduitAsync(Prompt("hi")), options)
+
+    assert len(client.requests) == 1
+    assert [e.text for e in events if isinstance(e, TextDelta)] == ["cached answer"]
+    complete = next(e for e in events if isinstance(e, ResponseComplete))
+    assert complete.response.metadata.cache_hit is True
+
+
+@pytest.mark.asyncio
+async def test_stream_assembles_tool_calls_and_runs_tools(telemetry):
+    registry = ToolRegistry()
+    registry.register_function(get_weather)
+    client = StreamingClient(
+        [
+            tool_chunk(0, id="call_1", name="get_weather", arguments='{"ci'),
+            tool_chunk(0, arguments='ty": "Paris"}', finish_reason="tool_calls"),
+            usage_chunk(10, 4),
+        ],
+        [text_chunk("It is sunny.", "stop"), usage_chunk(20, 4)],
+    )
+
+    with patch.object(ModelStore, "get_client", return_value=client):
+        events = await collect(ConduitAsync(Prompt("weather?")), make_options(tool_registry=registry))
+
+    tool_deltas = [e for e in events if isinstance(e, ToolCallDelta)]
+    assert tool_deltas[0].name == "get_weather"
+    first = next(e for e in events if isinstance(e, ResponseComplete))
+    tool_call = first.response.message.tool_calls[0]
+    assert (tool_call.id, tool_call.arguments) == ("call_1", {"city": "Paris"})
+    assert first.response.metadata.stop_reason == StopReason.TOOL_CALLS
+
+    tool_result = next(e for e in events if isinstance(e, ToolResult))
+    assert tool_result.message.content == "sunny in Paris"
+    assert events[-1].conversation.content == "It is sunny."
+    assert telemetry.emit_token_event.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_persists_on_completion(telemetry):
+    repository = MemoryRepository()
+    client = StreamingClient([text_chunk("ok", "stop"), usage_chunk(1, 1)])
+
+    with patch.object(ModelStore, "get_client", return_value=client):
+        events = await collect(ConduitAsync(Prompt("hi")), make_options(repository=repository))
+
+    repository.save_session.assert_awaited_once()
+    assert repository.save_session.await_args.args[0] is events[-1].conversation.session
+
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_is_not_cached(telemetry):
+    cache = AsyncMemoryCache()
+    stream_chunks = [text_chunk("partial"), text_chunk(" answer", "stop")]
+    client = StreamingClient(stream_chunks)
+
+    with patch.object(ModelStore, "get_client", return_value=client):
+        stream = ConduitAsync(Prompt("hi")).stream(
+            None, GenerationParams(model="gpt-4o"), make_options(cache=cache)
+        )
+        async for event in stream:
+            break
+        await stream.aclose()
+
+    assert (await cache.cache_stats())["total_entries"] == 0
+    telemetry.emit_token_event.assert_not_called()
+
+
+def test_accumulator_handles_anthropic_events():
+    events = [
+        NS(type="message_start", message=NS(model="claude-test", usage=NS(input_tokens=12))),
+        NS(type="content_block_start", index=0, content_block=NS(type="text")),
+        NS(type="content_block_delta", index=0, delta=NS(type="text_delta", text="Checking.")),
+        NS(type="content_block_start", index=1, content_block=NS(type="tool_use", id="tu_1", name="get_weather")),
+        NS(type="content_block_delta", index=1, delta=NS(type="input_json_delta", partial_json='{"city": ')),
+        NS(type="content_block_delta", index=1, delta=NS(type="input_json_delta", partial_json='"Oslo"}')),
+        NS(type="message_delta", delta=NS(stop_reason="tool_use"), usage=NS(output_tokens=7)),
+        NS(type="message_stop"),
+    ]
+    accumulator = StreamAccumulator(provider="anthropic")
+    deltas = [d for event in events for d in accumulator.feed(event)]
+    request = GenerationRequest(
+        messages=[], params=GenerationParams(model="claude-test"), options=make_options()
+    )
+    response = accumulator.to_response(request, duration=1.0)
+
+    assert [type(d).__name__ for d in deltas] == [
+        "TextDelta", "ToolCallDelta", "ToolCallDelta", "ToolCallDelta"
+    ]
+    assert response.message.content == "Checking."
+    assert response.message.tool_calls[0].arguments == {"city": "Oslo"}
+    assert response.message.tool_calls[0].id == "tu_1"
+    assert (response.metadata.input_tokens, response.metadata.output_tokens) == (12, 7)
+    assert response.metadata.stop_reason == StopReason.TOOL_CALLS
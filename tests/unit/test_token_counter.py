@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+
+from conduit.core.model.models import tokens
+from conduit.core.model.models.tokens import OpenAITokenizer, TokenCounter
+
+
+# Fixtures
+# ---
+
+class FakeEncoding:
+    """Whitespace 'tokenizer' that records how it was called."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.encoded: list[str] = []
+        self.batches: list[tuple[int, int]] = []
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return [0] * len(text.split())
+
+    def encode(self, text: str) -> list[int]:
+        return self.encode_ordinary(text)
+
+    def encode_ordinary_batch(self, texts: list[str], *, num_threads: int) -> list[list[int]]:
+        self.batches.append((len(texts), num_threads))
+        return [[0] * len(text.split()) for text in texts]
+
+
+@pytest.fixture
+def loads() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def counter(loads) -> TokenCounter:
+    def loader(name: str) -> FakeEncoding:
+        loads.append(name)
+        return FakeEncoding(name)
+
+    return TokenCounter(cache_size=4, num_threads=3, loader=loader)
+
+
+# Tests
+# ---
+
+def test_encoders_load_once_per_family(counter, loads):
+    counter.count("a b", model="gpt-4o")
+    counter.count("c", model="gpt-4o-mini")
+    counter.count("d", model="gpt-4")
+    counter.count("e", model="not-an-openai-model")
+
+    # gpt-4o* share o200k_base; unknown models use the fallback
+    assert loads == ["o200k_base", "cl100k_base"]
+
+
+def test_counts_are_cached_by_text(counter):
+    assert counter.count("one two three", encoding="e") == 3
+    assert counter.count("one two three", encoding="e") == 3
+
+    assert counter.encoding("e").encoded == ["one two three"]
+
+
+def test_cache_is_per_encoding_and_bounded(counter):
+    counter.count("x", encoding="a")
+    counter.count("x", encoding="b")
+    for n in range(10):
+        counter.count(f"text {n}", encoding="a")
+
+    assert counter.encoding("b").encoded == ["x"]
+    assert len(counter._counts) == 4
+
+
+def test_count_batch_encodes_only_new_distinct_texts_in_parallel(counter):
+    counter.count("cached text", encoding="e")
+    texts = ["cached text", "a", "b c", "a", "d e f"]
+
+    counts = counter.count_batch(texts, encoding="e")
+
+    assert counts == [2, 1, 2, 1, 3]
+    assert counter.encoding("e").batches == [(3, 3)]
+    # Everything is now cached
+    counter.count_batch(texts, encoding="e")
+    assert counter.encoding("e").batches == [(3, 3)]
+
+
+def test_legacy_tokenizer_uses_shared_encoder(monkeypatch, counter, loads):
+    monkeypatch.setattr(tokens, "token_counter", counter)
+
+    first, second = OpenAITokenizer(), OpenAITokenizer()
+
+    assert first.count_tokens("hello there") == 2
+    assert first.tokenizer is second.tokenizer
+    assert loads == ["cl100k_base"]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+import math
+import time
+
+import numpy as np
+import pytest
+
+from conduit.utils.vector import (
+    centroid,
+    closest_to_centroids,
+    cosine_similarity,
+    mmr,
+    normalize,
+    top_k,
+)
+
+# Large transcript: 10k chunks of a 768-dim (mpnet-sized) embedding
+BENCH_ROWS = 10_000
+BENCH_DIMS = 768
+BENCH_BUDGET_SECONDS = 0.5
+
+
+# Fixtures
+# ---
+
+def reference_cosine(a: list[float], b: list[float]) -> float:
+    """The pure-Python loop the summarizers used before."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    return dot / (norm_a * norm_b + 1e-8)
+
+
+@pytest.fixture
+def embeddings() -> np.ndarray:
+    return np.random.default_rng(7).normal(size=(200, 32)).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def large() -> np.ndarray:
+    return np.random.default_rng(0).normal(size=(BENCH_ROWS, BENCH_DIMS)).astype(np.float32)
+
+
+def best_of(fn, runs: int = 3) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+# Tests
+# ---
+
+def test_cosine_matches_reference(embeddings):
+    center = centroid(embeddings)
+    scores = cosine_similarity(embeddings, center)
+
+    expected = [reference_cosine(row.tolist(), center.tolist()) for row in embeddings]
+    np.testing.assert_allclose(scores, expected, atol=1e-5)
+    assert cosine_similarity(embeddings[:3], embeddings[:5]).shape == (3, 5)
+
+
+def test_normalize_leaves_zero_vectors_alone():
+    rows = normalize([[3.0, 4.0], [0.0, 0.0]])
+
+    np.testing.assert_allclose(rows, [[0.6, 0.8], [0.0, 0.0]])
+
+
+def test_top_k_matches_full_sort(embeddings):
+    scores = cosine_similarity(embeddings, embeddings[0])
+
+    assert top_k(scores, 10).tolist() == np.argsort(-scores)[:10].tolist()
+    assert len(top_k(scores, 1_000)) == len(scores)
+    assert len(top_k(scores, 0)) == 0
+
+
+def test_mmr_with_lambda_one_is_top_k(embeddings):
+    query = centroid(embeddings)
+
+    assert mmr(embeddings, query, 10, lambda_=1.0).tolist() == top_k(
+        cosine_similarity(embeddings, query), 10
+    ).tolist()
+
+
+def test_mmr_skips_near_duplicates():
+    base = np.eye(4, dtype=np.float32)
+    # Row 1 nearly duplicates row 0; both are more relevant than rows 2 and 3
+    rows = np.vstack([base[0], base[0] + 0.05 * base[3], base[1], base[2]])
+    query = np.array([1.0, 0.5, 0.1, 0.0], dtype=np.float32)
+
+    assert mmr(rows, query, 2, lambda_=1.0).tolist() == [0, 1]
+    assert mmr(rows, query, 2, lambda_=0.5).tolist() == [0, 2]
+
+
+def test_closest_to_centroids_matches_reference(embeddings):
+    labels = np.arange(len(embeddings)) % 7
+    labels[labels == 3] = 2  # cluster 3 is empty
+    centroids = np.stack(
+        [embeddings[labels == c].mean(axis=0) if (labels == c).any() else np.zeros(32) for c in range(7)]
+    )
+
+    expected = []
+    for cluster in range(7):
+        members = [i for i, label in enumerate(labels) if label == cluster]
+        if members:
+            center = centroids[cluster].tolist()
+            expected.append(
+                max(members, key=lambda i: reference_cosine(embeddings[i].tolist(), center))
+            )
+
+    assert closest_to_centroids(embeddings, centroids, labels).tolist() == expected
+
+
+def test_select_chunks_keeps_document_order(embeddings):
+    pytest.importorskip("semchunk")
+    from conduit.strategies.summarize.summarizers.extractive_pre_filter import select_chunks
+
+    selected = select_chunks(embeddings, 20)
+
+    assert selected == sorted(selected) and len(selected) == 20
+    assert select_chunks(embeddings, 20, mmr_lambda=1.0) == selected
+    assert len(set(select_chunks(embeddings, 20, mmr_lambda=0.3))) == 20
+
+
+@pytest.mark.benchmark
+def test_selection_at_transcript_scale_takes_milliseconds(large):
+    keep_n = BENCH_ROWS * 3 // 10
+    labels = np.arange(BENCH_ROWS) % 10
+    centroids = np.stack([large[labels == c].mean(axis=0) for c in range(10)])
+
+    # ExtractivePreFilterSummarizer: centrality scores + top-k
+    assert best_of(lambda: top_k(cosine_similarity(large, centroid(large)), keep_n)) < BENCH_BUDGET_SECONDS
+    # ClusterSelectSummarizer: best member per cluster
+    assert best_of(lambda: closest_to_centroids(large, centroids, labels)) < BENCH_BUDGET_SECONDS
+    # Diversity-aware selection
+    assert best_of(lambda: mmr(large, centroid(large), 10, lambda_=0.7)) < BENCH_BUDGET_SECONDS